@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared verse cleaner against the previous implementation
+Runs both over every verse in bible.db and reports verses/sec
+
+Usage:
+    python3 benchmark_verse_cleaner.py [--db ../assets/bible.db] [--repeat 3]
+"""
+
+import argparse
+import re
+import sqlite3
+import time
+
+from verse_cleaner import clean_verse_text, clean_verse_texts
+
+
+def legacy_clean_verse_text(text):
+    """Previous clean_bible_verses.clean_verse_text: ten sequential re.sub passes"""
+    if not text:
+        return ''
+
+    text = re.sub(r'\\\+w\s*', '', text)
+    text = re.sub(r'\\\+w\*', '', text)
+    text = re.sub(r'\+w\s*', '', text)
+    text = re.sub(r'\+w\*', '', text)
+    text = re.sub(r'\|strong="[HG]\d+"', '', text)
+    text = re.sub(r'\s*\+\s*\d+:\d+\s+[^+]*(?=\+|$)', '', text)
+    text = re.sub(r'\*', '', text)
+    text = re.sub(r'\+', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def time_run(label, fn, texts, repeat):
+    """Run fn over texts `repeat` times and print the best verses/sec"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(texts)
+        best = min(best, time.perf_counter() - start)
+
+    rate = len(texts) / max(best, 1e-9)
+    print(f"  {label:<28} {best:8.3f}s  {rate:12,.0f} verses/sec")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark verse cleaning over bible.db")
+    parser.add_argument('--db', default="../assets/bible.db", help="Path to bible.db")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per implementation (best is kept)")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.db)
+    texts = [row[0] for row in conn.execute("SELECT text FROM verses ORDER BY id")]
+    conn.close()
+
+    print("Verse Cleaner Benchmark")
+    print("=" * 60)
+    print(f"Database: {args.db}")
+    print(f"Verses: {len(texts)}\n")
+
+    legacy = time_run("legacy (10 x re.sub)",
+                      lambda ts: [legacy_clean_verse_text(t) for t in ts], texts, args.repeat)
+    single = time_run("single pass (per verse)",
+                      lambda ts: [clean_verse_text(t) for t in ts], texts, args.repeat)
+    batch = time_run("single pass (batch API)", clean_verse_texts, texts, args.repeat)
+
+    print(f"\n  Speedup: {single / legacy:.2f}x per verse, {batch / legacy:.2f}x batch")
+
+    differing = sum(1 for t in texts if legacy_clean_verse_text(t) != clean_verse_text(t))
+    print(f"  Outputs differing from legacy: {differing}/{len(texts)}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
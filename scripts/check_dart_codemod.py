@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Regression check for dart_codemod.py
+Exits non-zero if a check fails
+
+Each case runs every rule over a small Dart snippet and compares the
+rewritten source with the expected output: sizes are rewritten inside
+build methods, getters and context callbacks, while State field
+initializers (instance or static const) are left alone.
+
+Usage:
+    python3 check_dart_codemod.py
+"""
+
+import sys
+
+from dart_codemod import LIB_DIR, RULES, rewrite_source
+
+IMPORT = "import '../utils/responsive_utils.dart';"
+
+CASES = [
+    (
+        'State field initializers are left alone',
+        """import 'package:flutter/material.dart';
+
+class _HomeState extends State<Home> {
+  final _title = const TextStyle(fontSize: 18);
+  static const _body = TextStyle(fontSize: 14);
+}
+""",
+        """import 'package:flutter/material.dart';
+
+class _HomeState extends State<Home> {
+  final _title = const TextStyle(fontSize: 18);
+  static const _body = TextStyle(fontSize: 14);
+}
+""",
+    ),
+    (
+        'State methods and getters are rewritten',
+        """import 'package:flutter/material.dart';
+
+class _HomeState extends State<Home> {
+  final _title = const TextStyle(fontSize: 18);
+
+  TextStyle get _caption => const TextStyle(fontSize: 12);
+
+  @override
+  Widget build(BuildContext context) {
+    return const Icon(Icons.home, size: 24);
+  }
+}
+""",
+        f"""import 'package:flutter/material.dart';
+{IMPORT}
+
+class _HomeState extends State<Home> {{
+  final _title = const TextStyle(fontSize: 18);
+
+  TextStyle get _caption => TextStyle(fontSize: ResponsiveUtils.fontSize(context, 12, minSize: 10, maxSize: 14));
+
+  @override
+  Widget build(BuildContext context) {{
+    return Icon(Icons.home, size: ResponsiveUtils.iconSize(context, 24));
+  }}
+}}
+""",
+    ),
+    (
+        'const locals in a build method become final',
+        """import 'package:flutter/material.dart';
+
+Widget card(BuildContext context) {
+  const style = TextStyle(fontSize: 16);
+  return Text('x', style: style);
+}
+""",
+        f"""import 'package:flutter/material.dart';
+{IMPORT}
+
+Widget card(BuildContext context) {{
+  final style = TextStyle(fontSize: ResponsiveUtils.fontSize(context, 16, minSize: 14, maxSize: 18));
+  return Text('x', style: style);
+}}
+""",
+    ),
+]
+
+
+def main():
+    path = LIB_DIR / "screens" / "check.dart"
+    failures = 0
+    for name, source, expected in CASES:
+        updated, _, _ = rewrite_source(source, path, list(RULES))
+        if updated != expected:
+            failures += 1
+            print(f"❌ {name}\n--- got ---\n{updated}--- expected ---\n{expected}")
+
+    if failures:
+        print(f"❌ {failures} of {len(CASES)} codemod checks failed")
+        sys.exit(1)
+    print(f"✅ {len(CASES)} codemod checks passed")
+
+
+if __name__ == '__main__':
+    main()
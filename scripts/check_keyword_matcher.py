@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Regression check for keyword_matcher.py
+Exits non-zero if a check fails
+
+1. Short keywords must not reach longer unrelated words through suffix
+   stripping ('go' / 'God', 'war' / 'warn' / 'ward', 'no' / 'Nod',
+   'new' / 'news').
+2. Inflected forms must still meet their keyword ('forgiveness',
+   'depressed', 'burdens', 'loving').
+3. Phrases match as consecutive words only.
+
+Usage:
+    python3 check_keyword_matcher.py
+"""
+
+import sys
+
+from keyword_matcher import KeywordMatcher
+
+# (keyword, text, should match)
+CASES = [
+    ('go', 'And God said, Let there be light', False),
+    ('go', 'Go ye therefore, and teach all nations', True),
+    ('war', 'I will warn the wicked', False),
+    ('war', 'He kept the ward of the house', False),
+    ('war', 'Nation shall not learn war any more', True),
+    ('war', 'There were wars and rumours of wars', True),
+    ('no', 'He dwelt in the land of Nod', False),
+    ('no', 'There is no fear in love', True),
+    ('new', 'Good news from a far country', False),
+    ('new', 'Behold, I make all things new', True),
+    ('forgive', 'In him we have forgiveness of sins', True),
+    ('forgive', 'Thy sins are forgiven thee', True),
+    ('depress', 'My soul is depressed within me', True),
+    ('burden', 'Bear ye one another\'s burdens', True),
+    ('love', 'Be kindly affectioned, loving one another', True),
+    ('mercy', 'His tender mercies are over all his works', True),
+    ('perfect love', 'Perfect love casteth out fear', True),
+    ('perfect love', 'Love is made perfect', False),
+    ('fear not', 'Fear not, for I am with thee', True),
+]
+
+
+def main():
+    failures = 0
+    for keyword, text, expected in CASES:
+        hit = bool(KeywordMatcher({'check': [keyword]}).count_keywords(text))
+        if hit != expected:
+            failures += 1
+            verb = 'missed' if expected else 'falsely matched'
+            print(f"❌ '{keyword}' {verb}: {text}")
+
+    if failures:
+        print(f"❌ {failures} of {len(CASES)} keyword checks failed")
+        sys.exit(1)
+    print(f"✅ {len(CASES)} keyword checks passed")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,64 +3,48 @@
 Clean Bible Verses Script
 Removes Strong's numbers and footnotes from WEB Bible database
 Creates clean_text column for training data
+
+create_web_bible_db.py already fills clean_text while it ingests verses,
+so this script is incremental by default: it only cleans rows whose
+clean_text is NULL or whose text no longer matches the stored text_hash.
+Pass --all to re-clean every verse.
+
+The cleaning itself lives in verse_cleaner.py. Here it runs on the stored
+text, where footnote boundaries are inferred; ingestion cleans the raw USFM.
 """
 
+import argparse
+import hashlib
 import sqlite3
-import re
 import sys
 
-def clean_verse_text(text):
-    """
-    Remove Strong's numbers, footnotes, and markup from verse text
-
-    Examples:
-    Input: '\\+w For|strong="G1063"\\+w* God'
-    Output: 'For God'
-    """
-    if not text:
-        return ''
-
-    # Remove all \+w markers (opening and closing)
-    text = re.sub(r'\\\+w\s*', '', text)
-    text = re.sub(r'\\\+w\*', '', text)
-
-    # Remove remaining +w markers without backslash
-    text = re.sub(r'\+w\s*', '', text)
-    text = re.sub(r'\+w\*', '', text)
-
-    # Remove Strong's numbers
-    text = re.sub(r'\|strong="[HG]\d+"', '', text)
-
-    # Remove footnotes: + N:NN text
-    text = re.sub(r'\s*\+\s*\d+:\d+\s+[^+]*(?=\+|$)', '', text)
-
-    # Remove standalone asterisks and pluses
-    text = re.sub(r'\*', '', text)
-    text = re.sub(r'\+', '', text)
+from verse_cleaner import clean_verse_text
 
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
+# Rows per executemany() call
+BATCH_SIZE = 5000
 
-    return text
+def text_hash(text):
+    """Hash of the source text a clean_text value was derived from"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
 
 def add_clean_text_column(db_path):
-    """Add clean_text column to verses table"""
+    """Add clean_text and text_hash columns to verses table"""
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
     try:
-        # Check if column already exists
+        # Check if columns already exist
         cursor.execute("PRAGMA table_info(verses)")
         columns = [row[1] for row in cursor.fetchall()]
 
-        if 'clean_text' not in columns:
-            print("Adding clean_text column...")
-            cursor.execute("ALTER TABLE verses ADD COLUMN clean_text TEXT")
-            conn.commit()
-            print("✓ Column added")
-        else:
-            print("clean_text column already exists")
+        for column in ('clean_text', 'text_hash'):
+            if column not in columns:
+                print(f"Adding {column} column...")
+                cursor.execute(f"ALTER TABLE verses ADD COLUMN {column} TEXT")
+                conn.commit()
+                print("✓ Column added")
+            else:
+                print(f"{column} column already exists")
 
         return True
     except Exception as e:
@@ -69,34 +53,47 @@ def add_clean_text_column(db_path):
     finally:
         conn.close()
 
-def clean_all_verses(db_path):
-    """Clean all verses in the database"""
+def clean_all_verses(db_path, clean_all=False):
+    """
+    Clean verses whose clean_text is missing or stale (all verses if clean_all)
+    """
     conn = sqlite3.connect(db_path)
+    conn.create_function('text_hash', 1, text_hash, deterministic=True)
     cursor = conn.cursor()
 
     try:
-        # Get all verses
-        print("Fetching verses...")
-        cursor.execute("SELECT id, text FROM verses")
+        if clean_all:
+            print("Fetching all verses...")
+            cursor.execute("SELECT id, text FROM verses")
+        else:
+            print("Fetching verses with missing or stale clean_text...")
+            cursor.execute("""
+                SELECT id, text FROM verses
+                WHERE clean_text IS NULL
+                   OR text_hash IS NULL
+                   OR text_hash != text_hash(text)
+            """)
         verses = cursor.fetchall()
 
-        print(f"Cleaning {len(verses)} verses...")
-        cleaned_count = 0
+        if not verses:
+            print("✓ clean_text is up to date")
+            return True
 
-        for verse_id, text in verses:
-            clean_text = clean_verse_text(text)
-            cursor.execute(
-                "UPDATE verses SET clean_text = ? WHERE id = ?",
-                (clean_text, verse_id)
+        print(f"Cleaning {len(verses)} verses...")
+        updates = [
+            (clean_verse_text(text), text_hash(text), verse_id)
+            for verse_id, text in verses
+        ]
+
+        for start in range(0, len(updates), BATCH_SIZE):
+            cursor.executemany(
+                "UPDATE verses SET clean_text = ?, text_hash = ? WHERE id = ?",
+                updates[start:start + BATCH_SIZE]
             )
-            cleaned_count += 1
-
-            if cleaned_count % 1000 == 0:
-                print(f"  Cleaned {cleaned_count}/{len(verses)}...")
-                conn.commit()
+            print(f"  Cleaned {min(start + BATCH_SIZE, len(updates))}/{len(updates)}...")
 
         conn.commit()
-        print(f"✓ Cleaned {cleaned_count} verses")
+        print(f"✓ Cleaned {len(updates)} verses")
 
         return True
     except Exception as e:
@@ -142,7 +139,12 @@ def verify_cleaning(db_path):
     print("\n" + "="*60)
 
 def main():
-    db_path = "../assets/bible.db"
+    parser = argparse.ArgumentParser(description="Fill the clean_text column of bible.db")
+    parser.add_argument('--db', default="../assets/bible.db", help="Path to bible.db")
+    parser.add_argument('--all', action='store_true',
+                        help="Re-clean every verse instead of only missing/stale rows")
+    args = parser.parse_args()
+    db_path = args.db
 
     print("WEB Bible Verse Cleaner")
     print("="*60)
@@ -153,8 +155,8 @@ def main():
         print("\n✗ Failed to add column. Exiting.")
         sys.exit(1)
 
-    # Step 2: Clean all verses
-    if not clean_all_verses(db_path):
+    # Step 2: Clean missing/stale verses
+    if not clean_all_verses(db_path, clean_all=args.all):
         print("\n✗ Failed to clean verses. Exiting.")
         sys.exit(1)
 
@@ -2,11 +2,29 @@
 """
 Convert pastoral guidance text files to JSONL training format.
 Reads structured pastoral guidance and generates training examples.
+
+Files are parsed in a process pool and streamed, in file-name order, to
+one writer that appends each example to all_pastoral_guidance.jsonl and
+to its open <theme>.jsonl handle, so output is written in a single pass.
+
+Conversion is incremental: .conversion_manifest.json in the output
+directory records each source file's hash and the byte ranges of its
+examples in the combined and theme files. A rerun parses only changed
+files, splices the unchanged ranges from the previous output, and
+rewrites only the theme files that changed. --full reconverts everything.
+
+Usage:
+    python3 convert_pastoral_guidance.py [--source DIR] [--output DIR] [--workers N] [--full]
 """
 
+import argparse
+import hashlib
 import json
 import re
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import List, Dict, Tuple
 
@@ -201,20 +219,260 @@ USER_INPUTS = {
 }
 
 
+# Bump when extraction output changes (extractors, USER_INPUTS, THEME_MAP)
+# so the next run reconverts every file instead of reusing old output
+EXTRACTOR_VERSION = 2
+MANIFEST_NAME = ".conversion_manifest.json"
+COMBINED_NAME = "all_pastoral_guidance.jsonl"
+
+# Extraction patterns, compiled once at import. Every pattern is applied
+# to a single line or a bounded slice, so parsing is linear in file size.
+NUMBERED_HEADER_RE = re.compile(r'\s*(\d+)\.\s*(\S.*)')
+ADVICE_HEADER_RE = re.compile(r'\s*(\d+)\)\s*(\S.*)')
+HEADING_TITLE_RE = re.compile(r'\s*\d+\.\s*(\S.*)')
+
+# Heading markers are matched as whole emoji, with or without the
+# variation selector, never as a lone U+FE0F split off another emoji
+HEADING_EMOJI = frozenset('🕰✝🌍📖💡❤🤝🙏🌅')
+VARIATION_SELECTOR = '\ufe0f'
+
+# Scripture references are taken from the start of a references block
+SCRIPTURE_SEARCH_CHARS = 512
+
+ADVICE_SCRIPTURE_RE = re.compile(r'([A-Za-z0-9 ]+\s+\d+:\d+(?:-\d+)?)')
+HEADING_SCRIPTURE_RE = re.compile(r'"([^"]+)"\s*—\s*([A-Za-z0-9 :]+)')
+BULLET_SCRIPTURE_RE = re.compile(r'\(([A-Za-z0-9 :;–\-]+\d+:\d+[–\-\d]*)\)')
+
+# Key actionable sermon phrases, scanned as one alternation
+SERMON_PHRASE_RE = re.compile(
+    r"""
+      you\ can\ [^.]+\.
+    | don't\ [^.]+\.
+    | stop\ [^.]+\.
+    | start\ [^.]+\.
+    | increase\ your\ [^.]+\.
+    | pray\ (?:for\ |asking\ )?[^.]+\.
+    | [A-Z][^.]+God[^.]+\.
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+SERMON_SKIP_WORDS = ('said', 'scripture says', 'the bible', 'verse')
+
+# Format detection looks only at the start of a file: the label lines
+# that distinguish the structured formats appear in the first entry
+SNIFF_CHARS = 8192
+FORMAT_SNIFF_RE = re.compile(
+    r'^(?:(?P<numbered>Scripture Reference:)|(?P<heading>Bible References:\s*$)|(?P<advice>(?i:bible):))',
+    re.MULTILINE
+)
+
+
+def _heading_rest(line: str):
+    """Text after a leading heading emoji, or None if the line has none"""
+    line = line.lstrip()
+    if line[:1] not in HEADING_EMOJI:
+        return None
+    rest = line[1:]
+    if rest.startswith(VARIATION_SELECTOR):
+        rest = rest[1:]
+    return rest
+
+
+def _split_scripture_reference(text: str):
+    """
+    Split '"verse text" — Reference' into (verse text, reference)
+    Returns None if there is no dash-separated reference
+    """
+    text = text.lstrip()
+    if text.startswith('"'):
+        text = text[1:]
+
+    end = len(text)
+    for delimiter in ('"', '—'):
+        index = text.find(delimiter)
+        if index != -1:
+            end = min(end, index)
+    verse_text, rest = text[:end], text[end:]
+    if rest.startswith('"'):
+        rest = rest[1:]
+    rest = rest.lstrip()
+
+    if not verse_text or not rest.startswith('—'):
+        return None
+    reference = rest[1:].lstrip()
+    return (verse_text, reference) if reference else None
+
+
+def iter_numbered_points(content: str):
+    """
+    Line parser for the numbered format:
+
+        1. Title
+        "Quote (may span lines)"
+        Advice: text
+        continued advice text
+        Scripture Reference: "verse text" — Book 1:2
+
+    Yields (num, title, quote, advice, verse_text, reference). A header
+    line always starts a new entry and a line that does not fit drops the
+    current one, so every line is looked at once.
+    """
+    state = None
+    for line in content.split('\n'):
+        header = NUMBERED_HEADER_RE.match(line)
+        if header:
+            num, title = header.groups()
+            state, quote, advice = 'quote', [], []
+            continue
+
+        if state == 'quote':
+            if not quote:
+                if not line.startswith('"'):
+                    state = None
+                    continue
+                line = line[1:]
+            if '"' in line[:-1]:
+                state = None
+            elif line.endswith('"'):
+                quote.append(line[:-1])
+                state = 'advice_label' if '\n'.join(quote) else None
+            else:
+                quote.append(line)
+
+        elif state == 'advice_label':
+            if line.startswith('Advice:'):
+                rest = line[len('Advice:'):].lstrip()
+                advice = [rest] if rest else []
+                state = 'advice'
+            else:
+                state = None
+
+        elif state == 'advice':
+            if not advice:
+                if line.strip():
+                    advice.append(line.lstrip())
+            elif line.startswith('Scripture Reference:'):
+                scripture = _split_scripture_reference(line[len('Scripture Reference:'):])
+                if scripture:
+                    yield (num, title, '\n'.join(quote), '\n'.join(advice)) + scripture
+                state = None
+            elif line.startswith('Scripture') or not line:
+                state = None
+            else:
+                advice.append(line)
+
+
+def iter_advice_points(content: str):
+    """
+    Line parser for the advice format (labels are case-insensitive):
+
+        1) Title
+        advice: text
+        Bible: references, which may continue
+        on following lines until a blank line or the next entry
+
+    Yields (num, title, advice, bible_refs).
+    """
+    state = None
+    entry = None
+    for line in content.split('\n'):
+        header = ADVICE_HEADER_RE.match(line)
+        if header:
+            if state == 'refs' and refs:
+                yield entry + ('\n'.join(refs),)
+            entry, state = header.groups(), 'advice_label'
+            continue
+
+        if state == 'advice_label':
+            if line[:len('advice:')].lower() == 'advice:':
+                rest = line[len('advice:'):].lstrip()
+                advice = [rest] if rest else []
+                state = 'advice'
+            else:
+                state = None
+
+        elif state == 'advice':
+            if not advice:
+                if line.strip():
+                    advice.append(line.lstrip())
+            elif line[:len('bible:')].lower() == 'bible:':
+                rest = line[len('bible:'):].lstrip()
+                refs = [rest] if rest else []
+                entry = entry + ('\n'.join(advice),)
+                state = 'refs'
+            elif not line:
+                state = None
+            else:
+                advice.append(line)
+
+        elif state == 'refs':
+            if refs and not line:
+                yield entry + ('\n'.join(refs),)
+                state = None
+            elif refs or line.strip():
+                refs.append(line if refs else line.lstrip())
+
+    if state == 'refs' and refs:
+        yield entry + ('\n'.join(refs),)
+
+
+def iter_heading_points(content: str):
+    """
+    Line parser for the heading format:
+
+        🕰️ 1. Title
+        Advice:
+        text
+        Bible References:
+        "verse" — Book 1:2
+        (until a blank line or the next heading)
+
+    Yields (title, advice, bible_refs).
+    """
+    state = None
+    for line in content.split('\n'):
+        rest = _heading_rest(line)
+        if rest is not None:
+            if state == 'refs' and refs:
+                yield title, '\n'.join(advice), '\n'.join(refs)
+            heading = HEADING_TITLE_RE.match(rest)
+            state = 'advice_label' if heading else None
+            if heading:
+                title = heading.group(1)
+            continue
+
+        if state == 'advice_label':
+            state = 'advice' if line == 'Advice:' else None
+            advice = []
+
+        elif state == 'advice':
+            if not line or (advice and line.startswith('Bible References:') and line != 'Bible References:'):
+                state = None
+            elif advice and line == 'Bible References:':
+                state, refs = 'refs', []
+            else:
+                advice.append(line)
+
+        elif state == 'refs':
+            if not line:
+                if refs:
+                    yield title, '\n'.join(advice), '\n'.join(refs)
+                state = None
+            else:
+                refs.append(line)
+
+    if state == 'refs' and refs:
+        yield title, '\n'.join(advice), '\n'.join(refs)
+
+
 def extract_numbered_points(content: str, theme: str) -> List[Dict[str, str]]:
     """Extract numbered points from structured pastoral guidance."""
     examples = []
 
-    # Pattern: number. Title\n"quote"\nAdvice: text\nScripture Reference: text
-    pattern = r'(\d+)\.\s*([^\n]+)\n"([^"]+)"\nAdvice:\s*([^\n]+(?:\n(?!Scripture|^\d+\.)[^\n]+)*)\nScripture Reference:\s*"?([^"—\n]+)"?\s*—\s*([^\n]+)'
-
-    matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL)
-
     inputs = USER_INPUTS.get(theme, [])
     input_idx = 0
 
-    for match in matches:
-        num, title, quote, advice, verse_text, reference = match.groups()
+    for num, title, quote, advice, verse_text, reference in iter_numbered_points(content):
 
         # Clean up text
         advice = advice.strip().replace('\n', ' ')
@@ -245,16 +503,10 @@ def extract_advice_format(content: str, theme: str) -> List[Dict[str, str]]:
     """Extract advice-Bible format (sink.txt, wt.txt style)."""
     examples = []
 
-    # Pattern: number) title\nadvice: text\nBible: references
-    pattern = r'(\d+)\)\s*([^\n]+)\nadvice:\s*([^\n]+(?:\n(?!Bible:|^\d+\))[^\n]+)*)\nBible:\s*([^\n]+(?:\n(?!^\d+\))[^\n]+)*)'
-
-    matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
-
     inputs = USER_INPUTS.get(theme, [])
     input_idx = 0
 
-    for match in matches:
-        num, title, advice, bible_refs = match.groups()
+    for num, title, advice, bible_refs in iter_advice_points(content):
 
         # Clean up
         title = title.strip()
@@ -262,7 +514,7 @@ def extract_advice_format(content: str, theme: str) -> List[Dict[str, str]]:
         bible_refs = bible_refs.strip().replace('\n', ' ')
 
         # Extract first scripture reference
-        scripture_match = re.search(r'([A-Za-z0-9 ]+\s+\d+:\d+(?:-\d+)?)', bible_refs)
+        scripture_match = ADVICE_SCRIPTURE_RE.search(bible_refs[:SCRIPTURE_SEARCH_CHARS])
         scripture = scripture_match.group(1) if scripture_match else bible_refs[:50]
 
         # Get user input
@@ -287,16 +539,10 @@ def extract_heading_format(content: str, theme: str) -> List[Dict[str, str]]:
     """Extract heading-Advice-Bible format (wt.txt style)."""
     examples = []
 
-    # Pattern: emoji/symbol heading\nAdvice:\ntext\nBible References:\nrefs
-    pattern = r'[🕰️✝️🌍📖💡❤️🤝🙏🌅]\s*\d+\.\s*([^\n]+)\nAdvice:\n([^\n]+(?:\n(?!Bible References:|^[🕰️✝️🌍📖💡❤️🤝🙏🌅])[^\n]+)*)\nBible References:\n([^\n]+(?:\n(?!^[🕰️✝️🌍📖💡❤️🤝🙏🌅])[^\n]+)*)'
-
-    matches = re.finditer(pattern, content, re.MULTILINE | re.DOTALL)
-
     inputs = USER_INPUTS.get(theme, [])
     input_idx = 0
 
-    for match in matches:
-        title, advice, bible_refs = match.groups()
+    for title, advice, bible_refs in iter_heading_points(content):
 
         # Clean up
         title = title.strip()
@@ -304,7 +550,7 @@ def extract_heading_format(content: str, theme: str) -> List[Dict[str, str]]:
         bible_refs = bible_refs.strip()
 
         # Extract first scripture reference
-        scripture_match = re.search(r'"([^"]+)"\s*—\s*([A-Za-z0-9 :]+)', bible_refs)
+        scripture_match = HEADING_SCRIPTURE_RE.search(bible_refs[:SCRIPTURE_SEARCH_CHARS])
         scripture = scripture_match.group(2) if scripture_match else bible_refs[:50]
 
         # Get user input
@@ -345,7 +591,7 @@ def extract_bullet_format(content: str, theme: str) -> List[Dict[str, str]]:
             continue
 
         # Check if scripture reference
-        scripture_match = re.search(r'\(([A-Za-z0-9 :;–\-]+\d+:\d+[–\-\d]*)\)', line)
+        scripture_match = BULLET_SCRIPTURE_RE.search(line)
 
         if scripture_match:
             current_scripture = scripture_match.group(1)
@@ -402,78 +648,95 @@ def extract_sermon_format(content: str, theme: str) -> List[Dict[str, str]]:
     """Extract key points from sermon-style text (kic.txt style)."""
     examples = []
 
-    # Look for key actionable phrases
-    key_phrases = [
-        r'you can ([^.]+)\.',
-        r"don't ([^.]+)\.",
-        r'stop ([^.]+)\.',
-        r'start ([^.]+)\.',
-        r'([A-Z][^.]+God[^.]+)\.',
-        r'increase your ([^.]+)\.',
-        r'pray (?:for |asking )?([^.]+)\.',
-    ]
-
     inputs = USER_INPUTS.get(theme, [])
     input_idx = 0
 
-    for pattern in key_phrases:
-        matches = re.finditer(pattern, content, re.IGNORECASE)
-        for match in matches:
-            advice = match.group(0).strip()
+    for match in SERMON_PHRASE_RE.finditer(content):
+        advice = match.group(0).strip()
 
-            # Skip if too short or too long
-            if len(advice) < 30 or len(advice) > 200:
-                continue
+        # Skip if too short or too long
+        if len(advice) < 30 or len(advice) > 200:
+            continue
 
-            # Skip if it's a quote attribution
-            if any(skip in advice.lower() for skip in ['said', 'scripture says', 'the bible', 'verse']):
-                continue
+        # Skip if it's a quote attribution
+        lowered = advice.lower()
+        if any(skip in lowered for skip in SERMON_SKIP_WORDS):
+            continue
 
-            user_input = inputs[input_idx % len(inputs)] if inputs else f"Help me with {theme}"
-            input_idx += 1
+        user_input = inputs[input_idx % len(inputs)] if inputs else f"Help me with {theme}"
+        input_idx += 1
 
-            examples.append({
-                "input": user_input,
-                "response": advice,
-                "theme": theme,
-                "scripture": "Matthew 5:29-30",  # Default for sin theme
-                "source": "pastoral"
-            })
+        examples.append({
+            "input": user_input,
+            "response": advice,
+            "theme": theme,
+            "scripture": "Matthew 5:29-30",  # Default for sin theme
+            "source": "pastoral"
+        })
 
-    # Limit to reasonable number
-    return examples[:15]
+        # Limit to reasonable number
+        if len(examples) == 15:
+            break
 
+    return examples
 
-def parse_file(file_path: Path) -> Tuple[str, List[Dict[str, str]]]:
-    """Parse a pastoral guidance file and return theme and examples."""
-    content = file_path.read_text(encoding='utf-8')
 
-    # Determine theme from filename
+def detect_format(content: str) -> str:
+    """
+    Classify a file from its first SNIFF_CHARS characters
+    Returns 'numbered', 'advice', 'heading', 'bullet' or 'sermon'
+    """
+    prefix = content[:SNIFF_CHARS]
+
+    found = {match.lastgroup for match in FORMAT_SNIFF_RE.finditer(prefix)}
+    for kind in ('numbered', 'advice', 'heading'):
+        if kind in found:
+            return kind
+
+    # Bullet format needs lines that start a capitalized point
+    for line in prefix.split('\n'):
+        line = line.strip()
+        if line and line[0].isupper() and not line.isupper():
+            return 'bullet'
+
+    return 'sermon'
+
+
+FORMAT_EXTRACTORS = {
+    'numbered': extract_numbered_points,
+    'advice': extract_advice_format,
+    'heading': extract_heading_format,
+    'bullet': extract_bullet_format,
+    'sermon': extract_sermon_format,
+}
+
+
+def theme_for_file(file_path: Path) -> Tuple[str, bool]:
+    """Theme for a guidance file name, and whether it is a known theme"""
     filename = file_path.stem.replace('pastoral guidance ', '').strip()
-    theme = None
     for key, value in THEME_MAP.items():
         if key.lower() in filename.lower():
-            theme = value
-            break
+            return value, True
+    return filename.lower().replace(' ', '_'), False
 
-    if not theme:
-        print(f"⚠️ Unknown theme for {filename}, using filename as theme")
-        theme = filename.lower().replace(' ', '_')
 
-    # Try different extraction methods in order
-    examples = extract_numbered_points(content, theme)
-
-    if not examples:
-        examples = extract_advice_format(content, theme)
-
-    if not examples:
-        examples = extract_heading_format(content, theme)
+def parse_file(file_path: Path) -> Tuple[str, List[Dict[str, str]]]:
+    """Parse a pastoral guidance file and return theme and examples."""
+    content = file_path.read_text(encoding='utf-8')
 
-    if not examples:
-        examples = extract_bullet_format(content, theme)
+    # Determine theme from filename
+    filename = file_path.stem.replace('pastoral guidance ', '').strip()
+    theme, known = theme_for_file(file_path)
+    if not known:
+        print(f"⚠️ Unknown theme for {filename}, using filename as theme")
 
-    if not examples:
-        examples = extract_sermon_format(content, theme)
+    # Sniffed format first; if it yields nothing, the rest in the original order
+    sniffed = detect_format(content)
+    examples = []
+    for kind in [sniffed, *(kind for kind in FORMAT_EXTRACTORS if kind != sniffed)]:
+        examples = FORMAT_EXTRACTORS[kind](content, theme)
+        if examples:
+            break
 
     if not examples:
         print(f"⚠️ Could not extract examples from {filename}")
@@ -481,52 +744,275 @@ def parse_file(file_path: Path) -> Tuple[str, List[Dict[str, str]]]:
     return theme, examples
 
 
+def parse_file_task(path: str):
+    """Worker entry point: (file name, theme, examples), theme None for empty files"""
+    file_path = Path(path)
+    if file_path.stat().st_size == 0:
+        return file_path.name, None, []
+    theme, examples = parse_file(file_path)
+    return file_path.name, theme, examples
+
+
+def _ordered_map(executor, fn, args_list, window):
+    """Like executor.map, but with at most `window` tasks in flight"""
+    pending = deque()
+    args_iter = iter(args_list)
+    for args in islice(args_iter, window):
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        result = pending.popleft().result()
+        for args in islice(args_iter, 1):
+            pending.append(executor.submit(fn, *args))
+        yield result
+
+
+def iter_parsed_files(files: List[Path], workers: int):
+    """Parse files in parallel, yielding results in the order of `files`"""
+    tasks = [(str(path),) for path in files]
+    if workers <= 1:
+        yield from (parse_file_task(*task) for task in tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _ordered_map(executor, parse_file_task, tasks, window=workers * 2)
+
+
+def file_hash(path: Path) -> str:
+    """SHA-256 of a file's bytes"""
+    digest = hashlib.sha256()
+    with path.open('rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_manifest(output_dir: Path):
+    """
+    The previous run's manifest, or None if it is missing, was written
+    by another extractor version, or no longer matches the output files
+    """
+    manifest_path = output_dir / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except ValueError:
+        return None
+
+    if manifest.get('extractor_version') != EXTRACTOR_VERSION:
+        return None
+
+    outputs = dict(manifest['theme_sizes'], **{COMBINED_NAME: manifest['combined_size']})
+    for name, size in outputs.items():
+        path = output_dir / (name if name == COMBINED_NAME else f"{name}.jsonl")
+        if not path.exists() or path.stat().st_size != size:
+            return None
+    return manifest
+
+
+class ThemePartitionedWriter:
+    """
+    Writes every example to the combined JSONL file and to its theme's
+    file, keeping one open handle per theme
+
+    Only the themes in `themes` are rewritten (all themes if None). Segments
+    of unchanged source files are spliced in from the previous outputs with
+    copy_segment(). Files are written next to the originals and swapped in
+    on close; if the block raises they are discarded instead.
+    """
+
+    def __init__(self, output_dir: Path, themes=None):
+        self.output_dir = output_dir
+        self.themes = themes
+        self.combined_path = output_dir / COMBINED_NAME
+        self.combined = self._open(self.combined_path)
+        self.combined_size = 0
+        self.theme_files = {}
+        self.theme_sizes = {}
+        self.theme_counts = {}
+        self.total = 0
+
+    @staticmethod
+    def _open(path: Path):
+        return path.with_name(path.name + '.tmp').open('wb')
+
+    def _theme_file(self, theme: str):
+        theme_file = self.theme_files.get(theme)
+        if theme_file is None:
+            theme_file = self._open(self.output_dir / f"{theme}.jsonl")
+            self.theme_files[theme] = theme_file
+            self.theme_sizes[theme] = 0
+        return theme_file
+
+    def rewrites(self, theme: str) -> bool:
+        return self.themes is None or theme in self.themes
+
+    def offsets(self, theme: str) -> Tuple[int, int]:
+        """Current (combined, theme) byte offsets"""
+        return self.combined_size, self.theme_sizes.get(theme, 0)
+
+    def write(self, example: Dict[str, str]):
+        line = (json.dumps(example) + '\n').encode('utf-8')
+        theme = example['theme']
+
+        self.combined.write(line)
+        self.combined_size += len(line)
+        if self.rewrites(theme):
+            self._theme_file(theme).write(line)
+            self.theme_sizes[theme] += len(line)
+
+        self.theme_counts[theme] = self.theme_counts.get(theme, 0) + 1
+        self.total += 1
+
+    def copy_segment(self, theme: str, entry: Dict, old_combined):
+        """Splice an unchanged file's examples in from the previous outputs"""
+        start, end = entry['combined']
+        old_combined.seek(start)
+        self.combined.write(old_combined.read(end - start))
+        self.combined_size += end - start
+
+        if self.rewrites(theme):
+            start, end = entry['theme_range']
+            with (self.output_dir / f"{theme}.jsonl").open('rb') as old_theme:
+                old_theme.seek(start)
+                self._theme_file(theme).write(old_theme.read(end - start))
+            self.theme_sizes[theme] += end - start
+
+        self.theme_counts[theme] = self.theme_counts.get(theme, 0) + entry['examples']
+        self.total += entry['examples']
+
+    def close(self):
+        self.combined.close()
+        os.replace(self.combined.name, self.combined_path)
+        for theme, theme_file in self.theme_files.items():
+            theme_file.close()
+            os.replace(theme_file.name, self.output_dir / f"{theme}.jsonl")
+
+        # Rewritten themes that lost all their examples
+        for theme in (self.themes or ()):
+            if theme not in self.theme_files:
+                stale = self.output_dir / f"{theme}.jsonl"
+                if stale.exists():
+                    stale.unlink()
+
+    def discard(self):
+        """Drop the partial .tmp files and keep the previous outputs"""
+        for handle in [self.combined, *self.theme_files.values()]:
+            handle.close()
+            Path(handle.name).unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
 def main():
-    source_dir = Path.home() / "Documents" / "pastoral_guidance"
-    output_dir = Path("/Users/kcdacre8tor/everyday-christian/assets/training_data/pastoral_guidance")
+    parser = argparse.ArgumentParser(description="Convert pastoral guidance text files to JSONL")
+    parser.add_argument('--source', type=Path, default=Path.home() / "Documents" / "pastoral_guidance",
+                        help="Directory of pastoral guidance .txt files")
+    parser.add_argument('--output', type=Path,
+                        default=Path(__file__).parent.parent / "assets/training_data/pastoral_guidance",
+                        help="Output directory for the JSONL files")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Parser processes (default: CPU count)")
+    parser.add_argument('--full', action='store_true',
+                        help="Ignore the manifest and reconvert every file")
+    args = parser.parse_args()
+
+    source_dir = args.source
+    output_dir = args.output
     output_dir.mkdir(exist_ok=True, parents=True)
 
-    all_examples = []
-    theme_counts = {}
-
     print("🔄 Converting pastoral guidance files to JSONL...\n")
 
-    # Process each file
-    for txt_file in source_dir.glob("*.txt"):
-        if txt_file.stat().st_size == 0:
-            print(f"⏭️  Skipping empty file: {txt_file.name}")
-            continue
-
-        print(f"📄 Processing: {txt_file.name}")
-        theme, examples = parse_file(txt_file)
-
-        if examples:
-            all_examples.extend(examples)
-            theme_counts[theme] = theme_counts.get(theme, 0) + len(examples)
-            print(f"   ✅ Extracted {len(examples)} examples (theme: {theme})")
-        else:
-            print(f"   ❌ No examples extracted")
-
-    # Write combined output
-    output_file = output_dir / "all_pastoral_guidance.jsonl"
-    with output_file.open('w', encoding='utf-8') as f:
-        for example in all_examples:
-            f.write(json.dumps(example) + '\n')
-
-    # Write per-theme files
-    for theme in theme_counts:
-        theme_examples = [ex for ex in all_examples if ex['theme'] == theme]
-        theme_file = output_dir / f"{theme}.jsonl"
-        with theme_file.open('w', encoding='utf-8') as f:
-            for example in theme_examples:
-                f.write(json.dumps(example) + '\n')
+    files = sorted(source_dir.glob("*.txt"))
+    hashes = {path.name: file_hash(path) for path in files}
+
+    manifest = None if args.full else load_manifest(output_dir)
+    previous = manifest['files'] if manifest else {}
+
+    changed = [path for path in files if previous.get(path.name, {}).get('hash') != hashes[path.name]]
+    removed = [name for name in previous if name not in hashes]
+    print(f"🔁 {len(changed)} changed, {len(files) - len(changed)} unchanged, {len(removed)} removed\n")
+
+    if manifest and not changed and not removed:
+        print("✅ Outputs are up to date")
+        return
+
+    # Theme files that need rewriting: old and new themes of every changed file
+    affected = {theme_for_file(path)[0] for path in changed}
+    affected.update(previous[path.name]['theme'] for path in changed if path.name in previous)
+    affected.update(previous[name]['theme'] for name in removed)
+    affected.discard(None)
+
+    entries = {}
+    parsed = iter_parsed_files(changed, args.workers)
+    combined_path = output_dir / COMBINED_NAME
+    old_combined = combined_path.open('rb') if manifest else None
+
+    try:
+        with ThemePartitionedWriter(output_dir, affected if manifest else None) as writer:
+            for path in files:
+                entry = previous.get(path.name)
+                if entry and entry['hash'] == hashes[path.name]:
+                    theme = entry['theme']
+                    combined_start, theme_start = writer.offsets(theme)
+                    if theme is not None:
+                        writer.copy_segment(theme, entry, old_combined)
+                    examples = entry['examples']
+                else:
+                    name, theme, new_examples = next(parsed)
+                    combined_start, theme_start = writer.offsets(theme)
+                    if theme is None:
+                        print(f"⏭️  Skipping empty file: {name}")
+                    else:
+                        print(f"📄 Processing: {name}")
+                        for example in new_examples:
+                            writer.write(example)
+                        if new_examples:
+                            print(f"   ✅ Extracted {len(new_examples)} examples (theme: {theme})")
+                        else:
+                            print(f"   ❌ No examples extracted")
+                    examples = len(new_examples)
+
+                combined_end, theme_end = writer.offsets(theme)
+                if theme is not None and not writer.rewrites(theme):
+                    theme_start, theme_end = entry['theme_range']
+                entries[path.name] = {
+                    'hash': hashes[path.name],
+                    'theme': theme,
+                    'examples': examples,
+                    'combined': [combined_start, combined_end],
+                    'theme_range': [theme_start, theme_end],
+                }
+    finally:
+        if old_combined:
+            old_combined.close()
+
+    # Unrewritten themes keep their previous sizes
+    theme_sizes = dict(manifest['theme_sizes']) if manifest else {}
+    for theme in affected:
+        theme_sizes.pop(theme, None)
+    theme_sizes.update(writer.theme_sizes)
+
+    (output_dir / MANIFEST_NAME).write_text(json.dumps({
+        'extractor_version': EXTRACTOR_VERSION,
+        'combined_size': writer.combined_size,
+        'theme_sizes': theme_sizes,
+        'files': entries,
+    }, indent=2), encoding='utf-8')
 
     # Summary
     print(f"\n✅ Conversion complete!")
-    print(f"📊 Total examples: {len(all_examples)}")
-    print(f"📁 Output: {output_file}")
+    print(f"📊 Total examples: {writer.total}")
+    print(f"📁 Output: {writer.combined_path}")
     print(f"\n📈 Examples by theme:")
-    for theme, count in sorted(theme_counts.items(), key=lambda x: x[1], reverse=True):
+    for theme, count in sorted(writer.theme_counts.items(), key=lambda x: x[1], reverse=True):
         print(f"   {theme}: {count}")
 
 
@@ -2,48 +2,327 @@
 """
 Convert training data to TensorFlow LSTM format
 For local on-device text generation model training
+
+Examples are streamed line by line, split into train/validation by a
+stable hash of each example, shuffled deterministically with an
+external-memory shuffle (random scatter into temporary bucket files, then
+an in-memory shuffle of one bucket at a time), and written to shards of
+at most --shard-mb each. Memory use is bounded by --memory-mb regardless
+of corpus size.
+
+Output: lstm_training_data.train-00000.txt, ..., lstm_training_data.val-00000.txt
+
+--tokenize also builds a vocabulary once (from the train split) and
+encodes every example to int32 token ids, written alongside the shards as
+    lstm_training_data.<split>.tokens.npy   flat int32 ids, memory-mappable
+    lstm_training_data.<split>.offsets.npy  int64, example i is tokens[o[i]:o[i+1]]
+    lstm_training_data.vocab.json           id -> token
+so training loads with np.load(mmap_mode='r') (see load_token_arrays)
+instead of re-tokenizing text on every run.
+
+Usage:
+    python3 convert_to_tensorflow_format.py [--input PATH] [--output-dir DIR]
+        [--shard-mb 32] [--val-fraction 0.05] [--seed 42] [--no-shuffle]
+        [--tokenize [--vocab-size 20000]]
 """
 
+import argparse
 import json
+import math
+import random
+import re
+import sys
+import tempfile
+import time
+import zlib
+from collections import Counter
 from pathlib import Path
 
-def convert_to_tensorflow_format():
-    """Convert JSONL to simple text format for LSTM training"""
-    
-    base_dir = Path(__file__).parent.parent
-    input_file = base_dir / "assets/training_data/training_19750_final.jsonl"
-    output_file = base_dir / "assets/training_data/lstm_training_data.txt"
-    
-    print("Converting to TensorFlow LSTM Format")
-    print("="*60)
-    print(f"Input: {input_file}")
-    print(f"Output: {output_file}\n")
-    
-    # Read JSONL and extract just the responses
-    training_pairs = []
-    
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_INPUT = BASE_DIR / "assets/training_data/training_19750_final.jsonl"
+DEFAULT_OUTPUT_DIR = BASE_DIR / "assets/training_data"
+OUTPUT_STEM = "lstm_training_data"
+
+SPLITS = ('train', 'val')
+
+# Words (with apostrophes), single punctuation marks and newlines
+TOKEN_RE = re.compile(r"\w+(?:'\w+)*|[^\w\s]|\n")
+PAD, UNK = '<pad>', '<unk>'
+# Blank line between pairs in a shard (responses may contain blank lines too)
+PAIR_SEPARATOR_RE = re.compile(r'(?<=\n)\n(?=USER: )')
+
+
+def iter_training_pairs(input_file):
+    """Stream formatted 'USER: ...\\nRESPONSE: ...\\n' pairs from a chat JSONL"""
     with open(input_file, 'r', encoding='utf-8') as f:
         for line in f:
             data = json.loads(line)
             user_input = data['messages'][1]['content']
             response = data['messages'][2]['content']
-            
+
             # Format: USER: input\nRESPONSE: response\n\n
-            training_pairs.append(f"USER: {user_input}\nRESPONSE: {response}\n")
-    
-    # Write to text file for LSTM training
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(training_pairs))
-    
-    file_size = output_file.stat().st_size / (1024 * 1024)
-    
-    print(f"✅ Converted {len(training_pairs)} examples")
-    print(f"✅ Saved to: {output_file}")
-    print(f"   File size: {file_size:.1f} MB")
+            yield f"USER: {user_input}\nRESPONSE: {response}\n"
+
+
+def split_of(pair, val_fraction):
+    """Stable train/val assignment: the same example always lands in the same split"""
+    return 'val' if zlib.crc32(pair.encode('utf-8')) < val_fraction * 2 ** 32 else 'train'
+
+
+class ShardWriter:
+    """Writes pairs to <stem>.<split>-NNNNN.txt files of at most shard_bytes"""
+
+    def __init__(self, output_dir, split, shard_bytes):
+        self.output_dir = output_dir
+        self.split = split
+        self.shard_bytes = shard_bytes
+        self.paths = []
+        self.count = 0
+        self._file = None
+        self._size = 0
+
+    def write(self, pair):
+        data = pair.encode('utf-8')
+        if self._file is None or (self.shard_bytes and self._size + len(data) + 1 > self.shard_bytes):
+            self._roll()
+        elif self._size:
+            # Pairs are separated by a blank line, as in the single-file format
+            self._file.write(b'\n')
+            self._size += 1
+        self._file.write(data)
+        self._size += len(data)
+        self.count += 1
+
+    def _roll(self):
+        if self._file:
+            self._file.close()
+        path = self.output_dir / f"{OUTPUT_STEM}.{self.split}-{len(self.paths):05d}.txt"
+        self.paths.append(path)
+        self._file = path.open('wb')
+        self._size = 0
+
+    def close(self):
+        if self._file:
+            self._file.close()
+
+
+def tokenize_pair(pair):
+    return TOKEN_RE.findall(pair)
+
+
+def build_vocabulary(input_file, val_fraction, vocab_size):
+    """
+    Count tokens in one streaming pass
+    Returns (vocab list, split -> token total, split -> example total);
+    the vocabulary comes from the train split only
+    """
+    counts = Counter()
+    token_totals = dict.fromkeys(SPLITS, 0)
+    example_totals = dict.fromkeys(SPLITS, 0)
+
+    for pair in iter_training_pairs(input_file):
+        split = split_of(pair, val_fraction)
+        tokens = tokenize_pair(pair)
+        if split == 'train':
+            counts.update(tokens)
+        token_totals[split] += len(tokens)
+        example_totals[split] += 1
+
+    vocab = [PAD, UNK] + [token for token, _ in counts.most_common(vocab_size - 2)]
+    return vocab, token_totals, example_totals
+
+
+class TokenArrayWriter:
+    """Encodes pairs into preallocated .npy memmaps of token ids and offsets"""
+
+    def __init__(self, output_dir, split, total_tokens, total_examples, token_ids):
+        self.split = split
+        self.tokens_path = output_dir / f"{OUTPUT_STEM}.{split}.tokens.npy"
+        self.offsets_path = output_dir / f"{OUTPUT_STEM}.{split}.offsets.npy"
+        self.tokens = np.lib.format.open_memmap(self.tokens_path, mode='w+', dtype=np.int32,
+                                                shape=(total_tokens,))
+        self.offsets = np.lib.format.open_memmap(self.offsets_path, mode='w+', dtype=np.int64,
+                                                 shape=(total_examples + 1,))
+        self.token_ids = token_ids
+        self.unk = token_ids[UNK]
+        self.count = 0
+        self.position = 0
+
+    def write(self, pair):
+        ids = [self.token_ids.get(token, self.unk) for token in tokenize_pair(pair)]
+        end = self.position + len(ids)
+        self.tokens[self.position:end] = ids
+        self.count += 1
+        self.offsets[self.count] = end
+        self.position = end
+
+    def close(self):
+        self.tokens.flush()
+        self.offsets.flush()
+        del self.tokens, self.offsets
+
+
+def load_token_arrays(output_dir=DEFAULT_OUTPUT_DIR, split='train'):
+    """
+    Zero-copy access to a tokenized split: (tokens memmap, offsets, vocab)
+    Example i is tokens[offsets[i]:offsets[i + 1]]
+    """
+    output_dir = Path(output_dir)
+    tokens = np.load(output_dir / f"{OUTPUT_STEM}.{split}.tokens.npy", mmap_mode='r')
+    offsets = np.load(output_dir / f"{OUTPUT_STEM}.{split}.offsets.npy", mmap_mode='r')
+    with open(output_dir / f"{OUTPUT_STEM}.vocab.json", 'r', encoding='utf-8') as f:
+        vocab = json.load(f)
+    return tokens, offsets, vocab
+
+
+def benchmark_loading(output_dir, text_paths, writer):
+    """
+    Compare two ways of loading a whole split and visiting every example's
+    token ids: re-tokenizing the text shards, or reading the token arrays
+    """
+    start = time.perf_counter()
+    with open(output_dir / f"{OUTPUT_STEM}.vocab.json", 'r', encoding='utf-8') as f:
+        token_ids = {token: i for i, token in enumerate(json.load(f))}
+    unk = token_ids[UNK]
+    text_examples = 0
+    for path in text_paths:
+        for pair in PAIR_SEPARATOR_RE.split(path.read_text(encoding='utf-8')):
+            sum(token_ids.get(token, unk) for token in tokenize_pair(pair))
+            text_examples += 1
+    text_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tokens, offsets, _ = load_token_arrays(output_dir, writer.split)
+    bounds = offsets.tolist()
+    for begin, end in zip(bounds, bounds[1:]):
+        int(tokens[begin:end].sum())
+    array_time = time.perf_counter() - start
+
+    text_bytes = sum(path.stat().st_size for path in text_paths)
+    array_bytes = writer.tokens_path.stat().st_size + writer.offsets_path.stat().st_size
+    print(f"   {writer.split}: {writer.position} tokens, {text_bytes / (1024 * 1024):.1f} MB text -> "
+          f"{array_bytes / (1024 * 1024):.1f} MB arrays ({text_bytes / max(array_bytes, 1):.2f}x)")
+    print(f"      full pass over {text_examples} / {len(bounds) - 1} examples: "
+          f"text + tokenize {text_time * 1000:.1f}ms, memmap {array_time * 1000:.1f}ms "
+          f"({text_time / max(array_time, 1e-9):,.1f}x faster)")
+
+
+def external_shuffle(pairs, rng, bucket_count, temp_dir):
+    """
+    Deterministic shuffle in bounded memory: scatter pairs into bucket
+    files at random, then shuffle and yield one bucket at a time
+    """
+    buckets = [open(Path(temp_dir) / f"bucket-{i:04d}.jsonl", 'w+', encoding='utf-8')
+               for i in range(bucket_count)]
+    try:
+        for pair in pairs:
+            buckets[rng.randrange(bucket_count)].write(json.dumps(pair) + '\n')
+
+        for bucket in buckets:
+            bucket.seek(0)
+            items = [json.loads(line) for line in bucket]
+            rng.shuffle(items)
+            yield from items
+    finally:
+        for bucket in buckets:
+            bucket.close()
+
+
+def convert_to_tensorflow_format(input_file=DEFAULT_INPUT, output_dir=DEFAULT_OUTPUT_DIR, shard_mb=32,
+                                 val_fraction=0.05, seed=42, shuffle=True, memory_mb=64,
+                                 tokenize=False, vocab_size=20000):
+    """Convert JSONL to sharded text files (and optionally token arrays) for LSTM training"""
+    input_file, output_dir = Path(input_file), Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("Converting to TensorFlow LSTM Format")
+    print("="*60)
+    print(f"Input: {input_file}")
+    print(f"Output: {output_dir}/{OUTPUT_STEM}.<split>-NNNNN.txt\n")
+
+    # Shards from an earlier run with more data or a smaller --shard-mb
+    for split in SPLITS:
+        for stale in output_dir.glob(f"{OUTPUT_STEM}.{split}-[0-9][0-9][0-9][0-9][0-9].txt"):
+            stale.unlink()
+
+    shard_bytes = int(shard_mb * 1024 * 1024)
+    writers = {split: ShardWriter(output_dir, split, shard_bytes) for split in SPLITS}
+
+    token_writers = {}
+    if tokenize:
+        print("🔤 Building vocabulary...")
+        vocab, token_totals, example_totals = build_vocabulary(input_file, val_fraction, vocab_size)
+        with open(output_dir / f"{OUTPUT_STEM}.vocab.json", 'w', encoding='utf-8') as f:
+            json.dump(vocab, f, ensure_ascii=False)
+        token_ids = {token: i for i, token in enumerate(vocab)}
+        token_writers = {
+            split: TokenArrayWriter(output_dir, split, token_totals[split], example_totals[split], token_ids)
+            for split in SPLITS
+        }
+        print(f"   ✓ {len(vocab)} tokens in vocabulary\n")
+
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+        pairs = iter_training_pairs(input_file)
+        if shuffle:
+            # Buckets of about memory_mb each are shuffled in memory
+            bucket_count = max(1, math.ceil(input_file.stat().st_size / (memory_mb * 1024 * 1024)))
+            pairs = external_shuffle(pairs, random.Random(seed), bucket_count, temp_dir)
+
+        for pair in pairs:
+            split = split_of(pair, val_fraction)
+            writers[split].write(pair)
+            if token_writers:
+                token_writers[split].write(pair)
+
+    for writer in list(writers.values()) + list(token_writers.values()):
+        writer.close()
+
+    print(f"✅ Converted {sum(w.count for w in writers.values())} examples")
+    for split, writer in writers.items():
+        size = sum(path.stat().st_size for path in writer.paths) / (1024 * 1024)
+        print(f"   {split}: {writer.count} examples in {len(writer.paths)} shard(s), {size:.1f} MB")
+        for path in writer.paths:
+            print(f"      {path.name}")
+
+    if token_writers:
+        print(f"\n🔢 Token arrays:")
+        for split, token_writer in token_writers.items():
+            if writers[split].paths:
+                benchmark_loading(output_dir, writers[split].paths, token_writer)
     print(f"\n📋 Ready for TensorFlow LSTM training!")
     print(f"\nNext steps:")
     print(f"   cd training")
     print(f"   python train_text_generator.py")
 
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert training JSONL to sharded LSTM text files")
+    parser.add_argument('--input', type=Path, default=DEFAULT_INPUT)
+    parser.add_argument('--output-dir', type=Path, default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--shard-mb', type=float, default=32, help="Maximum shard size (0 = one file per split)")
+    parser.add_argument('--val-fraction', type=float, default=0.05, help="Share of examples held out")
+    parser.add_argument('--seed', type=int, default=42, help="Shuffle seed")
+    parser.add_argument('--no-shuffle', action='store_true', help="Keep input order")
+    parser.add_argument('--memory-mb', type=float, default=64, help="Memory budget for the shuffle")
+    parser.add_argument('--tokenize', action='store_true',
+                        help="Also write int32 token id arrays and a vocabulary (needs numpy)")
+    parser.add_argument('--vocab-size', type=int, default=20000, help="Vocabulary size for --tokenize")
+    args = parser.parse_args()
+
+    if args.tokenize and np is None:
+        print("❌ Error: numpy package not installed (needed for --tokenize)")
+        print("Install it with: pip install numpy")
+        sys.exit(1)
+
+    convert_to_tensorflow_format(args.input, args.output_dir, args.shard_mb, args.val_fraction,
+                                 args.seed, not args.no_shuffle, args.memory_mb,
+                                 args.tokenize, args.vocab_size)
+
+
 if __name__ == "__main__":
-    convert_to_tensorflow_format()
+    main()
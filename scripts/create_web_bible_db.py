@@ -2,141 +2,557 @@
 """
 Create World English Bible (WEB) SQLite database from raw text
 Downloads from ebible.org (official WEB source)
+
+Bulk-load mode: verses are parsed lazily, inserted with batched
+executemany() inside a single transaction using build-time PRAGMAs,
+and the secondary indexes plus the FTS index are built after the load.
+
+Ingestion is a streaming pipeline: the source (URL, local zip or a
+directory of .usfm files) is read member by member, books are parsed
+in a process pool (one book per task) and their rows are streamed in
+canonical order to the single SQLite writer. clean_text (and the
+text_hash it was derived from) is computed in the same pass, so
+clean_bible_verses.py no longer has to rewrite the table afterwards.
+
+Rebuilds are incremental: a build_manifest table records a content hash
+per USFM member, and only books whose hash changed (or that were added
+or removed) are re-ingested and re-indexed. Verse ids stay stable, since
+the app and the verse_themes / daily_verse_schedule tables refer to them
+(and the app orders books by id): verses of a changed book are updated
+in place by (chapter, verse), and only verses that did not exist before
+get new ids. --full drops everything and rebuilds, then points the
+referencing tables at the new ids by (book, chapter, verse).
+
+Usage:
+    python3 create_web_bible_db.py [--source URL|ZIP|DIR] [--workers N] [--full]
 """
 
+import argparse
+import hashlib
+import io
+import os
+import re
+import shutil
 import sqlite3
+import sys
+import tempfile
+import time
 import urllib.request
-import re
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
 
-print("📖 Downloading World English Bible (WEB) from ebible.org...")
+from clean_bible_verses import text_hash
+from verse_cleaner import clean_verse_text
 
 # Download WEB Bible in USFM format (most parseable)
-url = "https://ebible.org/Scriptures/engwebp_usfm.zip"
+URL = "https://ebible.org/Scriptures/engwebp_usfm.zip"
+DB_PATH = "../assets/bible.db"
+
+# Rows per executemany() call
+BATCH_SIZE = 5000
+
+# Build-time PRAGMAs. bible.db is a generated artifact, so durability is
+# traded for speed; journal_mode=MEMORY still lets a failed build roll back,
+# since main() runs the schema changes and the load in one explicit
+# transaction (a crash mid-build can still leave a corrupt file).
+BUILD_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA cache_size = -65536",  # 64 MB
+    "PRAGMA temp_store = MEMORY",
+)
+
+# reference is derived from (book, chapter, verse_number) in SQL
+INSERT_VERSE_SQL = '''
+    INSERT INTO verses (book, chapter, verse_number, text, translation, reference,
+                        clean_text, text_hash)
+    VALUES (?1, ?2, ?3, ?4, 'WEB', ?1 || ' ' || ?2 || ':' || ?3, ?5, ?6)
+'''
+
+UPDATE_VERSE_SQL = '''
+    UPDATE verses SET book = ?1, text = ?4, reference = ?1 || ' ' || ?2 || ':' || ?3,
+                      clean_text = ?5, text_hash = ?6
+    WHERE id = ?7
+'''
+
+# Tables built by other scripts that store verses.id in a verse_id column
+VERSE_REFERENCE_TABLES = ('verse_themes', 'daily_verse_schedule')
+
+# Precompiled USFM patterns
+BOOK_NAME_RE = re.compile(r'\\h (.+)')
+VERSE_RE = re.compile(r'\\v (\d+)(.+)')
+MARKER_RE = re.compile(r'\\[a-z]+\*?')
+
+
+def list_usfm_members(kind, path):
+    """List the .usfm members of a zip archive or directory, in canonical order"""
+    if kind == 'zip':
+        with zipfile.ZipFile(path) as z:
+            return sorted(f for f in z.namelist() if f.endswith('.usfm'))
+    return sorted(p.name for p in Path(path).glob('*.usfm'))
+
+
+@contextmanager
+def open_usfm_member(kind, path, member):
+    """Open one USFM member as a line-iterable text stream"""
+    if kind == 'zip':
+        with zipfile.ZipFile(path) as z, z.open(member) as raw:
+            yield io.TextIOWrapper(raw, encoding='utf-8')
+    else:
+        with open(Path(path) / member, encoding='utf-8') as f:
+            yield f
+
+
+def parse_usfm_book(usfm_file, lines):
+    """
+    Yield (book, chapter, verse_number, text, raw_usfm) rows for one USFM book
+    """
+    book_name = usfm_file.replace('.usfm', '')
+
+    # Parse chapters and verses
+    current_chapter = 0
+    for line in lines:
+        # Book name from \h tag; an empty tag keeps the book code
+        if line.startswith('\\h '):
+            match = BOOK_NAME_RE.match(line)
+            if match and match.group(1).strip():
+                book_name = match.group(1).strip()
+
+        # Chapter marker
+        elif line.startswith('\\c '):
+            current_chapter = int(line.split()[1])
+
+        # Verse marker
+        elif line.startswith('\\v '):
+            # Extract verse number and text
+            match = VERSE_RE.match(line)
+            if match:
+                verse_num = int(match.group(1))
+
+                # Clean up USFM markers
+                raw_text = match.group(2)
+                verse_text = ' '.join(MARKER_RE.sub('', raw_text).split())
+
+                if verse_text and current_chapter > 0:
+                    yield (book_name, current_chapter, verse_num, verse_text, raw_text)
+
 
-try:
-    import zipfile
-    import io
+def with_clean_text(rows):
+    """
+    Pipeline stage: replace the raw USFM of each parsed verse row with
+    (clean_text, text_hash). Cleaning the raw text keeps the footnote
+    delimiters that are lost in the stored text.
+    """
+    for book, chapter, verse_num, verse_text, raw_text in rows:
+        yield (book, chapter, verse_num, verse_text,
+               clean_verse_text(raw_text), text_hash(verse_text))
+
+
+def parse_book_task(kind, path, member):
+    """Process-pool task: parse and clean a single book into (member, verse rows)"""
+    with open_usfm_member(kind, path, member) as stream:
+        return member, list(with_clean_text(parse_usfm_book(member, stream)))
+
+
+def hash_usfm_member(kind, path, member):
+    """SHA-256 of a member's raw bytes, read in chunks"""
+    digest = hashlib.sha256()
+    if kind == 'zip':
+        with zipfile.ZipFile(path) as z, z.open(member) as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    else:
+        with open(Path(path) / member, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _ordered_map(executor, fn, args_list, window):
+    """Like executor.map, but with at most `window` tasks in flight"""
+    pending = deque()
+    args_iter = iter(args_list)
+    for args in islice(args_iter, window):
+        pending.append(executor.submit(fn, *args))
+    while pending:
+        result = pending.popleft().result()
+        for args in islice(args_iter, 1):
+            pending.append(executor.submit(fn, *args))
+        yield result
+
+
+def iter_verse_rows(kind, path, members, workers, built=None):
+    """
+    Parse books in parallel and stream their rows in canonical order.
+    If `built` is given, it is filled with member -> (book, verse_count).
+    """
+    tasks = [(kind, path, member) for member in members]
+    if built is None:
+        built = {}
+
+    if workers <= 1:
+        books = (parse_book_task(*task) for task in tasks)
+        yield from _count_and_report(books, built)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        books = _ordered_map(executor, parse_book_task, tasks, window=workers * 2)
+        yield from _count_and_report(books, built)
+
+
+def _count_and_report(books, built):
+    verse_count = 0
+    for member, rows in books:
+        book_name = rows[0][0] if rows else member.replace('.usfm', '')
+        built[member] = (book_name, len(rows))
+        if not rows:
+            continue
+        verse_count += len(rows)
+        yield from rows
+        print(f"  ✅ {book_name}: {verse_count} total verses so far")
+
+
+def resolve_source(source, tmp_dir):
+    """
+    Return (kind, path) for a URL, local zip or directory source.
+    URLs are streamed to a temporary file rather than held in memory.
+    """
+    if os.path.isdir(source):
+        return 'dir', source
+    if os.path.isfile(source):
+        return 'zip', source
 
     print("⬇️  Downloading ZIP file...")
-    with urllib.request.urlopen(url) as response:
-        zip_data = response.read()
-
-    print("📦 Extracting USFM files...")
-    with zipfile.ZipFile(io.BytesIO(zip_data)) as z:
-        # Find all USFM files
-        usfm_files = [f for f in z.namelist() if f.endswith('.usfm')]
-        print(f"Found {len(usfm_files)} Bible books")
-
-        # Create database
-        db_path = "../assets/bible.db"
-        print(f"\n💾 Creating SQLite database at {db_path}...")
-
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # Drop existing tables
-        cursor.execute('DROP TABLE IF EXISTS verses')
-        cursor.execute('DROP TABLE IF EXISTS verses_fts')
-
-        # Create verses table
-        cursor.execute('''
-            CREATE TABLE verses (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                book TEXT NOT NULL,
-                chapter INTEGER NOT NULL,
-                verse_number INTEGER NOT NULL,
-                text TEXT NOT NULL,
-                translation TEXT DEFAULT 'WEB',
-                reference TEXT NOT NULL,
-                themes TEXT
-            )
-        ''')
-
-        # Create FTS table for search
-        cursor.execute('''
-            CREATE VIRTUAL TABLE verses_fts USING fts5(
-                text,
-                content=verses,
-                tokenize='porter ascii'
-            )
-        ''')
-
-        print("📝 Parsing and inserting verses...\n")
-
-        verse_count = 0
-        for usfm_file in sorted(usfm_files):
-            content = z.read(usfm_file).decode('utf-8')
-
-            # Extract book name from \h tag
-            book_match = re.search(r'\\h (.+)', content)
-            book_name = book_match.group(1).strip() if book_match else usfm_file.replace('.usfm', '')
-
-            # Parse chapters and verses
-            current_chapter = 0
-            for line in content.split('\n'):
-                # Chapter marker
-                if line.startswith('\\c '):
-                    current_chapter = int(line.split()[1])
-
-                # Verse marker
-                elif line.startswith('\\v '):
-                    # Extract verse number and text
-                    match = re.match(r'\\v (\d+)(.+)', line)
-                    if match:
-                        verse_num = int(match.group(1))
-                        verse_text = match.group(2).strip()
-
-                        # Clean up USFM markers
-                        verse_text = re.sub(r'\\[a-z]+\*?', '', verse_text)
-                        verse_text = ' '.join(verse_text.split())
-
-                        if verse_text and current_chapter > 0:
-                            reference = f"{book_name} {current_chapter}:{verse_num}"
-
-                            cursor.execute('''
-                                INSERT INTO verses (book, chapter, verse_number, text, translation, reference)
-                                VALUES (?, ?, ?, ?, 'WEB', ?)
-                            ''', (book_name, current_chapter, verse_num, verse_text, reference))
-
-                            verse_count += 1
-
-            print(f"  ✅ {book_name}: {verse_count} total verses so far")
-
-        # Populate FTS index
-        print("\n🔍 Building full-text search index...")
-        cursor.execute('INSERT INTO verses_fts(text) SELECT text FROM verses')
-
-        # Create indexes
-        print("🔍 Creating indexes...")
-        cursor.execute('CREATE INDEX idx_book_chapter ON verses(book, chapter)')
-        cursor.execute('CREATE INDEX idx_reference ON verses(reference)')
-        cursor.execute('CREATE INDEX idx_book ON verses(book)')
-
-        conn.commit()
-
-        # Verify
-        cursor.execute('SELECT COUNT(*) FROM verses')
-        total = cursor.fetchone()[0]
-
-        cursor.execute('SELECT COUNT(DISTINCT book) FROM verses')
-        books = cursor.fetchone()[0]
-
-        conn.close()
+    zip_path = os.path.join(tmp_dir, 'usfm.zip')
+    with urllib.request.urlopen(source) as response, open(zip_path, 'wb') as f:
+        shutil.copyfileobj(response, f, length=1024 * 1024)
+    return 'zip', zip_path
+
+
+def apply_build_pragmas(conn):
+    """Tune the connection for a one-shot bulk load"""
+    for pragma in BUILD_PRAGMAS:
+        conn.execute(pragma)
+
+
+def create_schema(cursor):
+    """Drop and recreate the verses and verses_fts tables (no indexes yet)"""
+    # Drop existing tables
+    cursor.execute('DROP TABLE IF EXISTS verses')
+    cursor.execute('DROP TABLE IF EXISTS verses_fts')
+    cursor.execute('DROP TABLE IF EXISTS build_manifest')
+
+    # Create verses table
+    cursor.execute('''
+        CREATE TABLE verses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            book TEXT NOT NULL,
+            chapter INTEGER NOT NULL,
+            verse_number INTEGER NOT NULL,
+            text TEXT NOT NULL,
+            translation TEXT DEFAULT 'WEB',
+            reference TEXT NOT NULL,
+            themes TEXT,
+            clean_text TEXT,
+            text_hash TEXT
+        )
+    ''')
+
+    # Create FTS table for search
+    cursor.execute('''
+        CREATE VIRTUAL TABLE verses_fts USING fts5(
+            text,
+            content=verses,
+            tokenize='porter ascii'
+        )
+    ''')
+
+    # Per-member content hashes for incremental rebuilds
+    cursor.execute('''
+        CREATE TABLE build_manifest (
+            member TEXT PRIMARY KEY,
+            book TEXT NOT NULL,
+            content_hash TEXT NOT NULL,
+            verse_count INTEGER NOT NULL
+        )
+    ''')
+
+
+def bulk_insert_verses(cursor, rows, batch_size=BATCH_SIZE):
+    """Insert rows with batched executemany(); returns the number inserted"""
+    inserted = 0
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        cursor.executemany(INSERT_VERSE_SQL, batch)
+        inserted += len(batch)
+    return inserted
+
+
+def build_search_indexes(cursor):
+    """Build the FTS index and secondary indexes once the data is loaded"""
+    # Populate FTS index from the external content table
+    print("\n🔍 Building full-text search index...")
+    cursor.execute("INSERT INTO verses_fts(verses_fts) VALUES('rebuild')")
+
+    # Create indexes
+    print("🔍 Creating indexes...")
+    cursor.execute('CREATE INDEX idx_book_chapter ON verses(book, chapter)')
+    cursor.execute('CREATE INDEX idx_reference ON verses(reference)')
+    cursor.execute('CREATE INDEX idx_book ON verses(book)')
+
+
+def load_manifest(cursor):
+    """Return member -> (book, content_hash), or None if there is no usable build"""
+    tables = {row[0] for row in cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+    if not {'verses', 'verses_fts', 'build_manifest'} <= tables:
+        return None
+
+    # Databases built before clean_text was part of ingestion need a full build
+    cursor.execute('PRAGMA table_info(verses)')
+    if not {'clean_text', 'text_hash'} <= {row[1] for row in cursor.fetchall()}:
+        return None
+
+    cursor.execute('SELECT member, book, content_hash FROM build_manifest')
+    return {member: (book, content_hash) for member, book, content_hash in cursor.fetchall()}
+
+
+def write_manifest(cursor, built, hashes):
+    """Record the hash and verse count of every member that was (re)built"""
+    cursor.executemany(
+        'INSERT OR REPLACE INTO build_manifest (member, book, content_hash, verse_count) '
+        'VALUES (?, ?, ?, ?)',
+        [(member, book, hashes[member], count) for member, (book, count) in built.items()]
+    )
+
+
+def verse_reference_tables(cursor):
+    """The VERSE_REFERENCE_TABLES present in the database"""
+    tables = {row[0] for row in cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+    return [table for table in VERSE_REFERENCE_TABLES if table in tables]
+
+
+def snapshot_verse_keys(cursor):
+    """Keep old id -> (book, chapter, verse_number) for remap_verse_references()"""
+    cursor.execute('DROP TABLE IF EXISTS temp.old_verse_keys')
+    cursor.execute('CREATE TEMP TABLE old_verse_keys AS '
+                   'SELECT id, book, chapter, verse_number FROM verses')
+
+
+def remap_verse_references(cursor, tables):
+    """
+    Point verse_id columns at the rebuilt verses with the same
+    (book, chapter, verse_number); rows whose verse is gone are dropped.
+    Returns (remapped, dropped) row counts
+    """
+    cursor.execute('''
+        CREATE TEMP TABLE verse_id_map AS
+        SELECT o.id AS old_id, v.id AS new_id
+        FROM temp.old_verse_keys o
+        JOIN verses v ON v.book = o.book AND v.chapter = o.chapter
+                     AND v.verse_number = o.verse_number
+    ''')
+    cursor.execute('CREATE UNIQUE INDEX temp.idx_verse_id_map ON verse_id_map(old_id)')
+
+    remapped = dropped = 0
+    for table in tables:
+        cursor.execute(f'DELETE FROM {table} WHERE verse_id NOT IN (SELECT old_id FROM temp.verse_id_map)')
+        dropped += cursor.rowcount
+        # Via negative ids, so no row collides with an old id mid-update
+        cursor.execute(f'UPDATE {table} SET verse_id = -(SELECT new_id FROM temp.verse_id_map '
+                       f'WHERE old_id = {table}.verse_id)')
+        remapped += cursor.rowcount
+        cursor.execute(f'UPDATE {table} SET verse_id = -verse_id')
+
+    cursor.execute('DROP TABLE temp.verse_id_map')
+    cursor.execute('DROP TABLE temp.old_verse_keys')
+    return remapped, dropped
+
+
+def delete_verses(cursor, verse_ids, tables):
+    """Remove verses by id, with their referencing rows; returns references removed"""
+    params = [(verse_id,) for verse_id in verse_ids]
+    references = 0
+    for table in tables:
+        cursor.executemany(f'DELETE FROM {table} WHERE verse_id = ?', params)
+        references += cursor.rowcount
+    cursor.executemany('DELETE FROM verses WHERE id = ?', params)
+    return references
+
+
+def full_build(cursor, kind, path, members, hashes, workers):
+    """Drop everything and load all books; returns the number of verses loaded"""
+    tables = verse_reference_tables(cursor)
+    if tables:
+        snapshot_verse_keys(cursor)
+    create_schema(cursor)
+
+    built = {}
+    rows = iter_verse_rows(kind, path, members, workers, built)
+    verse_count = bulk_insert_verses(cursor, rows)
+
+    build_search_indexes(cursor)
+    write_manifest(cursor, built, hashes)
+
+    if tables:
+        remapped, dropped = remap_verse_references(cursor, tables)
+        print(f"🔗 Remapped {remapped} rows of {', '.join(tables)} to the new verse ids"
+              + (f" ({dropped} pointing at verses that no longer exist were dropped)" if dropped else ""))
+    return verse_count
+
+
+def incremental_build(cursor, kind, path, members, hashes, manifest, workers):
+    """
+    Re-ingest only changed, added or removed books, keeping verse ids
+    Returns the number of verses written
+    """
+    changed = [m for m in members if manifest.get(m, (None, None))[1] != hashes[m]]
+    removed = [m for m in manifest if m not in hashes]
+    print(f"🔁 Incremental rebuild: {len(changed)} changed, {len(removed)} removed, "
+          f"{len(members) - len(changed)} unchanged")
+
+    if not changed and not removed:
+        return 0
+
+    built = {}
+    rows_by_book = {}
+    for row in iter_verse_rows(kind, path, changed, workers, built):
+        rows_by_book.setdefault(row[0], []).append(row)
+
+    # External-content FTS entries must be deleted while the old text is still there
+    stale = [m for m in changed + removed if m in manifest]
+    cursor.executemany(
+        "INSERT INTO verses_fts(verses_fts, rowid, text) "
+        "SELECT 'delete', id, text FROM verses WHERE book = ?",
+        [(manifest[m][0],) for m in stale])
+
+    # Match each book's old and new verses on (chapter, verse)
+    updates, inserts, gone = [], [], []
+    for member in stale:
+        cursor.execute('SELECT chapter, verse_number, id FROM verses WHERE book = ?',
+                       (manifest[member][0],))
+        old_ids = {(chapter, verse): verse_id for chapter, verse, verse_id in cursor.fetchall()}
+        new_rows = rows_by_book.get(built[member][0], []) if member in built else []
+        for row in new_rows:
+            verse_id = old_ids.pop((row[1], row[2]), None)
+            if verse_id is None:
+                inserts.append(row)
+            else:
+                updates.append(row + (verse_id,))
+        gone.extend(old_ids.values())
+    appended = len(inserts)
+    for member in changed:
+        if member not in manifest:
+            inserts.extend(rows_by_book.get(built[member][0], []))
+
+    tables = verse_reference_tables(cursor)
+    references = delete_verses(cursor, gone, tables)
+    cursor.executemany(UPDATE_VERSE_SQL, updates)
+    bulk_insert_verses(cursor, inserts)
+    cursor.executemany('DELETE FROM build_manifest WHERE member = ?', [(m,) for m in removed])
+
+    print(f"   {len(updates)} verses updated in place, {len(inserts)} added, {len(gone)} removed")
+    if references:
+        print(f"   ⚠ Deleted {references} rows of {', '.join(tables)} that referred to removed verses")
+    if appended:
+        print(f"   ⚠ {appended} new verses of existing books were appended after the last id; "
+              f"run --full to restore canonical id order")
+
+    print("\n🔍 Updating full-text search index...")
+    cursor.executemany('INSERT INTO verses_fts(rowid, text) SELECT id, text FROM verses WHERE book = ?',
+                       [(built[m][0],) for m in changed])
+    write_manifest(cursor, built, hashes)
+    return len(updates) + len(inserts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build assets/bible.db from WEB USFM sources")
+    parser.add_argument('--source', default=URL,
+                        help="USFM zip URL, local zip file or directory of .usfm files")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="Parser processes (1 = parse inline)")
+    parser.add_argument('--full', action='store_true',
+                        help="Ignore the build manifest and rebuild every book")
+    args = parser.parse_args()
+
+    print(f"📖 Loading World English Bible (WEB) from {args.source}...")
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            kind, path = resolve_source(args.source, tmp_dir)
+
+            print("📦 Reading USFM files...")
+            usfm_files = list_usfm_members(kind, path)
+            print(f"Found {len(usfm_files)} Bible books")
+
+            hashes = {member: hash_usfm_member(kind, path, member) for member in usfm_files}
+
+            # Create database
+            print(f"\n💾 Building SQLite database at {DB_PATH}...")
+
+            # Autocommit mode: the sqlite3 module would otherwise commit the
+            # DROP/CREATE statements on their own, outside the load transaction
+            conn = sqlite3.connect(DB_PATH, isolation_level=None)
+            apply_build_pragmas(conn)
+            cursor = conn.cursor()
+
+            manifest = None if args.full else load_manifest(cursor)
+
+            print(f"📝 Parsing ({args.workers} workers) and inserting verses...\n")
+
+            # Single transaction for the whole build, schema changes included
+            start = time.perf_counter()
+            cursor.execute('BEGIN')
+            try:
+                if manifest is None:
+                    verse_count = full_build(cursor, kind, path, usfm_files, hashes, args.workers)
+                else:
+                    verse_count = incremental_build(cursor, kind, path, usfm_files, hashes,
+                                                    manifest, args.workers)
+                cursor.execute('COMMIT')
+            except BaseException:
+                cursor.execute('ROLLBACK')
+                conn.close()
+                raise
+            total_seconds = time.perf_counter() - start
+
+            # Verify
+            cursor.execute('SELECT COUNT(*) FROM verses')
+            total = cursor.fetchone()[0]
+
+            cursor.execute('SELECT COUNT(DISTINCT book) FROM verses')
+            books = cursor.fetchone()[0]
+
+            conn.close()
 
         print(f"\n✅ Complete!")
         print(f"📊 Statistics:")
         print(f"   - Total verses: {total}")
         print(f"   - Bible books: {books}")
         print(f"   - Translation: World English Bible (WEB)")
-        print(f"📍 Location: {db_path}")
+        print(f"⏱️  Throughput:")
+        print(f"   - Loaded {verse_count} rows in {total_seconds:.2f}s "
+              f"({verse_count / max(total_seconds, 1e-9):,.0f} rows/sec, indexes included)")
+        print(f"📍 Location: {DB_PATH}")
 
         # Show database size
-        import os
-        size_mb = os.path.getsize(db_path) / (1024 * 1024)
+        size_mb = os.path.getsize(DB_PATH) / (1024 * 1024)
         print(f"💾 Database size: {size_mb:.2f} MB")
 
-except Exception as e:
-    print(f"❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
-    exit(1)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,603 @@
+#!/usr/bin/env python3
+"""
+Token-based Dart codemod engine
+Replaces fix_responsive.py and fix_const_issues.py
+
+Each file is tokenized once (comments, raw / triple-quoted strings and ${}
+interpolation are single opaque tokens, brackets are matched), then every
+registered rule adds edits against the token stream and all edits are
+applied in one pass. Rules:
+
+    font-size   fontSize: 24 -> ResponsiveUtils.fontSize(context, 24, minSize: 20, maxSize: 28)
+    icon-size   Icon(..., size: 24) -> size: ResponsiveUtils.iconSize(context, 24)
+    const       drop `const` from expressions that now contain ResponsiveUtils
+                (`const x = ...` declarations become `final x = ...`)
+
+Sizes are only rewritten where a BuildContext named `context` is in scope
+(a function with a context parameter, or a method or getter of a State
+subclass); others, including field initializers, are reported. The
+responsive_utils import is added when a file starts using it.
+
+Files run in parallel; files whose hash matches the last run (same rules)
+are skipped.
+
+Usage:
+    python3 dart_codemod.py [PATH ...] [--rules font-size,icon-size,const]
+                            [--dry-run] [--workers N] [--full]
+"""
+
+import argparse
+import bisect
+import difflib
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+BASE_DIR = Path(__file__).parent.parent
+LIB_DIR = BASE_DIR / "lib"
+RESPONSIVE_UTILS = LIB_DIR / "utils" / "responsive_utils.dart"
+CACHE_PATH = Path(__file__).parent / ".cache/codemod_cache.json"
+
+# Bump when a rule's output changes so cached "already processed" hashes are ignored
+CODEMOD_VERSION = 2
+# Fewer files than this are processed in-process; a pool would cost more to start
+PARALLEL_MIN_FILES = 64
+
+# Font size mappings: base_size -> (minSize, maxSize)
+FONT_SIZE_MAP = {
+    6: (5, 7),
+    8: (7, 9),
+    9: (8, 11),
+    10: (9, 12),
+    11: (9, 13),
+    12: (10, 14),
+    13: (11, 15),
+    14: (12, 16),
+    15: (13, 17),
+    16: (14, 18),
+    18: (16, 20),
+    20: (18, 24),
+    22: (19, 26),
+    24: (20, 28),
+    26: (22, 30),
+    28: (24, 32),
+    30: (26, 34),
+    32: (28, 36),
+    36: (30, 40),
+    40: (34, 46),
+    48: (40, 54),
+    64: (54, 72),
+}
+
+# Leading whitespace is consumed with each token rather than emitted
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+    (?P<comment>//[^\n]*)
+  | (?P<block_comment>/\*)
+  | (?P<string>(?<![\w$])r?(?:'''|\"\"\"|'|\"))
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<number>0[xX][0-9a-fA-F]+|\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+  | (?P<punct>=>|\?\?|\.\.\.?|[^\s\w])
+    )
+""", re.VERBOSE)
+BLOCK_COMMENT_RE = re.compile(r'/\*|\*/')
+TRIVIA = frozenset(['comment', 'block_comment'])
+OPENERS = {'(': ')', '[': ']', '{': '}'}
+CLOSERS = frozenset(OPENERS.values())
+CONTROL_KEYWORDS = frozenset(['if', 'for', 'while', 'switch', 'catch'])
+
+
+def _string_end_re(quote: str, raw: bool) -> re.Pattern:
+    parts = [re.escape(quote)]
+    if not raw:
+        parts += [r'\\.', r'\$\{']
+    if len(quote) == 1:
+        parts.append(r'\n')
+    return re.compile('|'.join(parts), re.DOTALL)
+
+
+STRING_END_RES = {
+    (quote, raw): _string_end_re(quote, raw)
+    for quote in ("'", '"', "'''", '"""') for raw in (False, True)
+}
+
+
+def _skip_block_comment(content: str, pos: int) -> int:
+    depth = 1
+    for match in BLOCK_COMMENT_RE.finditer(content, pos):
+        depth += 1 if match.group() == '/*' else -1
+        if depth == 0:
+            return match.end()
+    return len(content)
+
+
+def _skip_string(content: str, pos: int, opener: str) -> int:
+    """End of a string literal whose opening quote (with optional r) ends at pos"""
+    raw = opener[0] == 'r'
+    quote = opener[1:] if raw else opener
+    end_re = STRING_END_RES[quote, raw]
+    while True:
+        match = end_re.search(content, pos)
+        if match is None:
+            return len(content)
+        pos = match.end()
+        token = match.group()
+        if token == '${':
+            pos = _skip_interpolation(content, pos)
+        elif token == quote or token == '\n':
+            return pos
+
+
+def _skip_interpolation(content: str, pos: int) -> int:
+    """Position after the } closing a ${ that ends at pos"""
+    depth = 0
+    while pos < len(content):
+        match = TOKEN_RE.match(content, pos)
+        if match is None:
+            break
+        pos = match.end()
+        kind, text = match.lastgroup, match.group(match.lastgroup)
+        if kind == 'block_comment':
+            pos = _skip_block_comment(content, pos)
+        elif kind == 'string':
+            pos = _skip_string(content, pos, text)
+        elif text == '{':
+            depth += 1
+        elif text == '}':
+            if depth == 0:
+                return pos
+            depth -= 1
+    return pos
+
+
+def tokenize_dart(content: str):
+    """Yield (kind, start, end); strings and comments are single tokens"""
+    pos = 0
+    while pos < len(content):
+        match = TOKEN_RE.match(content, pos)
+        if match is None:
+            break  # trailing whitespace
+        kind = match.lastgroup
+        start, pos = match.start(kind), match.end()
+        if kind == 'block_comment':
+            pos = _skip_block_comment(content, pos)
+        elif kind == 'string':
+            pos = _skip_string(content, pos, match.group(kind))
+        yield kind, start, pos
+
+
+class Edit(NamedTuple):
+    start: int
+    end: int
+    text: str
+    rule: str
+
+
+class DartSource:
+    """Significant tokens of one Dart file, with matched brackets"""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.kinds: List[str] = []
+        self.texts: List[str] = []
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        for kind, start, end in tokenize_dart(content):
+            if kind not in TRIVIA:
+                self.kinds.append(kind)
+                self.texts.append(content[start:end])
+                self.starts.append(start)
+                self.ends.append(end)
+
+        # match[i]: index of the partner bracket (-1 if unmatched or not a bracket)
+        # parent[i]: index of the innermost open bracket enclosing token i
+        self.match = [-1] * len(self.texts)
+        self.parent = [-1] * len(self.texts)
+        stack = []
+        for i, text in enumerate(self.texts):
+            if stack:
+                self.parent[i] = stack[-1]
+            if self.kinds[i] != 'punct':
+                continue
+            if text in OPENERS:
+                stack.append(i)
+            elif text in CLOSERS and stack and OPENERS[self.texts[stack[-1]]] == text:
+                opener = stack.pop()
+                self.match[opener], self.match[i] = i, opener
+        self.notes: List[str] = []
+        self._context_scopes: Optional[List[tuple]] = None
+
+    def text(self, i: int) -> str:
+        return self.texts[i] if 0 <= i < len(self.texts) else ''
+
+    def line(self, i: int) -> int:
+        return self.content.count('\n', 0, self.starts[i]) + 1
+
+    def _expression_end(self, i: int) -> int:
+        """Index of the token ending an arrow-function body that starts at i"""
+        while i < len(self.texts):
+            text = self.texts[i]
+            if text in OPENERS and self.match[i] > i:
+                i = self.match[i] + 1
+            elif text in (',', ';') or text in CLOSERS:
+                return i
+            else:
+                i += 1
+        return i
+
+    def _body_after(self, i: int) -> Optional[tuple]:
+        """(start, end) of a `{ ... }` or `=> ...` function body starting at token i"""
+        while self.text(i) in ('async', 'sync', '*'):
+            i += 1
+        if self.text(i) == '{' and self.match[i] > i:
+            return i, self.match[i]
+        if self.text(i) == '=>':
+            return i, self._expression_end(i + 1)
+        return None
+
+    def _member_bodies(self, class_body: int) -> List[tuple]:
+        """Method and getter bodies declared directly in a class body"""
+        t = self.texts
+        bodies = []
+        i = class_body + 1
+        while i < self.match[class_body]:
+            if t[i] in OPENERS and self.match[i] > i:
+                body = None
+                if t[i] == '(' and self.kinds[i - 1] == 'ident' and self.text(i - 2) != '=':
+                    body = self._body_after(self.match[i] + 1)   # name(params) {...}
+                i = self.match[i] + 1
+            elif t[i] == 'get' and self.kinds[i + 1] == 'ident':
+                body = self._body_after(i + 2)                   # get name {...}
+                i += 2
+            else:
+                i += 1
+                continue
+            if body:
+                bodies.append(body)
+                i = max(i, body[1])
+        return bodies
+
+    def context_scopes(self) -> List[tuple]:
+        """Sorted (start, end) token ranges in which `context` is a BuildContext"""
+        if self._context_scopes is not None:
+            return self._context_scopes
+        t = self.texts
+        scopes = []
+        for i, text in enumerate(t):
+            # Parameter named context: (BuildContext context) {...}, (context, child) => ...
+            if text == 'context' and self.text(i + 1) in (',', ')', '}', ']') and self.parent[i] >= 0:
+                params = self.parent[i]
+                while t[params] != '(' and self.parent[params] >= 0:
+                    params = self.parent[params]  # optional {named} / [positional] groups
+                close = self.match[params]
+                if t[params] != '(' or close < 0 or self.text(params - 1) in CONTROL_KEYWORDS:
+                    continue
+                body = self._body_after(close + 1)
+                if body:
+                    scopes.append(body)
+            # State subclasses expose a `context` getter to their methods and
+            # getters, but not to field initializers
+            elif text == 'extends' and self.text(i + 1) == 'State':
+                body = i + 1
+                while body < len(t) and t[body] != '{':
+                    body += 1
+                if body < len(t) and self.match[body] > body:
+                    scopes.extend(self._member_bodies(body))
+        self._context_scopes = sorted(scopes)
+        return self._context_scopes
+
+    def has_context(self, i: int) -> bool:
+        return any(start < i < end for start, end in self.context_scopes())
+
+
+def whole_number(text: str) -> Optional[int]:
+    """24 or 24.0 -> 24; other literals -> None"""
+    match = re.fullmatch(r'(\d+)(?:\.0)?', text)
+    return int(match.group(1)) if match else None
+
+
+RULES = {}
+
+
+def rule(name):
+    """Register a rewrite rule: fn(source, edits) appends Edit tuples"""
+    def register(fn):
+        RULES[name] = fn
+        return fn
+    return register
+
+
+def _size_literal(source: DartSource, i: int, name: str) -> Optional[int]:
+    """Size of a `name: <number>` named argument at token i, else None"""
+    t = source.texts
+    if t[i] != name or source.text(i - 1) not in ('(', ',') or source.text(i + 1) != ':':
+        return None
+    if source.kinds[i + 2] != 'number' or source.text(i + 3) not in (',', ')'):
+        return None
+    return whole_number(t[i + 2])
+
+
+@rule('font-size')
+def responsive_font_size(source: DartSource, edits: List[Edit]):
+    """fontSize: 24 -> fontSize: ResponsiveUtils.fontSize(context, 24, minSize: .., maxSize: ..)"""
+    for i in range(1, len(source.texts) - 3):
+        size = _size_literal(source, i, 'fontSize')
+        if size is None:
+            continue
+        if not source.has_context(i):
+            source.notes.append(f"line {source.line(i)}: fontSize {size} kept (no BuildContext in scope)")
+            continue
+        min_size, max_size = FONT_SIZE_MAP.get(size, (int(size * 0.85), int(size * 1.15)))
+        edits.append(Edit(
+            source.starts[i + 2], source.ends[i + 2],
+            f'ResponsiveUtils.fontSize(context, {size}, minSize: {min_size}, maxSize: {max_size})',
+            'font-size'
+        ))
+
+
+@rule('icon-size')
+def responsive_icon_size(source: DartSource, edits: List[Edit]):
+    """Icon(..., size: 24) -> Icon(..., size: ResponsiveUtils.iconSize(context, 24))"""
+    t = source.texts
+    for i, text in enumerate(t):
+        if text != 'Icon' or source.text(i + 1) != '(' or source.text(i - 1) == '.':
+            continue
+        close = source.match[i + 1]
+        j = i + 2
+        while 0 <= j < close:
+            # Only the Icon's own arguments, not those of nested calls
+            if t[j] in OPENERS and source.match[j] > j:
+                j = source.match[j] + 1
+                continue
+            size = _size_literal(source, j, 'size')
+            if size is not None:
+                if source.has_context(j):
+                    edits.append(Edit(source.starts[j + 2], source.ends[j + 2],
+                                      f'ResponsiveUtils.iconSize(context, {size})', 'icon-size'))
+                else:
+                    source.notes.append(f"line {source.line(j)}: Icon size {size} kept (no BuildContext in scope)")
+            j += 1
+
+
+def _const_expression_end(source: DartSource, i: int) -> int:
+    """Closing bracket of the constructor call / collection literal at token i, or -1"""
+    t = source.texts
+    while source.kinds[i] == 'ident' and source.text(i + 1) == '.':
+        i += 2
+    if source.kinds[i] == 'ident':
+        i += 1
+    if source.text(i) == '<':
+        depth = 0
+        while i < len(t):
+            depth += {'<': 1, '>': -1}.get(t[i], 0)
+            i += 1
+            if depth == 0:
+                break
+    if source.text(i) in OPENERS and source.match[i] > i:
+        return source.match[i]
+    return -1
+
+
+def _const_declaration_end(source: DartSource, i: int) -> int:
+    """`;` ending a `const [Type] name = ...;` declaration whose name or type starts at i, or -1"""
+    t = source.texts
+    while i < len(t) and (source.kinds[i] == 'ident' or t[i] in ('<', '>', ',', '.', '?')):
+        i += 1
+    if source.text(i) != '=':
+        return -1
+    end = source._expression_end(i + 1)
+    return end if source.text(end) == ';' else -1
+
+
+@rule('const')
+def drop_invalid_const(source: DartSource, edits: List[Edit]):
+    """Remove `const` from expressions containing (or about to contain) ResponsiveUtils"""
+    edit_starts = sorted(edit.start for edit in edits)
+    for i, text in enumerate(source.texts[:-1]):
+        if text != 'const' or source.kinds[i] != 'ident':
+            continue
+        declaration = False
+        end = _const_expression_end(source, i + 1)
+        if end < 0:
+            end = _const_declaration_end(source, i + 1)
+            declaration = True
+        if end < 0:
+            continue
+        span_start, span_end = source.starts[i + 1], source.ends[end]
+        pending = bisect.bisect_left(edit_starts, span_start) < bisect.bisect_left(edit_starts, span_end)
+        if not (pending or 'ResponsiveUtils' in source.texts[i + 1:end]):
+            continue
+        if declaration:
+            edits.append(Edit(source.starts[i], source.ends[i], 'final', 'const'))
+        else:
+            # Remove the keyword and the whitespace up to the next token
+            edits.append(Edit(source.starts[i], source.starts[i + 1], '', 'const'))
+
+
+def responsive_import_edit(source: DartSource, path: Path, edits: List[Edit]) -> Optional[Edit]:
+    """Import of responsive_utils.dart after the last import, if the edits need it"""
+    if not any('ResponsiveUtils' in edit.text for edit in edits):
+        return None
+    if 'responsive_utils.dart' in source.content:
+        return None
+
+    t = source.texts
+    last_import_end = -1
+    for i, text in enumerate(t):
+        if text == 'import' and source.parent[i] < 0:
+            j = i
+            while j < len(t) and t[j] != ';':
+                j += 1
+            if j < len(t):
+                last_import_end = j
+    relative = Path(os.path.relpath(RESPONSIVE_UTILS, path.parent)).as_posix()
+    if last_import_end < 0:
+        return Edit(0, 0, f"import '{relative}';\n\n", 'import')
+    position = source.ends[last_import_end]
+    return Edit(position, position, f"\nimport '{relative}';", 'import')
+
+
+def apply_edits(content: str, edits: List[Edit]) -> str:
+    """Apply non-overlapping edits in one pass (later overlapping edits are dropped)"""
+    parts, pos = [], 0
+    for edit in sorted(edits, key=lambda e: (e.start, e.end)):
+        if edit.start < pos:
+            continue
+        parts.append(content[pos:edit.start])
+        parts.append(edit.text)
+        pos = edit.end
+    parts.append(content[pos:])
+    return ''.join(parts)
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def rewrite_source(content: str, path: Path, rule_names: List[str]):
+    """(updated content, edits, notes) after running the rules over one file's content"""
+    source = DartSource(content)
+    edits: List[Edit] = []
+    for name in rule_names:
+        RULES[name](source, edits)
+    import_edit = responsive_import_edit(source, path, edits)
+    if import_edit:
+        edits.append(import_edit)
+    updated = apply_edits(content, edits) if edits else content
+    return updated, edits, source.notes
+
+
+def rewrite_file(path: str, rule_names: List[str], dry_run: bool) -> dict:
+    """Run the rules over one file; module-level so a process pool can run it"""
+    path = Path(path)
+    content = path.read_text(encoding='utf-8')
+    updated, edits, notes = rewrite_source(content, path, rule_names)
+    result = {
+        'path': str(path),
+        'changed': updated != content,
+        'counts': Counter(edit.rule for edit in edits),
+        'notes': notes,
+        'hash': content_hash(updated),
+        'diff': None,
+    }
+    if result['changed']:
+        if dry_run:
+            relative = os.path.relpath(path, BASE_DIR)
+            result['diff'] = ''.join(difflib.unified_diff(
+                content.splitlines(keepends=True), updated.splitlines(keepends=True),
+                fromfile=f"a/{relative}", tofile=f"b/{relative}"
+            ))
+            result['hash'] = content_hash(content)
+        else:
+            path.write_text(updated, encoding='utf-8')
+    return result
+
+
+def load_cache(rules_key: str) -> Dict[str, str]:
+    """path -> content hash after the last run with the same rules"""
+    try:
+        with open(CACHE_PATH, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('version') != CODEMOD_VERSION or cache.get('rules') != rules_key:
+        return {}
+    return cache.get('files', {})
+
+
+def save_cache(rules_key: str, files: Dict[str, str]):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CACHE_PATH.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': CODEMOD_VERSION, 'rules': rules_key, 'files': files}, f, indent=2)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def collect_dart_files(paths: List[Path]) -> List[Path]:
+    files = set()
+    for path in paths:
+        if path.is_dir():
+            files.update(path.rglob("*.dart"))
+        elif path.suffix == '.dart' and path.exists():
+            files.add(path)
+        else:
+            print(f"  ⚠ Not a Dart file or directory: {path}")
+    return sorted(files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply responsive-sizing codemods to Dart files")
+    parser.add_argument('paths', nargs='*', type=Path, default=[LIB_DIR],
+                        help="Dart files or directories (default: lib/)")
+    parser.add_argument('--rules', default=','.join(RULES),
+                        help=f"Comma-separated rules to apply ({', '.join(RULES)})")
+    parser.add_argument('--dry-run', action='store_true', help="Print a unified diff instead of writing")
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--full', action='store_true', help="Process every file, ignoring the hash cache")
+    args = parser.parse_args()
+
+    rule_names = [name.strip() for name in args.rules.split(',') if name.strip()]
+    unknown = [name for name in rule_names if name not in RULES]
+    if unknown or not rule_names:
+        print(f"❌ Unknown rules: {', '.join(unknown) or '(none given)'}")
+        print(f"   Available: {', '.join(RULES)}")
+        sys.exit(1)
+    # Run in registration order: const removal looks at the size rules' edits
+    rule_names = [name for name in RULES if name in rule_names]
+    rules_key = ','.join(rule_names)
+
+    print("🔧 Dart codemod")
+    print("=" * 60)
+    print(f"Rules: {rules_key}{' (dry run)' if args.dry_run else ''}\n")
+
+    start = time.perf_counter()
+    dart_files = collect_dart_files(args.paths)
+    cache = {} if args.full else load_cache(rules_key)
+    hashes = {str(path): content_hash(path.read_text(encoding='utf-8')) for path in dart_files}
+    todo = [path for path, digest in hashes.items() if cache.get(path) != digest]
+    print(f"📁 {len(dart_files)} Dart files, {len(dart_files) - len(todo)} unchanged since the last run")
+
+    tasks = [(path, rule_names, args.dry_run) for path in todo]
+    if len(tasks) >= PARALLEL_MIN_FILES and args.workers != 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = list(pool.map(rewrite_file, *zip(*tasks), chunksize=8))
+    else:
+        results = [rewrite_file(*task) for task in tasks]
+
+    totals = Counter()
+    changed = 0
+    for result in results:
+        hashes[result['path']] = result['hash']
+        relative = os.path.relpath(result['path'], BASE_DIR)
+        for note in result['notes']:
+            print(f"  ⚠ {relative}: {note}")
+        if not result['changed']:
+            continue
+        changed += 1
+        totals.update(result['counts'])
+        if args.dry_run:
+            sys.stdout.write(result['diff'])
+        else:
+            print(f"  ✓ Updated {relative}")
+
+    if args.dry_run:
+        # Files with pending edits must be looked at again on the real run
+        pending = {result['path'] for result in results if result['changed']}
+        hashes = {path: digest for path, digest in hashes.items() if path not in pending}
+    save_cache(rules_key, {**cache, **hashes})
+
+    summary = ', '.join(f"{name}: {totals[name]}" for name in rule_names + ['import'] if totals[name])
+    verb = "Would update" if args.dry_run else "Updated"
+    print(f"\n✅ {verb} {changed} of {len(todo)} processed files in {time.perf_counter() - start:.2f}s"
+          + (f" ({summary})" if summary else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for training JSONL corpora (MinHash + LSH)
+
+Streams the corpus once to build a MinHash signature of every response
+(word shingles), buckets signatures by LSH bands, and unions examples
+whose estimated Jaccard similarity reaches --threshold. A second streaming
+pass writes the first example of every cluster to the deduplicated
+corpus and a JSON report of the clusters that were collapsed.
+
+Work is linear in corpus size: each example is hashed once and compared
+only against the representatives of its LSH buckets.
+
+Accepts chat-format examples ({"messages": [..., {"content": response}]})
+and flat pastoral examples ({"response": ...}).
+
+Usage:
+    python3 dedup_training_data.py [INPUT] [--threshold 0.8] [--output PATH] [--report PATH]
+"""
+
+import argparse
+import json
+import sys
+import time
+import zlib
+from collections import Counter
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("❌ Error: numpy package not installed")
+    print("Install it with: pip install numpy")
+    sys.exit(1)
+
+from keyword_matcher import tokenize
+
+DEFAULT_INPUT = Path(__file__).parent.parent / "assets/training_data/training_19750_final.jsonl"
+
+BATCH_SIZE = 512
+
+
+def iter_example_lines(f):
+    """(line number, line) for every non-blank line of a JSONL file"""
+    for line_number, line in enumerate(f, 1):
+        if line.strip():
+            yield line_number, line
+
+
+def response_text(example):
+    """The response text of a chat-format or flat example"""
+    if 'response' in example:
+        return example['response']
+    return example['messages'][-1]['content']
+
+
+def choose_bands(num_perm, threshold):
+    """LSH (bands, rows) whose S-curve midpoint is closest to threshold"""
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        midpoint = (1 / bands) ** (1 / rows)
+        if best is None or abs(midpoint - threshold) < best[0]:
+            best = (abs(midpoint - threshold), bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """Word-shingle MinHash signatures with num_perm universal hash functions"""
+
+    def __init__(self, num_perm=128, shingle_size=3, seed=1):
+        # Multiply-shift hashing: h(x) = ((a*x + b) mod 2^64) >> 32 with odd a,
+        # which uint64 arithmetic computes without an explicit modulus
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self.b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+        self.shingle_size = shingle_size
+
+    def shingles(self, text):
+        tokens = tokenize(text)
+        n = self.shingle_size
+        if len(tokens) <= n:
+            return {' '.join(tokens)}
+        return {' '.join(tokens[i:i + n]) for i in range(len(tokens) - n + 1)}
+
+    def signatures(self, texts):
+        """(len(texts), num_perm) uint32 signatures, hashed as one batch"""
+        counts, hashes = [], []
+        for text in texts:
+            shingles = self.shingles(text)
+            counts.append(len(shingles))
+            hashes.extend(zlib.crc32(s.encode('utf-8')) for s in shingles)
+
+        # (num_perm, shingles) so each reduceat segment is contiguous
+        permuted = np.outer(self.a, np.asarray(hashes, dtype=np.uint64))
+        permuted += self.b[:, None]
+        permuted = (permuted >> np.uint64(32)).astype(np.uint32)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        return np.ascontiguousarray(np.minimum.reduceat(permuted, starts, axis=1).T)
+
+
+class UnionFind:
+    """Disjoint sets over example indices; the smallest index is the root"""
+
+    def __init__(self):
+        self.parent = []
+
+    def add(self):
+        self.parent.append(len(self.parent))
+
+    def find(self, i):
+        root = i
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[i] != root:
+            self.parent[i], i = root, self.parent[i]
+        return root
+
+    def union(self, i, j):
+        i, j = self.find(i), self.find(j)
+        if i != j:
+            self.parent[max(i, j)] = min(i, j)
+
+
+def find_clusters(input_path, hasher, bands, rows, threshold):
+    """
+    Pass 1: sign every example and union near-duplicates
+    Returns (UnionFind, number of examples, candidate pairs checked)
+    """
+    signatures = []
+    buckets = [{} for _ in range(bands)]
+    sets = UnionFind()
+    candidates = 0
+
+    def add_batch(texts):
+        nonlocal candidates
+        for signature in hasher.signatures(texts):
+            index = len(signatures)
+            signatures.append(signature)
+            sets.add()
+
+            for band, bucket in enumerate(buckets):
+                key = signature[band * rows:(band + 1) * rows].tobytes()
+                other = bucket.setdefault(key, index)
+                if other == index or sets.find(other) == sets.find(index):
+                    continue
+                candidates += 1
+                if np.count_nonzero(signatures[other] == signature) >= threshold * len(signature):
+                    sets.union(other, index)
+
+    with open(input_path, 'r', encoding='utf-8') as f:
+        batch = []
+        for _, line in iter_example_lines(f):
+            batch.append(response_text(json.loads(line)))
+            if len(batch) == BATCH_SIZE:
+                add_batch(batch)
+                batch = []
+        if batch:
+            add_batch(batch)
+
+    return sets, len(signatures), candidates
+
+
+def write_deduplicated(input_path, output_path, sets):
+    """
+    Pass 2: keep the first example of every cluster
+    Returns root -> [(line number, response preview), ...] for clusters of 2+
+    """
+    roots = [sets.find(i) for i in range(len(sets.parent))]
+    sizes = Counter(roots)
+
+    clusters = {}
+    with open(input_path, 'r', encoding='utf-8') as f, \
+            open(output_path, 'w', encoding='utf-8') as out:
+        # Example indices skip blank lines, exactly as in pass 1
+        for index, (line_number, line) in enumerate(iter_example_lines(f)):
+            root = roots[index]
+            if root == index:
+                out.write(line if line.endswith('\n') else line + '\n')
+            if sizes[root] > 1:
+                preview = response_text(json.loads(line))[:160]
+                clusters.setdefault(root, []).append((line_number, preview))
+
+    return clusters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Remove near-duplicate responses from a training JSONL")
+    parser.add_argument('input', nargs='?', type=Path, default=DEFAULT_INPUT)
+    parser.add_argument('--output', type=Path, help="Deduplicated JSONL (default: <input>_dedup.jsonl)")
+    parser.add_argument('--report', type=Path, help="Cluster report (default: <input>_dedup_clusters.json)")
+    parser.add_argument('--threshold', type=float, default=0.8, help="Jaccard similarity for duplicates")
+    parser.add_argument('--num-perm', type=int, default=128, help="MinHash permutations")
+    parser.add_argument('--shingle', type=int, default=3, help="Words per shingle")
+    args = parser.parse_args()
+
+    output_path = args.output or args.input.with_name(args.input.stem + "_dedup.jsonl")
+    report_path = args.report or args.input.with_name(args.input.stem + "_dedup_clusters.json")
+    bands, rows = choose_bands(args.num_perm, args.threshold)
+
+    print("Near-Duplicate Detection (MinHash + LSH)")
+    print("=" * 60)
+    print(f"Input: {args.input}")
+    print(f"Threshold: {args.threshold} ({args.num_perm} permutations, {bands} bands x {rows} rows)\n")
+
+    start = time.perf_counter()
+    hasher = MinHasher(args.num_perm, args.shingle)
+    sets, total, candidates = find_clusters(args.input, hasher, bands, rows, args.threshold)
+    elapsed = time.perf_counter() - start
+    print(f"🔍 Signed {total} examples in {elapsed:.2f}s ({total / max(elapsed, 1e-9):,.0f}/sec), "
+          f"{candidates} candidate pairs checked")
+
+    clusters = write_deduplicated(args.input, output_path, sets)
+    duplicates = sum(len(items) - 1 for items in clusters.values())
+
+    report = {
+        'input': str(args.input),
+        'threshold': args.threshold,
+        'examples': total,
+        'kept': total - duplicates,
+        'removed': duplicates,
+        'clusters': [
+            {
+                'size': len(items),
+                'kept_line': items[0][0],
+                'lines': [line_no for line_no, _ in items],
+                'sample': items[0][1],
+            }
+            for items in sorted(clusters.values(), key=len, reverse=True)
+        ],
+    }
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"\n✅ Kept {total - duplicates} of {total} examples "
+          f"({duplicates} near-duplicates in {len(clusters)} clusters)")
+    print(f"💾 Saved to: {output_path}")
+    print(f"📄 Cluster report: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
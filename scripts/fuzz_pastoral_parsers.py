@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Fuzz and performance check for the pastoral guidance line parsers
+Exits non-zero if a check fails
+
+1. Random well-formed numbered / advice / heading files must parse to the
+   same entries as the original regular expressions.
+2. Multi-megabyte adversarial inputs (long header-like lines, unterminated
+   quotes, label soup) must parse in bounded, linear time: the full-size
+   run has to fit a per-MB budget and scale at most ~linearly from a
+   quarter-size run. Each input is timed --repeat times and the best run
+   counts.
+
+Usage:
+    python3 fuzz_pastoral_parsers.py [--cases 300] [--size-mb 4] [--budget 1.0] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import sys
+import timeit
+
+import convert_pastoral_guidance as cpg
+
+# Scaling is only judged when the full-size run takes at least this long
+MIN_SCALING_SECONDS = 0.25
+
+# Original whole-file patterns, kept as the reference for well-formed input
+LEGACY_PATTERNS = {
+    'numbered': re.compile(
+        r'(\d+)\.\s*([^\n]+)\n"([^"]+)"\nAdvice:\s*([^\n]+(?:\n(?!Scripture|^\d+\.)[^\n]+)*)\nScripture Reference:\s*"?([^"—\n]+)"?\s*—\s*([^\n]+)',
+        re.MULTILINE | re.DOTALL
+    ),
+    'advice': re.compile(
+        r'(\d+)\)\s*([^\n]+)\nadvice:\s*([^\n]+(?:\n(?!Bible:|^\d+\))[^\n]+)*)\nBible:\s*([^\n]+(?:\n(?!^\d+\))[^\n]+)*)',
+        re.MULTILINE | re.DOTALL | re.IGNORECASE
+    ),
+    'heading': re.compile(
+        r'[🕰️✝️🌍📖💡❤️🤝🙏🌅]\s*\d+\.\s*([^\n]+)\nAdvice:\n([^\n]+(?:\n(?!Bible References:|^[🕰️✝️🌍📖💡❤️🤝🙏🌅])[^\n]+)*)\nBible References:\n([^\n]+(?:\n(?!^[🕰️✝️🌍📖💡❤️🤝🙏🌅])[^\n]+)*)',
+        re.MULTILINE | re.DOTALL
+    ),
+}
+
+PARSERS = {
+    'numbered': cpg.iter_numbered_points,
+    'advice': cpg.iter_advice_points,
+    'heading': cpg.iter_heading_points,
+}
+
+WORDS = ('grace', 'peace', 'hope', 'Lord', 'heart', 'walk', 'trust', 'rest', 'light', 'mercy')
+BOOKS = ('Psalm', 'John', '1 Peter', 'Romans', 'Isaiah')
+
+
+def normalize(kind, entry):
+    """Entry fields after the clean-up the extractors apply"""
+    if kind == 'numbered':
+        num, title, quote, advice, verse_text, reference = entry
+        return num, title, quote, advice.strip().replace('\n', ' '), verse_text.strip(), reference.strip()
+    if kind == 'advice':
+        num, title, advice, refs = entry
+        return num, title.strip(), advice.strip().replace('\n', ' '), refs.strip().replace('\n', ' ')
+    title, advice, refs = entry
+    return title.strip(), advice.strip().replace('\n', ' '), refs.strip()
+
+
+def sentence(rng, n=None):
+    words = rng.choices(WORDS, k=n or rng.randint(2, 8))
+    return ' '.join(words).capitalize()
+
+
+def reference(rng):
+    return f"{rng.choice(BOOKS)} {rng.randint(1, 150)}:{rng.randint(1, 30)}"
+
+
+def random_document(rng, kind):
+    """A well-formed file of the given format"""
+    lines = [sentence(rng).upper(), '']
+    for num in range(1, rng.randint(1, 12) + 1):
+        advice = [sentence(rng) for _ in range(rng.randint(1, 3))]
+        if kind == 'numbered':
+            lines += [f"{num}. {sentence(rng)}", f'"{sentence(rng)}."',
+                      f"Advice: {advice[0]}", *advice[1:],
+                      f'Scripture Reference: "{sentence(rng)}" — {reference(rng)}']
+        elif kind == 'advice':
+            label = rng.choice(('advice:', 'Advice:', 'ADVICE:'))
+            refs = [', '.join(reference(rng) for _ in range(rng.randint(1, 3)))
+                    for _ in range(rng.randint(1, 2))]
+            lines += [f"{num}) {sentence(rng)}", f"{label} {advice[0]}", *advice[1:],
+                      f"Bible: {refs[0]}", *refs[1:]]
+        else:
+            emoji = rng.choice(('🕰️', '✝️', '🌍', '📖', '💡', '❤️', '🤝', '🙏', '🌅'))
+            lines += [f"{emoji} {num}. {sentence(rng)}", 'Advice:', *advice, 'Bible References:',
+                      *[f'"{sentence(rng)}" — {reference(rng)}' for _ in range(rng.randint(1, 2))]]
+        if rng.random() < 0.5:
+            lines.append('')
+    return '\n'.join(lines) + '\n'
+
+
+def check_equivalence(cases, seed):
+    rng = random.Random(seed)
+    failures = 0
+    for kind, pattern in LEGACY_PATTERNS.items():
+        for _ in range(cases):
+            content = random_document(rng, kind)
+            expected = [normalize(kind, m.groups()) for m in pattern.finditer(content)]
+            actual = [normalize(kind, entry) for entry in PARSERS[kind](content)]
+            if expected != actual:
+                failures += 1
+                if failures <= 3:
+                    print(f"   ❌ {kind} mismatch:\n{content}\n   expected {expected}\n   got      {actual}")
+        print(f"  ✓ {kind}: {cases} random files")
+    return failures == 0
+
+
+def adversarial_inputs(size):
+    """name -> text of roughly size characters, built to make backtracking regexes blow up"""
+    def fill(unit):
+        return unit * (size // len(unit) + 1)
+
+    return {
+        'long numbered header line': fill('1.'),
+        'long advice header line': fill('1)'),
+        'long emoji header line': fill('🌍1.'),
+        'unterminated quote': '1. Title\n"' + fill('grace and peace\n'),
+        'advice without scripture': '1. Title\n"Quote"\nAdvice: ' + fill('grace and peace\n'),
+        'headers without bodies': fill('1. Title\n2) Title\n🙏 3. Title\n'),
+        'label soup': fill('Advice:\nBible:\nBible References:\nScripture\n"\n1) x\n'),
+        'one giant line': fill('grace peace hope "mercy" — '),
+    }
+
+
+def parse_all(content):
+    for parser in PARSERS.values():
+        for _ in parser(content):
+            pass
+    for extractor in (cpg.extract_numbered_points, cpg.extract_advice_format, cpg.extract_heading_format):
+        extractor(content, 'fuzz')
+    cpg.detect_format(content)
+
+
+def timed(content, repeat):
+    """Best of `repeat` runs: the least disturbed by scheduling and GC noise"""
+    return min(timeit.repeat(lambda: parse_all(content), number=1, repeat=repeat))
+
+
+def check_performance(size_mb, budget, repeat):
+    size = int(size_mb * 1024 * 1024)
+    quarter = adversarial_inputs(size // 4)
+    full = adversarial_inputs(size)
+
+    ok = True
+    for name in full:
+        small_time = timed(quarter[name], repeat)
+        full_time = timed(full[name], repeat)
+        ratio = full_time / small_time if small_time > 0 else 0.0
+
+        # Linear input growth (4x) may cost at most 8x; below MIN_SCALING_SECONDS
+        # the quarter-size run is too short for its ratio to mean anything
+        too_slow = full_time > budget * size_mb
+        superlinear = full_time > MIN_SCALING_SECONDS and ratio > 8
+        status = "❌" if too_slow or superlinear else "✓"
+        ok &= status == "✓"
+        print(f"  {status} {name}: {full_time:.3f}s for {size_mb:g}MB (x{ratio:.1f} from {size_mb / 4:g}MB)")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fuzz and time the pastoral guidance parsers")
+    parser.add_argument('--cases', type=int, default=300, help="Random files per format")
+    parser.add_argument('--size-mb', type=float, default=4, help="Adversarial input size")
+    parser.add_argument('--budget', type=float, default=1.0, help="Allowed seconds per MB")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per input (best is kept)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    print("🔍 Comparing line parsers with the original patterns...")
+    equivalent = check_equivalence(args.cases, args.seed)
+
+    print(f"\n⏱️  Adversarial inputs ({args.size_mb:g}MB, budget {args.budget:g}s/MB)...")
+    fast = check_performance(args.size_mb, args.budget, args.repeat)
+
+    if equivalent and fast:
+        print("\n✅ All parser checks passed")
+        return 0
+    print("\n❌ Parser checks failed")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Word-level Aho-Corasick matcher for keyword and phrase lists
+Scans a text once and reports every hit of every keyword in every group
+
+Keywords match whole words only, so 'no' does not hit 'know' or 'nothing'
+and 'war' does not hit 'toward'. Keyword words and text words are both
+reduced with stem(), so inflections meet on a shared stem ('forgiveness',
+'forgiving' and 'forgive'; 'burdens' and 'burden'); pass stemming=False for
+exact words. Phrases ('fear not', 'perfect love casts out fear') match as
+consecutive words, ignoring punctuation between them.
+
+Shared by map_themes_to_verses.py and other corpus-scanning scripts:
+
+    matcher = KeywordMatcher({'peace': ['peace', 'fear not'], ...})
+    matcher.scan("Fear not, for I am with you")
+    # {'peace': Counter({'fear not': 1})}
+"""
+
+import re
+from collections import Counter, deque
+
+TOKEN_RE = re.compile(r"[a-z0-9']+")
+
+# Inflectional suffixes, longest first. A suffix is only removed when at
+# least MIN_STEM_LENGTH letters remain, so 'god', 'nod', 'ward' and 'warn'
+# never shrink onto 'go', 'no' or 'war'
+INFLECTION_SUFFIXES = (
+    'fulness', 'fully', 'ments', 'ings', 'ness', 'ment', 'ing', 'ful',
+    'ies', 'ied', 'es', 'ed', 'ly', 's',
+)
+MIN_STEM_LENGTH = 3
+
+# Words whose ending only looks like an inflection
+STEM_EXCLUSIONS = frozenset({
+    'news', 'witness', 'early', 'evening', 'always', 'during', 'bless',
+})
+
+# Irregular and agentive forms the suffix rules cannot reach
+IRREGULAR_FORMS = {
+    'forgiven': 'forgive', 'given': 'give', 'gave': 'give',
+    'children': 'child', 'men': 'man', 'women': 'woman',
+    'prayer': 'pray', 'prayers': 'pray',
+    'believer': 'believe', 'believers': 'believe',
+    'sinner': 'sin', 'sinners': 'sin',
+    'broken': 'break', 'chosen': 'choose', 'fallen': 'fall', 'risen': 'rise',
+    'spoken': 'speak', 'spoke': 'speak', 'taught': 'teach', 'sought': 'seek',
+    'brought': 'bring', 'fought': 'fight', 'kept': 'keep', 'wept': 'weep',
+    'slept': 'sleep', 'felt': 'feel', 'fled': 'flee',
+    'died': 'die', 'dies': 'die', 'dying': 'die',
+}
+
+
+def tokenize(text):
+    """Lowercase word tokens"""
+    return TOKEN_RE.findall(text.lower())
+
+
+def _normalize_stem(stem):
+    # 'sinn' (sinned) -> 'sin'; 'love' / 'loved' -> 'lov'
+    if len(stem) > MIN_STEM_LENGTH and stem[-1] == stem[-2] and stem[-1] not in 'lsz':
+        stem = stem[:-1]
+    if len(stem) > MIN_STEM_LENGTH and stem.endswith('e'):
+        stem = stem[:-1]
+    return stem
+
+
+def stem(word):
+    """Light inflectional stem of a lowercase word"""
+    word = IRREGULAR_FORMS.get(word, word)
+    if word in STEM_EXCLUSIONS or len(word) <= MIN_STEM_LENGTH:
+        return word
+
+    for suffix in INFLECTION_SUFFIXES:
+        if not word.endswith(suffix) or len(word) - len(suffix) < MIN_STEM_LENGTH:
+            continue
+        base = word[:-len(suffix)]
+        if suffix == 's' and base[-1] in 'siu':
+            # 'bless', 'righteous', 'this'
+            continue
+        if suffix in ('ies', 'ied'):
+            return base + 'y'
+        return _normalize_stem(base)
+
+    return _normalize_stem(word)
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton whose alphabet is words rather than characters
+
+    groups maps a label (e.g. a theme) to its keywords; a keyword may
+    belong to several groups and is matched only once per position.
+    """
+
+    def __init__(self, groups, stemming=True):
+        self.stemming = stemming
+        self.groups_of = {}
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+        self._canonical = {}
+
+        for label, keywords in groups.items():
+            for keyword in keywords:
+                if keyword not in self.groups_of:
+                    self.groups_of[keyword] = []
+                    self._add(keyword)
+                if label not in self.groups_of[keyword]:
+                    self.groups_of[keyword].append(label)
+
+        self._build_failure_links()
+
+    @property
+    def keywords(self):
+        return list(self.groups_of)
+
+    def _add(self, keyword):
+        words = [self.canonical(word) for word in tokenize(keyword)]
+        if not words:
+            return
+
+        state = 0
+        for word in words:
+            if word not in self._goto[state]:
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][word] = len(self._goto) - 1
+            state = self._goto[state][word]
+        self._out[state].append((keyword, len(words)))
+
+    def _build_failure_links(self):
+        # Depth-1 states fail to the root; deeper ones are filled breadth-first
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for word, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(word, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def canonical(self, token):
+        """Stem a word the same way for keywords and text (memoized)"""
+        word = self._canonical.get(token)
+        if word is None:
+            word = stem(token) if self.stemming else token
+            self._canonical[token] = word
+        return word
+
+    def iter_hits(self, tokens):
+        """Yield (keyword, start, end) token spans for a tokenized text"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for position, token in enumerate(tokens):
+            word = self.canonical(token)
+            while state and word not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(word, 0)
+            for keyword, length in out[state]:
+                yield keyword, position - length + 1, position + 1
+
+    def count_keywords(self, text):
+        """Counter of keyword -> hits in text"""
+        return Counter(keyword for keyword, _, _ in self.iter_hits(tokenize(text)))
+
+    def scan(self, text):
+        """label -> Counter(keyword -> hits) for every group hit in text"""
+        hits = {}
+        for keyword, count in self.count_keywords(text).items():
+            for label in self.groups_of[keyword]:
+                hits.setdefault(label, Counter())[keyword] = count
+        return hits
@@ -1,10 +1,11 @@
 #!/bin/bash
-# Automated Spanish Localization Script for Everyday Christian App
+# Automated Localization Script for Everyday Christian App
+# Spanish by default; pass --locales es,pt,fr for more languages
 # Uses Claude Code session credentials via Anthropic Agent SDK
 
 set -e  # Exit on error
 
-echo "🌍 Starting Spanish Localization Automation..."
+echo "🌍 Starting Localization Automation..."
 echo ""
 
 # Check if Python 3 is installed
@@ -22,14 +23,35 @@ fi
 # Navigate to project root
 cd "$(dirname "$0")/.."
 
+# Target locales, as localize_agent.py reads them (default: es)
+LOCALES="es"
+ARGS=("$@")
+for i in "${!ARGS[@]}"; do
+    case "${ARGS[$i]}" in
+        --locales=*) LOCALES="${ARGS[$i]#--locales=}" ;;
+        --locales) LOCALES="${ARGS[$((i + 1))]}" ;;
+    esac
+done
+IFS=',' read -r -a LOCALE_LIST <<< "${LOCALES// /}"
+
 # Run the localization agent
 echo "🤖 Running localization agent..."
-python3 scripts/localize_agent.py
+python3 scripts/localize_agent.py "$@"
+
+# Check that every requested ARB file was created
+ARB_FILES=("lib/l10n/app_en.arb")
+for locale in "${LOCALE_LIST[@]}"; do
+    ARB_FILES+=("lib/l10n/app_${locale}.arb")
+done
+MISSING=()
+for arb in "${ARB_FILES[@]}"; do
+    [ -f "$arb" ] || MISSING+=("$arb")
+done
 
-# Check if ARB files were created
-if [ -f "lib/l10n/app_en.arb" ] && [ -f "lib/l10n/app_es.arb" ]; then
+if [ ${#MISSING[@]} -eq 0 ]; then
     echo ""
-    echo "✅ Localization files generated successfully!"
+    echo "✅ Localization files generated successfully:"
+    printf '   %s\n' "${ARB_FILES[@]}"
     echo ""
 
     # Ask user if they want to commit
@@ -42,11 +64,16 @@ if [ -f "lib/l10n/app_en.arb" ] && [ -f "lib/l10n/app_es.arb" ]; then
         git add l10n.yaml
 
         # Commit with descriptive message
-        git commit -m "🌍 Add Spanish localization via AI agent
+        GENERATED=""
+        for locale in "${LOCALE_LIST[@]}"; do
+            GENERATED+="- Generated app_${locale}.arb with AI-translated ${locale} strings
+"
+        done
+
+        git commit -m "🌍 Add ${LOCALES} localization via AI agent
 
 - Generated app_en.arb with extracted English strings
-- Generated app_es.arb with AI-translated Spanish strings
-- Created l10n.yaml configuration for Flutter localization
+${GENERATED}- Created l10n.yaml configuration for Flutter localization
 - Ready for flutter gen-l10n to generate localization code
 
 🤖 Generated with Claude Code Localization Agent
@@ -63,13 +90,14 @@ Co-Authored-By: Claude <noreply@anthropic.com>"
         echo "📝 Next steps:"
         echo "   1. Add 'generate: true' to pubspec.yaml"
         echo "   2. Run: flutter gen-l10n"
-        echo "   3. Test the app in both languages"
+        echo "   3. Test the app in English and: ${LOCALES}"
     else
         echo ""
         echo "⏸️  Changes staged but not committed"
         echo "   Run 'git status' to see changes"
     fi
 else
-    echo "❌ Localization failed - ARB files not created"
+    echo "❌ Localization failed - ARB files not created:"
+    printf '   %s\n' "${MISSING[@]}"
     exit 1
 fi
@@ -1,33 +1,408 @@
 #!/usr/bin/env python3
 """
-Spanish Localization Agent for Everyday Christian App
+Localization Agent for Everyday Christian App
 Uses Claude Code session credentials for AI-powered translation
+
+Spanish by default; --locales es,pt,fr scans the project and generates
+keys once, then translates every locale concurrently through one shared
+translation memory and request budget, and writes all ARB files together.
+
+Translations are kept in a persistent translation memory (SQLite, keyed by
+source-string hash, locale and prompt version), seeded from existing ARB
+files, so a rerun only sends strings that were never translated before.
+
+Misses are split into token-budgeted chunks and translated concurrently
+(bounded by --concurrency, with retry and exponential backoff). Every
+chunk is written to the translation memory as soon as it completes, so an
+interrupted run resumes where it stopped.
+
+Dart files are read by a small lexer (comments, raw / triple-quoted
+strings, ${} interpolation, import directives) in a process pool, with
+per-file results cached on mtime and size, so rescanning an unchanged
+tree only stats the files.
 """
 
-import os
+import argparse
+import asyncio
+import hashlib
 import json
+import os
+import random
 import re
+import sqlite3
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 try:
-    from anthropic import Anthropic
+    from anthropic import AsyncAnthropic
 except ImportError:
     print("❌ Error: anthropic package not installed")
     print("Install it with: pip install anthropic")
     sys.exit(1)
 
 
+TRANSLATION_MEMORY_PATH = Path(__file__).parent / ".cache/translation_memory.db"
+SCAN_CACHE_PATH = Path(__file__).parent / ".cache/dart_strings_cache.json"
+STRING_SOURCES_PATH = Path(__file__).parent / ".cache/string_sources.json"
+
+# Bump when the lexer or the UI-string filter changes so cached scans are redone
+LEXER_VERSION = 1
+# Fewer changed files than this are lexed in-process; a pool would cost more to start
+PARALLEL_MIN_FILES = 200
+
+# Bump when the translation prompt or model changes so old entries are not reused
+PROMPT_VERSION = 1
+MODEL = "claude-sonnet-4-20250514"
+# Source hashes per translation-memory query (SQLite caps bound parameters)
+LOOKUP_BATCH_SIZE = 500
+
+# Chunking keeps every response well inside max_tokens (~4 characters per token)
+CHUNK_TOKEN_BUDGET = 1500
+MAX_TOKENS = 4096
+DEFAULT_CONCURRENCY = 4
+MAX_ATTEMPTS = 4
+BACKOFF_SECONDS = 1.0
+
+# locale -> (language name, prompt guidelines specific to that language)
+LANGUAGES = {
+    'es': ('Spanish', [
+        'Use formal "usted" form for user-facing text',
+        'Keep religious terms accurate (e.g., "prayer" = "oración", "Bible" = "Biblia")',
+    ]),
+    'pt': ('Portuguese', [
+        'Use "você" with a respectful tone for user-facing text',
+        'Keep religious terms accurate (e.g., "prayer" = "oração", "Bible" = "Bíblia")',
+    ]),
+    'fr': ('French', [
+        'Use formal "vous" form for user-facing text',
+        'Keep religious terms accurate (e.g., "prayer" = "prière", "Bible" = "Bible")',
+    ]),
+    'de': ('German', [
+        'Use formal "Sie" form for user-facing text',
+        'Keep religious terms accurate (e.g., "prayer" = "Gebet", "Bible" = "Bibel")',
+    ]),
+    'it': ('Italian', [
+        'Use a warm, respectful register for user-facing text',
+        'Keep religious terms accurate (e.g., "prayer" = "preghiera", "Bible" = "Bibbia")',
+    ]),
+}
+
+
+def source_hash(text: str) -> str:
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TranslationMemory:
+    """Persistent (source hash, locale, prompt version) -> translation store"""
+
+    def __init__(self, path: Path = TRANSLATION_MEMORY_PATH, prompt_version: int = PROMPT_VERSION):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.prompt_version = prompt_version
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS translations (
+                source_hash TEXT NOT NULL,
+                locale TEXT NOT NULL,
+                prompt_version INTEGER NOT NULL,
+                source TEXT NOT NULL,
+                translation TEXT NOT NULL,
+                PRIMARY KEY (source_hash, locale, prompt_version)
+            ) WITHOUT ROWID
+        ''')
+
+    def lookup(self, strings: Dict[str, str], locale: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Split key -> source into (key -> cached translation, key -> untranslated source)"""
+        hashes = {key: source_hash(source) for key, source in strings.items()}
+        unique = sorted(set(hashes.values()))
+        cached = {}
+        for i in range(0, len(unique), LOOKUP_BATCH_SIZE):
+            batch = unique[i:i + LOOKUP_BATCH_SIZE]
+            cached.update(self.conn.execute(
+                f'SELECT source_hash, translation FROM translations '
+                f'WHERE locale = ? AND prompt_version = ? '
+                f'AND source_hash IN ({",".join("?" * len(batch))})',
+                (locale, self.prompt_version, *batch)
+            ))
+
+        hits, misses = {}, {}
+        for key, source in strings.items():
+            if hashes[key] in cached:
+                hits[key] = cached[hashes[key]]
+            else:
+                misses[key] = source
+        return hits, misses
+
+    def store(self, pairs: Iterable[Tuple[str, str]], locale: str, replace: bool = True):
+        """Record (source, translation) pairs; replace=False keeps existing entries"""
+        verb = 'INSERT OR REPLACE' if replace else 'INSERT OR IGNORE'
+        self.conn.executemany(
+            f'{verb} INTO translations (source_hash, locale, prompt_version, source, translation) '
+            f'VALUES (?, ?, ?, ?, ?)',
+            [(source_hash(source), locale, self.prompt_version, source, translation)
+             for source, translation in pairs]
+        )
+        self.conn.commit()
+
+    def seed_from_arb(self, source_arb: Path, target_arb: Path, locale: str) -> int:
+        """
+        Import the entries of a previously generated ARB pair verbatim
+        Only done while the memory has nothing for the locale: once it does,
+        the ARB was written from the memory, possibly under an older prompt
+        version, and importing it would relabel those entries as current
+        """
+        if not source_arb.exists() or not target_arb.exists():
+            return 0
+        if self.conn.execute('SELECT 1 FROM translations WHERE locale = ? LIMIT 1',
+                             (locale,)).fetchone():
+            return 0
+        with open(source_arb, 'r', encoding='utf-8') as f:
+            sources = json.load(f)
+        with open(target_arb, 'r', encoding='utf-8') as f:
+            targets = json.load(f)
+
+        pairs = [
+            (source, targets[key]) for key, source in sources.items()
+            if not key.startswith('@') and isinstance(targets.get(key), str)
+        ]
+        before = self.conn.total_changes
+        self.store(pairs, locale, replace=False)
+        return self.conn.total_changes - before
+
+    def close(self):
+        self.conn.close()
+
+
+# Code-level tokens the lexer stops at; everything else is skipped in one search
+DART_CODE_RE = re.compile(
+    r"//|/\*|[{};]|^[ \t]*(?:import|export|part|library)\b|(?<![\w$])r?(?:'''|\"\"\"|'|\")",
+    re.MULTILINE
+)
+DART_BLOCK_COMMENT_RE = re.compile(r'/\*|\*/')
+NON_UI_STRINGS = frozenset(['id', 'name', 'text', 'title', 'value', 'key'])
+
+
+def _string_body_re(quote: str, raw: bool) -> re.Pattern:
+    """What ends or interrupts a string body: the quote, an escape, ${, or a newline"""
+    parts = [re.escape(quote)]
+    if not raw:
+        parts += [r'\\.', r'\$\{']
+    if len(quote) == 1:
+        parts.append(r'\n')
+    return re.compile('|'.join(parts), re.DOTALL)
+
+
+STRING_BODY_RES = {
+    (quote, raw): _string_body_re(quote, raw)
+    for quote in ("'", '"', "'''", '"""') for raw in (False, True)
+}
+
+
+def _skip_block_comment(content: str, pos: int) -> int:
+    """Position after a (possibly nested) block comment whose /* ends at pos"""
+    depth = 1
+    for match in DART_BLOCK_COMMENT_RE.finditer(content, pos):
+        depth += 1 if match.group() == '/*' else -1
+        if depth == 0:
+            return match.end()
+    return len(content)
+
+
+def lex_dart_strings(content: str) -> List[Tuple[str, int]]:
+    """
+    (literal source text, line) for every string literal in a Dart file
+    Skips comments and import/export/part/library directives; strings nested
+    inside ${} interpolations are reported as literals of their own
+    """
+    strings = []
+    # Frames: ['code', open braces] or ['string', quote, raw, body start, line]
+    stack = [['code', 0]]
+    directive = False
+    pos, line, counted = 0, 1, 0
+
+    def line_at(offset):
+        nonlocal line, counted
+        line += content.count('\n', counted, offset)
+        counted = offset
+        return line
+
+    while True:
+        frame = stack[-1]
+        if frame[0] == 'code':
+            match = DART_CODE_RE.search(content, pos)
+            if match is None:
+                break
+            token = match.group()
+            pos = match.end()
+            if token == '//':
+                newline = content.find('\n', pos)
+                pos = len(content) if newline < 0 else newline
+            elif token == '/*':
+                pos = _skip_block_comment(content, pos)
+            elif token == '{':
+                frame[1] += 1
+            elif token == '}':
+                if frame[1]:
+                    frame[1] -= 1
+                elif len(stack) > 1:
+                    stack.pop()  # end of ${...}, back inside the string
+            elif token == ';':
+                directive = False
+            elif token[-1] not in '\'"':
+                directive = len(stack) == 1
+            else:
+                raw = token[0] == 'r'
+                stack.append(['string', token[1:] if raw else token, raw, pos, line_at(match.start())])
+        else:
+            _, quote, raw, start, start_line = frame
+            match = STRING_BODY_RES[quote, raw].search(content, pos)
+            if match is None:
+                break  # unterminated string at end of file
+            token = match.group()
+            pos = match.end()
+            if token == '${':
+                stack.append(['code', 0])
+            elif token == quote:
+                stack.pop()
+                if not directive:
+                    strings.append((content[start:match.start()], start_line))
+            elif token == '\n':
+                stack.pop()  # unterminated single-line string: resume as code
+    return strings
+
+
+def is_ui_string(text: str) -> bool:
+    """Heuristic: does a literal look like user-facing text rather than code?"""
+    # Skip empty, very short, or code-like strings
+    if len(text) < 2 or text.startswith('assets/') or text.startswith('lib/'):
+        return False
+    # Skip common code patterns
+    if text in NON_UI_STRINGS:
+        return False
+    # Keep strings that look like UI text
+    return any(c.isalpha() for c in text) and ' ' in text or len(text) > 10
+
+
+def extract_dart_strings(path: str) -> List[Tuple[str, int]]:
+    """(UI string, line) pairs of one Dart file; module-level so a process pool can run it"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"⚠️  Error reading {path}: {e}")
+        return []
+    return [(text, line) for text, line in lex_dart_strings(content) if is_ui_string(text)]
+
+
+def load_scan_cache(path: Path) -> Dict[str, dict]:
+    """path -> {'mtime_ns', 'size', 'strings'} from the last scan, if the lexer is unchanged"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache.get('files', {}) if cache.get('version') == LEXER_VERSION else {}
+
+
+def save_scan_cache(path: Path, files: Dict[str, dict]):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': LEXER_VERSION, 'files': files}, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def chunk_strings(strings: Dict[str, str], token_budget: int = CHUNK_TOKEN_BUDGET) -> List[Dict[str, str]]:
+    """Split key -> source into chunks whose JSON stays under token_budget"""
+    chunks, current, used = [], {}, 0
+    for key, value in strings.items():
+        cost = estimate_tokens(json.dumps({key: value}, ensure_ascii=False))
+        if current and used + cost > token_budget:
+            chunks.append(current)
+            current, used = {}, 0
+        current[key] = value
+        used += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def build_translation_prompt(strings: Dict[str, str], locale: str = 'es') -> str:
+    language, guidelines = LANGUAGES[locale]
+    strings_json = json.dumps(strings, indent=2, ensure_ascii=False)
+    language_guidelines = ''.join(f"- {line}\n" for line in guidelines)
+
+    return f"""You are translating a Christian mobile app interface from English to {language}.
+
+Please translate the following JSON object containing UI strings. The keys should remain in English, but translate all the values to natural, conversational {language} appropriate for a faith-based application.
+
+Important guidelines:
+{language_guidelines}- Maintain any formatting like {{variable}} placeholders
+- Keep button text concise
+- Use natural {language} phrasing, not literal translations
+
+English strings to translate:
+{strings_json}
+
+Return ONLY a valid JSON object with the same keys but {language} values. Do not include any explanations or markdown formatting."""
+
+
+def parse_translation(text: str) -> Dict[str, str]:
+    """JSON object from a model response, tolerating markdown code fences"""
+    text = re.sub(r'```json\n?', '', text.strip())
+    text = re.sub(r'```\n?', '', text)
+    translated = json.loads(text)
+    if not isinstance(translated, dict):
+        raise ValueError("translation response is not a JSON object")
+    return translated
+
+
+class AnthropicTranslationClient:
+    """
+    Async completion client backed by the Anthropic API
+
+    Any object with the same `complete` coroutine can be passed to
+    LocalizationAgent instead, e.g. a client for a local stub server.
+    """
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        self.client = AsyncAnthropic(api_key=api_key, base_url=base_url)
+
+    async def complete(self, prompt: str, max_tokens: int) -> str:
+        response = await self.client.messages.create(
+            model=MODEL,
+            max_tokens=max_tokens,
+            messages=[{
+                "role": "user",
+                "content": prompt
+            }]
+        )
+        return response.content[0].text
+
+
 class LocalizationAgent:
-    def __init__(self):
+    def __init__(self, refresh: bool = False, concurrency: int = DEFAULT_CONCURRENCY,
+                 chunk_tokens: int = CHUNK_TOKEN_BUDGET, client=None, workers: Optional[int] = None):
         self.project_root = Path(__file__).parent.parent
         self.lib_dir = self.project_root / "lib"
         self.l10n_dir = self.project_root / "lib" / "l10n"
         self.extracted_strings: Dict[str, str] = {}
-        self.client = self._init_anthropic_client()
-
-    def _init_anthropic_client(self) -> Anthropic:
+        # English string -> ["lib/path.dart:line", ...]
+        self.string_locations: Dict[str, List[str]] = {}
+        self.workers = workers
+        self.client = client or self._init_anthropic_client()
+        self.memory = TranslationMemory()
+        self.refresh = refresh
+        self.concurrency = concurrency
+        self.chunk_tokens = chunk_tokens
+
+    def _init_anthropic_client(self) -> AnthropicTranslationClient:
         """Initialize Anthropic client using API key from environment"""
         # Check for API key in environment
         api_key = os.getenv('ANTHROPIC_API_KEY')
@@ -44,52 +419,49 @@ class LocalizationAgent:
             sys.exit(1)
 
         print("✅ Using ANTHROPIC_API_KEY from environment")
-        return Anthropic(api_key=api_key)
+        return AnthropicTranslationClient(api_key, os.getenv('ANTHROPIC_BASE_URL'))
 
     def extract_strings_from_file(self, file_path: Path) -> Set[str]:
         """Extract hardcoded English strings from a Dart file"""
-        strings = set()
-
-        try:
-            content = file_path.read_text(encoding='utf-8')
-
-            # Pattern for single-quoted strings
-            single_quoted = re.findall(r"'([^'\\]*(?:\\.[^'\\]*)*)'", content)
-            strings.update(single_quoted)
-
-            # Pattern for double-quoted strings
-            double_quoted = re.findall(r'"([^"\\]*(?:\\.[^"\\]*)*)"', content)
-            strings.update(double_quoted)
-
-        except Exception as e:
-            print(f"⚠️  Error reading {file_path}: {e}")
-
-        # Filter out non-UI strings
-        filtered = set()
-        for s in strings:
-            # Skip empty, very short, or code-like strings
-            if len(s) < 2 or s.startswith('assets/') or s.startswith('lib/'):
-                continue
-            # Skip common code patterns
-            if s in ['id', 'name', 'text', 'title', 'value', 'key']:
-                continue
-            # Keep strings that look like UI text
-            if any(c.isalpha() for c in s) and ' ' in s or len(s) > 10:
-                filtered.add(s)
-
-        return filtered
+        return {text for text, _ in extract_dart_strings(str(file_path))}
 
     def scan_project(self):
         """Scan all Dart files in the project for strings"""
         print(f"\n🔍 Scanning project: {self.project_root}")
 
-        dart_files = list(self.lib_dir.rglob("*.dart"))
+        dart_files = sorted(self.lib_dir.rglob("*.dart"))
         print(f"📁 Found {len(dart_files)} Dart files")
 
-        all_strings = set()
+        # Reuse cached results for files whose mtime and size are unchanged
+        cache = {} if self.refresh else load_scan_cache(SCAN_CACHE_PATH)
+        files, changed = {}, []
         for dart_file in dart_files:
-            strings = self.extract_strings_from_file(dart_file)
-            all_strings.update(strings)
+            stat = dart_file.stat()
+            entry = cache.get(str(dart_file))
+            if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                files[str(dart_file)] = entry
+            else:
+                files[str(dart_file)] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+                changed.append(str(dart_file))
+
+        if len(changed) >= PARALLEL_MIN_FILES and self.workers != 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(extract_dart_strings, changed, chunksize=8))
+        else:
+            results = [extract_dart_strings(path) for path in changed]
+        for path, strings in zip(changed, results):
+            files[path]['strings'] = strings
+        print(f"⚡ Lexed {len(changed)} changed files, {len(dart_files) - len(changed)} from cache")
+        dirty = bool(changed) or files.keys() != cache.keys() or not STRING_SOURCES_PATH.exists()
+        if dirty:
+            save_scan_cache(SCAN_CACHE_PATH, files)
+
+        self.string_locations = {}
+        for path, entry in files.items():
+            relative = os.path.relpath(path, self.project_root)
+            for text, line in entry['strings']:
+                self.string_locations.setdefault(text, []).append(f"{relative}:{line}")
+        all_strings = set(self.string_locations)
 
         print(f"📝 Extracted {len(all_strings)} unique strings")
 
@@ -99,6 +471,13 @@ class LocalizationAgent:
             key = self._generate_key(string, i)
             self.extracted_strings[key] = string
 
+        # Keys depend only on the strings, so an unchanged scan leaves this report valid
+        if dirty:
+            with open(STRING_SOURCES_PATH, 'w', encoding='utf-8') as f:
+                json.dump({key: {'text': string, 'locations': self.string_locations[string]}
+                           for key, string in self.extracted_strings.items()}, f, indent=2, ensure_ascii=False)
+        print(f"📍 String locations: {STRING_SOURCES_PATH}")
+
         return self.extracted_strings
 
     def _generate_key(self, string: str, index: int) -> str:
@@ -117,92 +496,127 @@ class LocalizationAgent:
         return f"{key}{index}" if len(key) < 5 else key
 
     def translate_to_spanish(self, strings: Dict[str, str]) -> Dict[str, str]:
-        """Use Claude to translate strings to Spanish"""
-        print(f"\n🤖 Translating {len(strings)} strings to Spanish using Claude...")
-
-        # Prepare strings for translation
-        strings_json = json.dumps(strings, indent=2, ensure_ascii=False)
-
-        prompt = f"""You are translating a Christian mobile app interface from English to Spanish.
-
-Please translate the following JSON object containing UI strings. The keys should remain in English, but translate all the values to natural, conversational Spanish appropriate for a faith-based application.
-
-Important guidelines:
-- Use formal "usted" form for user-facing text
-- Keep religious terms accurate (e.g., "prayer" = "oración", "Bible" = "Biblia")
-- Maintain any formatting like {{variable}} placeholders
-- Keep button text concise
-- Use natural Spanish phrasing, not literal translations
-
-English strings to translate:
-{strings_json}
-
-Return ONLY a valid JSON object with the same keys but Spanish values. Do not include any explanations or markdown formatting."""
-
-        try:
-            response = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
-
-            spanish_json = response.content[0].text.strip()
-
-            # Remove markdown code blocks if present
-            spanish_json = re.sub(r'```json\n?', '', spanish_json)
-            spanish_json = re.sub(r'```\n?', '', spanish_json)
-
-            spanish_strings = json.loads(spanish_json)
-            print(f"✅ Translation complete: {len(spanish_strings)} strings translated")
-            return spanish_strings
-
-        except Exception as e:
-            print(f"❌ Translation error: {e}")
+        """Translate strings to Spanish, sending only translation-memory misses to Claude"""
+        return self.translate(strings, ['es'])['es']
+
+    def translate(self, strings: Dict[str, str], locales: List[str]) -> Dict[str, Dict[str, str]]:
+        """
+        Translate strings into every locale, sending only translation-memory misses
+        Returns locale -> key -> translation
+        """
+        results: Dict[str, Dict[str, str]] = {}
+        pending: Dict[str, Dict[str, str]] = {}
+        for locale in locales:
+            language = LANGUAGES[locale][0]
+            if self.refresh:
+                cached, misses = {}, dict(strings)
+            else:
+                arb_path = self.l10n_dir / f"app_{locale}.arb"
+                seeded = self.memory.seed_from_arb(self.l10n_dir / "app_en.arb", arb_path, locale)
+                if seeded:
+                    print(f"\n📚 Imported {seeded} existing translations from {arb_path.name}")
+                cached, misses = self.memory.lookup(strings, locale)
+            print(f"💾 {language} ({locale}): {len(cached)} cached, {len(misses)} to translate")
+            results[locale] = cached
+            if misses:
+                pending[locale] = misses
+
+        translated: Dict[str, Dict[str, str]] = {}
+        if pending:
+            translated = asyncio.run(self._translate_locales(pending))
+            for locale, misses in pending.items():
+                results[locale].update(translated[locale])
+
+        failed = {locale: len(misses) - len(translated[locale]) for locale, misses in pending.items()
+                  if len(translated[locale]) < len(misses)}
+        if failed:
+            summary = ', '.join(f"{count} {locale}" for locale, count in failed.items())
+            print(f"❌ Strings could not be translated ({summary}); rerun to retry them")
             sys.exit(1)
 
-    def generate_arb_files(self, english: Dict[str, str], spanish: Dict[str, str]):
-        """Generate ARB files for Flutter localization"""
+        return {
+            locale: {key: merged[key] for key in strings if key in merged}
+            for locale, merged in results.items()
+        }
+
+    async def _translate_locales(self, pending: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
+        """Fan every locale's chunks out under one shared concurrency budget"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        start = time.perf_counter()
+        translated = await asyncio.gather(*(
+            self._translate_chunks(misses, locale, semaphore) for locale, misses in pending.items()
+        ))
+        total = sum(len(result) for result in translated)
+        print(f"✅ Translation complete: {total} strings in {time.perf_counter() - start:.1f}s")
+        return dict(zip(pending, translated))
+
+    async def _translate_chunks(self, strings: Dict[str, str], locale: str,
+                                semaphore: asyncio.Semaphore) -> Dict[str, str]:
+        """Translate one locale's token-budgeted chunks, checkpointing each one"""
+        chunks = chunk_strings(strings, self.chunk_tokens)
+        print(f"🤖 Translating {len(strings)} strings to {LANGUAGES[locale][0]} in {len(chunks)} chunks "
+              f"(concurrency {self.concurrency})...")
+        translated: Dict[str, str] = {}
+
+        async def translate_chunk(number: int, chunk: Dict[str, str]):
+            async with semaphore:
+                result = await self._request_chunk(chunk, locale)
+            if result is None:
+                print(f"   ❌ {locale} chunk {number}/{len(chunks)} failed after {MAX_ATTEMPTS} attempts")
+                return
+            # Checkpoint: completed chunks survive a crash or a failed sibling
+            self.memory.store(((chunk[key], value) for key, value in result.items()), locale)
+            translated.update(result)
+            print(f"   ✓ {locale} chunk {number}/{len(chunks)}: {len(result)} strings")
+
+        await asyncio.gather(*(translate_chunk(i, chunk) for i, chunk in enumerate(chunks, 1)))
+        return translated
+
+    async def _request_chunk(self, chunk: Dict[str, str], locale: str) -> Optional[Dict[str, str]]:
+        """One chunk's translations (only keys that were asked for), or None after MAX_ATTEMPTS"""
+        prompt = build_translation_prompt(chunk, locale)
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                response = await self.client.complete(prompt, MAX_TOKENS)
+                result = {key: value for key, value in parse_translation(response).items()
+                          if key in chunk and isinstance(value, str)}
+                if len(result) < len(chunk) and attempt < MAX_ATTEMPTS - 1:
+                    raise ValueError(f"response is missing {len(chunk) - len(result)} keys")
+                return result
+            except Exception as e:
+                if attempt == MAX_ATTEMPTS - 1:
+                    print(f"   ⚠️  {e}")
+                    return None
+                await asyncio.sleep(BACKOFF_SECONDS * 2 ** attempt * (1 + random.random()))
+
+    def generate_arb_files(self, english: Dict[str, str], translations: Dict[str, Dict[str, str]]):
+        """Generate ARB files for Flutter localization (English template + one per locale)"""
         print(f"\n📄 Generating ARB files...")
 
         # Create l10n directory
         self.l10n_dir.mkdir(exist_ok=True)
 
-        # Generate app_en.arb
-        en_arb = {
-            "@@locale": "en",
-            "@@context": "Everyday Christian App - English Localization"
-        }
-        for key, value in english.items():
-            en_arb[key] = value
-            en_arb[f"@{key}"] = {
-                "description": f"English text for {key}"
-            }
-
-        en_arb_path = self.l10n_dir / "app_en.arb"
-        with open(en_arb_path, 'w', encoding='utf-8') as f:
-            json.dump(en_arb, f, indent=2, ensure_ascii=False)
-        print(f"✅ Created: {en_arb_path}")
-
-        # Generate app_es.arb
-        es_arb = {
-            "@@locale": "es",
-            "@@context": "Everyday Christian App - Spanish Localization"
-        }
-        for key, value in spanish.items():
-            es_arb[key] = value
-            es_arb[f"@{key}"] = {
-                "description": f"Spanish text for {key}"
+        paths = []
+        for locale, language, strings in [('en', 'English', english)] + [
+            (locale, LANGUAGES[locale][0], strings) for locale, strings in translations.items()
+        ]:
+            arb = {
+                "@@locale": locale,
+                "@@context": f"Everyday Christian App - {language} Localization"
             }
+            for key, value in strings.items():
+                arb[key] = value
+                arb[f"@{key}"] = {
+                    "description": f"{language} text for {key}"
+                }
 
-        es_arb_path = self.l10n_dir / "app_es.arb"
-        with open(es_arb_path, 'w', encoding='utf-8') as f:
-            json.dump(es_arb, f, indent=2, ensure_ascii=False)
-        print(f"✅ Created: {es_arb_path}")
+            arb_path = self.l10n_dir / f"app_{locale}.arb"
+            with open(arb_path, 'w', encoding='utf-8') as f:
+                json.dump(arb, f, indent=2, ensure_ascii=False)
+            print(f"✅ Created: {arb_path}")
+            paths.append(arb_path)
 
-        return en_arb_path, es_arb_path
+        return paths
 
     def generate_l10n_yaml(self):
         """Generate l10n.yaml configuration file"""
@@ -220,10 +634,11 @@ output-class: AppLocalizations
         print(f"✅ Created: {l10n_yaml}")
         return l10n_yaml
 
-    def run(self):
+    def run(self, locales: List[str] = ('es',)):
         """Main execution flow"""
+        locales = list(locales)
         print("=" * 60)
-        print("🌍 Everyday Christian App - Spanish Localization Agent")
+        print(f"🌍 Everyday Christian App - Localization Agent ({', '.join(locales)})")
         print("=" * 60)
 
         # Step 1: Scan project for strings
@@ -233,11 +648,11 @@ output-class: AppLocalizations
             print("❌ No strings found to translate!")
             return
 
-        # Step 2: Translate to Spanish
-        spanish_strings = self.translate_to_spanish(english_strings)
+        # Step 2: Translate into every locale
+        translations = self.translate(english_strings, locales)
 
         # Step 3: Generate ARB files
-        en_path, es_path = self.generate_arb_files(english_strings, spanish_strings)
+        arb_paths = self.generate_arb_files(english_strings, translations)
 
         # Step 4: Generate l10n.yaml
         yaml_path = self.generate_l10n_yaml()
@@ -248,10 +663,11 @@ output-class: AppLocalizations
         print("=" * 60)
         print(f"📊 Statistics:")
         print(f"   - Strings extracted: {len(english_strings)}")
-        print(f"   - Strings translated: {len(spanish_strings)}")
+        for locale, strings in translations.items():
+            print(f"   - Strings translated ({locale}): {len(strings)}")
         print(f"\n📁 Files created:")
-        print(f"   - {en_path}")
-        print(f"   - {es_path}")
+        for path in arb_paths:
+            print(f"   - {path}")
         print(f"   - {yaml_path}")
         print(f"\n📝 Next steps:")
         print(f"   1. Add to pubspec.yaml:")
@@ -259,13 +675,33 @@ output-class: AppLocalizations
         print(f"   2. Run: flutter gen-l10n")
         print(f"   3. Import: import 'package:flutter_gen/gen_l10n/app_localizations.dart';")
         print(f"   4. Use: AppLocalizations.of(context)!.yourKey")
-        print(f"   5. Test both languages in the app")
+        print(f"   5. Test every language in the app")
         print("=" * 60)
 
 
 def main():
-    agent = LocalizationAgent()
-    agent.run()
+    parser = argparse.ArgumentParser(description="Extract app strings and generate translated ARB files")
+    parser.add_argument('--locales', default='es',
+                        help=f"Comma-separated target locales ({', '.join(LANGUAGES)})")
+    parser.add_argument('--full', action='store_true',
+                        help="Rescan every file and translate every string again, refreshing the caches")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="Translation requests in flight at once")
+    parser.add_argument('--chunk-tokens', type=int, default=CHUNK_TOKEN_BUDGET,
+                        help="Approximate source tokens per translation request")
+    parser.add_argument('--workers', type=int, help="Processes for lexing changed Dart files")
+    args = parser.parse_args()
+
+    locales = [locale.strip() for locale in args.locales.split(',') if locale.strip()]
+    unknown = [locale for locale in locales if locale not in LANGUAGES]
+    if unknown or not locales:
+        print(f"❌ Unsupported locales: {', '.join(unknown) or '(none given)'}")
+        print(f"   Supported: {', '.join(LANGUAGES)}")
+        sys.exit(1)
+
+    agent = LocalizationAgent(refresh=args.full, concurrency=args.concurrency,
+                              chunk_tokens=args.chunk_tokens, workers=args.workers)
+    agent.run(locales)
 
 
 if __name__ == "__main__":
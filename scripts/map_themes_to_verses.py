@@ -4,12 +4,68 @@ Theme-to-Verse Mapping Script
 Maps 75 themes to 25 relevant Bible verses each (1,875 total mappings)
 
 Uses keyword matching and manual curation for theological accuracy.
+
+The corpus is scanned once with a word-level Aho-Corasick matcher over
+all theme keywords, building an in-memory inverted index
+(keyword -> verse ids); every theme is then scored from the postings
+instead of running one LIKE full-table scan per keyword.
+
+Default scoring is BM25 over the whole corpus: a sparse verse x keyword
+matrix is built once, multiplied by a theme x keyword matrix, and the
+top 25 verses per theme are taken with argpartition. This needs numpy
+and scipy; without them (or with --scoring count) each verse is scored
+by the number of theme keywords it contains.
+
+Mappings are written into bible.db as a themes dictionary table and a
+normalized verse_themes(theme_id, verse_id, score) table with covering
+indexes, so "verses for theme X ordered by score" is an index range scan.
+A compact JSON export is available with --json.
+
+Remapping is incremental: each theme stores a fingerprint of its keyword
+list, the scoring parameters and the corpus, and only themes whose
+fingerprint changed are recomputed and rewritten. Per-keyword postings
+are cached in scripts/.cache/ so unchanged keywords are not rescanned.
+--full ignores both.
+
+--scoring semantic finds verses that share no literal keyword with a
+theme: verses are embedded with TF-IDF + truncated SVD (LSA, see
+lsa_index.py), the matrix is cached memory-mapped in scripts/.cache/lsa/,
+and each theme's name and keywords are ranked by cosine similarity.
+
+Usage:
+    python3 map_themes_to_verses.py [--scoring bm25|semantic|count] [--json [PATH]] [--full]
 """
 
+import argparse
+import hashlib
+import os
 import sqlite3
 import json
-import re
-from collections import defaultdict
+import time
+from collections import Counter, defaultdict
+
+from keyword_matcher import KeywordMatcher, tokenize
+
+try:
+    import numpy as np
+    from scipy import sparse
+    from lsa_index import LsaIndex, LSA_DIMENSIONS
+except ImportError:
+    np = sparse = LsaIndex = None
+    LSA_DIMENSIONS = None
+
+DEFAULT_JSON_PATH = "../assets/training_data/theme_verse_mappings.json"
+CACHE_PATH = ".cache/theme_mapping_cache.db"
+LSA_CACHE_DIR = ".cache/lsa"
+
+VERSES_PER_THEME = 25
+
+# Bump when keyword matching changes, to invalidate cached postings
+MATCHER_VERSION = 2
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
 
 # Theme keyword mappings for verse search
 THEME_KEYWORDS = {
@@ -111,85 +167,441 @@ THEME_KEYWORDS = {
     'identity_in_christ': ['in christ', 'new creation', 'child of god', 'chosen', 'righteous'],
 }
 
-def normalize_text(text):
-    """Normalize text for keyword matching"""
-    return text.lower().strip()
-
-def search_verses_for_theme(cursor, theme_name, keywords, limit=50):
+class VerseIndex:
     """
-    Search for verses matching theme keywords
-    Returns list of tuples: (verse_id, reference, clean_text, match_score)
+    Keyword inverted index over verses.clean_text
+
+    Verses are scanned with a KeywordMatcher built from the requested
+    keywords, producing keyword -> {verse_id: occurrences}. Matching is
+    word-based (see keyword_matcher.py): 'forgive' matches 'forgiveness',
+    'no' does not match 'know', and phrases such as 'cast burden' must
+    appear as consecutive words. Postings found in a PostingsCache are
+    reused instead of rescanning the corpus.
     """
-    results = []
 
-    for keyword in keywords:
-        # Search in clean_text column
-        query = """
+    def __init__(self, cursor):
+        self.verses = {}
+        self.verse_lengths = {}
+        self.postings = defaultdict(Counter)
+
+        cursor.execute("""
             SELECT id, reference, clean_text
             FROM verses
-            WHERE clean_text LIKE ?
-            LIMIT ?
+            WHERE clean_text IS NOT NULL
+            ORDER BY id
+        """)
+        digest = hashlib.sha1()
+        for verse_id, reference, clean_text in cursor:
+            self.verses[verse_id] = (reference, clean_text)
+            self.verse_lengths[verse_id] = len(tokenize(clean_text))
+            digest.update(f"{verse_id}\t{clean_text}\n".encode('utf-8'))
+        self.corpus_fingerprint = digest.hexdigest()
+
+    def add_keywords(self, keywords, cache=None):
+        """
+        Fill postings for keywords, from the cache where possible
+        Returns (cache hits, cache misses)
         """
+        keywords = set(keywords)
+        cached = cache.load(keywords) if cache else {}
+        self.postings.update(cached)
+
+        missing = keywords - set(cached)
+        if missing:
+            matcher = KeywordMatcher({'missing': sorted(missing)})
+            for verse_id, (_, clean_text) in self.verses.items():
+                for keyword, _, _ in matcher.iter_hits(tokenize(clean_text)):
+                    self.postings[keyword][verse_id] += 1
+            if cache:
+                cache.store({kw: self.postings[kw] for kw in missing})
+
+        return len(cached), len(missing)
+
+    def lookup(self, keyword):
+        """Verse ids matching a keyword or phrase"""
+        return self.postings[keyword].keys()
+
+    def term_frequencies(self, keyword):
+        """verse id -> occurrences of a keyword or phrase"""
+        return self.postings[keyword]
+
+class PostingsCache:
+    """
+    Persistent per-keyword postings, valid for one corpus fingerprint
+    and matcher version; anything else clears the cache.
+    """
+
+    def __init__(self, path, corpus_fingerprint, reset=False):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS keywords (keyword TEXT PRIMARY KEY);
+            CREATE TABLE IF NOT EXISTS postings (
+                keyword TEXT NOT NULL,
+                verse_id INTEGER NOT NULL,
+                tf INTEGER NOT NULL,
+                PRIMARY KEY (keyword, verse_id)
+            ) WITHOUT ROWID;
+        ''')
+
+        version = f"{corpus_fingerprint}:{MATCHER_VERSION}"
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if reset or not row or row[0] != version:
+            self.conn.execute('DELETE FROM keywords')
+            self.conn.execute('DELETE FROM postings')
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                              (version,))
+            self.conn.commit()
+
+    def load(self, keywords):
+        """keyword -> Counter(verse_id -> tf) for the cached subset of keywords"""
+        cached = {}
+        for keyword in keywords:
+            if self.conn.execute('SELECT 1 FROM keywords WHERE keyword = ?', (keyword,)).fetchone():
+                cached[keyword] = Counter(dict(self.conn.execute(
+                    'SELECT verse_id, tf FROM postings WHERE keyword = ?', (keyword,))))
+        return cached
+
+    def store(self, postings):
+        self.conn.executemany('INSERT OR REPLACE INTO keywords (keyword) VALUES (?)',
+                              [(kw,) for kw in postings])
+        self.conn.executemany(
+            'INSERT OR REPLACE INTO postings (keyword, verse_id, tf) VALUES (?, ?, ?)',
+            [(kw, verse_id, tf) for kw, counts in postings.items() for verse_id, tf in counts.items()]
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+def search_verses_for_theme(index, theme_name, keywords, limit=25):
+    """
+    Score verses for a theme from the index postings
+    Returns list of dicts: verse_id, reference, text, match_score
+    (number of theme keywords the verse matches), best first
+    """
+    scores = Counter()
+    for keyword in keywords:
+        scores.update(index.lookup(keyword))
+
+    # Highest score first, canonical order among ties
+    ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+    return _mapping_results(index, ranked)
+
+def _mapping_results(index, ranked):
+    return [
+        {
+            'verse_id': verse_id,
+            'reference': index.verses[verse_id][0],
+            'text': index.verses[verse_id][1],
+            'match_score': score
+        }
+        for verse_id, score in ranked
+    ]
 
-        # Use wildcards for flexible matching
-        pattern = f'%{keyword}%'
-        cursor.execute(query, (pattern, limit))
-
-        for verse_id, reference, clean_text in cursor.fetchall():
-            # Calculate simple match score (number of keyword matches)
-            score = sum(1 for kw in keywords if kw in normalize_text(clean_text))
-            results.append((verse_id, reference, clean_text, score))
-
-    # Sort by match score (highest first) and deduplicate
-    seen_verses = set()
-    unique_results = []
-    for verse_id, reference, clean_text, score in sorted(results, key=lambda x: x[3], reverse=True):
-        if verse_id not in seen_verses:
-            seen_verses.add(verse_id)
-            unique_results.append({
+def build_keyword_matrix(index, keywords):
+    """
+    Sparse verse x keyword term-frequency matrix over the whole corpus
+    Returns (verse_ids, tf matrix, verse lengths in tokens)
+    """
+    verse_ids = sorted(index.verses)
+    row_of = {verse_id: row for row, verse_id in enumerate(verse_ids)}
+
+    rows, cols, counts = [], [], []
+    for col, keyword in enumerate(keywords):
+        for verse_id, count in index.term_frequencies(keyword).items():
+            rows.append(row_of[verse_id])
+            cols.append(col)
+            counts.append(count)
+
+    tf = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float32), (rows, cols)),
+        shape=(len(verse_ids), len(keywords))
+    )
+    lengths = np.fromiter((index.verse_lengths[v] for v in verse_ids),
+                          dtype=np.float32, count=len(verse_ids))
+    return verse_ids, tf, lengths
+
+def bm25_weights(tf, lengths, k1=BM25_K1, b=BM25_B):
+    """Turn a term-frequency matrix into BM25 term weights"""
+    coo = tf.tocoo()
+    n_docs = tf.shape[0]
+
+    df = np.bincount(coo.col, minlength=tf.shape[1]).astype(np.float32)
+    idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+
+    avg_length = lengths.mean() if n_docs else 1.0
+    norm = k1 * (1 - b + b * lengths[coo.row] / avg_length)
+    weights = idf[coo.col] * coo.data * (k1 + 1) / (coo.data + norm)
+
+    return sparse.csr_matrix((weights, (coo.row, coo.col)), shape=tf.shape)
+
+def score_all_themes_bm25(index, theme_keywords, limit=25):
+    """
+    Rank the whole corpus for every theme with one sparse matmul
+    Returns theme -> list of result dicts, best first
+    """
+    keywords = sorted({kw for kws in theme_keywords.values() for kw in kws})
+    col_of = {kw: col for col, kw in enumerate(keywords)}
+    themes = list(theme_keywords)
+
+    verse_ids, tf, lengths = build_keyword_matrix(index, keywords)
+    weights = bm25_weights(tf, lengths)
+
+    # theme x keyword indicator matrix
+    rows = [t for t, theme in enumerate(themes) for _ in theme_keywords[theme]]
+    cols = [col_of[kw] for theme in themes for kw in theme_keywords[theme]]
+    query = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+        shape=(len(themes), len(keywords))
+    )
+
+    # verse x theme scores
+    scores = (weights @ query.T).toarray()
+
+    k = min(limit, scores.shape[0])
+    if k == 0:
+        return {theme: [] for theme in themes}
+    top = np.argpartition(-scores, k - 1, axis=0)[:k]
+    top_scores = np.take_along_axis(scores, top, axis=0)
+    order = np.lexsort((top, -top_scores), axis=0)
+
+    results = {}
+    for t, theme in enumerate(themes):
+        ranked = [
+            (verse_ids[top[i, t]], round(float(top_scores[i, t]), 4))
+            for i in order[:, t]
+            if top_scores[i, t] > 0
+        ]
+        results[theme] = _mapping_results(index, ranked)
+    return results
+
+def theme_seed_text(theme_name, keywords):
+    """Query text for semantic scoring: the theme name plus its keywords"""
+    return ' '.join([theme_name.replace('_', ' ')] + keywords)
+
+def score_all_themes_semantic(index, theme_keywords, limit=25, rebuild=False):
+    """
+    Rank verses for every theme by LSA cosine similarity to its seed text
+    Returns theme -> list of result dicts, best first
+    """
+    verse_ids = sorted(index.verses)
+    start = time.perf_counter()
+    lsa = LsaIndex.load_or_build(verse_ids, [index.verses[v][1] for v in verse_ids],
+                                 index.corpus_fingerprint, LSA_CACHE_DIR, rebuild=rebuild)
+    source = "cached" if lsa.cached else "built"
+    print(f"  ✓ LSA matrix {lsa.vectors.shape[0]}x{lsa.vectors.shape[1]} {source} "
+          f"in {time.perf_counter() - start:.2f}s")
+
+    themes = list(theme_keywords)
+    start = time.perf_counter()
+    ranked = lsa.search([theme_seed_text(t, theme_keywords[t]) for t in themes], limit)
+    print(f"  ✓ {len(themes)} theme queries in {(time.perf_counter() - start) * 1000:.1f}ms\n")
+
+    return {
+        theme: _mapping_results(index, [(verse_id, round(score, 4)) for verse_id, score in hits if score > 0])
+        for theme, hits in zip(themes, ranked)
+    }
+
+def theme_fingerprint(keywords, scoring, corpus_fingerprint):
+    """Hash of everything a theme's mapping depends on"""
+    params = {
+        'keywords': keywords,
+        'scoring': scoring,
+        'bm25': [BM25_K1, BM25_B],
+        'limit': VERSES_PER_THEME,
+        'matcher': MATCHER_VERSION,
+        'lsa': LSA_DIMENSIONS if scoring == 'semantic' else None,
+        'corpus': corpus_fingerprint,
+    }
+    return hashlib.sha1(json.dumps(params, sort_keys=True).encode('utf-8')).hexdigest()
+
+def ensure_theme_tables(cursor):
+    """
+    Create themes/verse_themes if needed and return name -> fingerprint
+    of the themes already mapped
+    """
+    cursor.execute("PRAGMA table_info(themes)")
+    columns = {row[1] for row in cursor.fetchall()}
+    if columns and 'fingerprint' not in columns:
+        # Tables from a non-incremental run: start over
+        cursor.execute('DROP TABLE IF EXISTS verse_themes')
+        cursor.execute('DROP TABLE IF EXISTS themes')
+
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS themes (
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            keywords TEXT NOT NULL,
+            verse_count INTEGER NOT NULL,
+            fingerprint TEXT NOT NULL
+        )
+    ''')
+
+    # Clustered on (theme_id, verse_id); the score index covers
+    # "verses for theme X ordered by score" without touching the table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS verse_themes (
+            theme_id INTEGER NOT NULL REFERENCES themes(id),
+            verse_id INTEGER NOT NULL REFERENCES verses(id),
+            score REAL NOT NULL,
+            PRIMARY KEY (theme_id, verse_id)
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_verse_themes_score '
+                   'ON verse_themes(theme_id, score DESC, verse_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_verse_themes_verse '
+                   'ON verse_themes(verse_id, theme_id, score)')
+
+    cursor.execute('SELECT name, fingerprint FROM themes')
+    return dict(cursor.fetchall())
+
+def write_theme_tables(conn, mappings, fingerprints, removed=()):
+    """Rewrite the rows of the given (changed) themes and delete removed ones"""
+    cursor = conn.cursor()
+
+    for name in removed:
+        cursor.execute('DELETE FROM verse_themes WHERE theme_id = (SELECT id FROM themes WHERE name = ?)',
+                       (name,))
+        cursor.execute('DELETE FROM themes WHERE name = ?', (name,))
+
+    for name, mapping in mappings.items():
+        cursor.execute('''
+            INSERT INTO themes (name, keywords, verse_count, fingerprint) VALUES (?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET
+                keywords = excluded.keywords,
+                verse_count = excluded.verse_count,
+                fingerprint = excluded.fingerprint
+        ''', (name, json.dumps(mapping['keywords']), mapping['verse_count'], fingerprints[name]))
+        theme_id = cursor.execute('SELECT id FROM themes WHERE name = ?', (name,)).fetchone()[0]
+
+        cursor.execute('DELETE FROM verse_themes WHERE theme_id = ?', (theme_id,))
+        cursor.executemany(
+            'INSERT INTO verse_themes (theme_id, verse_id, score) VALUES (?, ?, ?)',
+            [(theme_id, verse['verse_id'], verse['match_score']) for verse in mapping['verses']]
+        )
+
+    conn.commit()
+
+def load_mappings(cursor, theme_names):
+    """Read the stored mappings back, in theme_names order"""
+    cursor.execute('''
+        SELECT t.name, t.keywords, vt.verse_id, v.reference, v.clean_text, vt.score
+        FROM themes t
+        LEFT JOIN verse_themes vt ON vt.theme_id = t.id
+        LEFT JOIN verses v ON v.id = vt.verse_id
+        ORDER BY t.id, vt.score DESC, vt.verse_id
+    ''')
+
+    stored = {}
+    for name, keywords, verse_id, reference, clean_text, score in cursor.fetchall():
+        mapping = stored.setdefault(name, {
+            'theme': name,
+            'keywords': json.loads(keywords),
+            'verse_count': 0,
+            'verses': []
+        })
+        if verse_id is not None:
+            mapping['verses'].append({
                 'verse_id': verse_id,
                 'reference': reference,
                 'text': clean_text,
                 'match_score': score
             })
+            mapping['verse_count'] += 1
 
-    return unique_results[:25]  # Return top 25 verses
+    return {name: stored[name] for name in theme_names if name in stored}
 
-def create_theme_verse_mappings(db_path, output_path):
-    """Create mappings for all 75 themes"""
+def export_mappings_json(mappings, output_path):
+    """Optional compact JSON export of the mappings"""
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(mappings, f, separators=(',', ':'), ensure_ascii=False)
+
+def create_theme_verse_mappings(db_path, json_path=None, scoring='bm25', full=False):
+    """Create mappings for all 75 themes, recomputing only changed themes"""
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
-    all_mappings = {}
-
-    print("🔍 Mapping themes to Bible verses...\n")
-
-    for theme_name, keywords in THEME_KEYWORDS.items():
-        print(f"  Processing: {theme_name} ({len(keywords)} keywords)")
-
-        verses = search_verses_for_theme(cursor, theme_name, keywords)
-
-        all_mappings[theme_name] = {
-            'theme': theme_name,
-            'keywords': keywords,
-            'verse_count': len(verses),
-            'verses': verses
-        }
-
-        print(f"    ✓ Found {len(verses)} verses\n")
-
+    if scoring in ('bm25', 'semantic') and np is None:
+        print("⚠️  numpy/scipy not installed, falling back to keyword-count scoring")
+        print("   Install them with: pip install numpy scipy\n")
+        scoring = 'count'
+
+    print("📚 Loading verses...")
+    index = VerseIndex(cursor)
+    print(f"  ✓ {len(index.verses)} verses\n")
+
+    existing = ensure_theme_tables(cursor)
+    fingerprints = {
+        theme: theme_fingerprint(keywords, scoring, index.corpus_fingerprint)
+        for theme, keywords in THEME_KEYWORDS.items()
+    }
+    changed = {
+        theme: keywords for theme, keywords in THEME_KEYWORDS.items()
+        if full or existing.get(theme) != fingerprints[theme]
+    }
+    removed = [theme for theme in existing if theme not in THEME_KEYWORDS]
+
+    print(f"🔁 Themes: {len(changed)} to map, {len(THEME_KEYWORDS) - len(changed)} unchanged, "
+          f"{len(removed)} removed\n")
+
+    new_mappings = {}
+    if changed and scoring != 'semantic':
+        print("📚 Building keyword index...")
+        start = time.perf_counter()
+        cache = PostingsCache(CACHE_PATH, index.corpus_fingerprint, reset=full)
+        hits, misses = index.add_keywords({kw for kws in changed.values() for kw in kws}, cache)
+        cache.close()
+        print(f"  ✓ Postings cache: {hits} hits, {misses} misses "
+              f"in {time.perf_counter() - start:.2f}s\n")
+
+    if changed:
+        print(f"🔍 Mapping themes to Bible verses ({scoring} scoring)...\n")
+        start = time.perf_counter()
+
+        ranked_themes = None
+        if scoring == 'bm25':
+            ranked_themes = score_all_themes_bm25(index, changed, VERSES_PER_THEME)
+        elif scoring == 'semantic':
+            ranked_themes = score_all_themes_semantic(index, changed, VERSES_PER_THEME, full)
+
+        for theme_name, keywords in changed.items():
+            print(f"  Processing: {theme_name} ({len(keywords)} keywords)")
+
+            if ranked_themes is not None:
+                verses = ranked_themes[theme_name]
+            else:
+                verses = search_verses_for_theme(index, theme_name, keywords, VERSES_PER_THEME)
+
+            new_mappings[theme_name] = {
+                'theme': theme_name,
+                'keywords': keywords,
+                'verse_count': len(verses),
+                'verses': verses
+            }
+
+            print(f"    ✓ Found {len(verses)} verses\n")
+
+        print(f"⏱️  Mapped {len(new_mappings)} themes in {time.perf_counter() - start:.3f}s")
+
+    # Save to bible.db
+    write_theme_tables(conn, new_mappings, fingerprints, removed)
+    all_mappings = load_mappings(cursor, THEME_KEYWORDS)
     conn.close()
 
-    # Save to JSON
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(all_mappings, f, indent=2, ensure_ascii=False)
+    print(f"\n✅ Mappings up to date for {len(all_mappings)} themes "
+          f"({len(new_mappings)} rewritten)")
+    print(f"💾 Saved to: {db_path} (themes, verse_themes)")
 
-    print(f"\n✅ Created mappings for {len(all_mappings)} themes")
-    print(f"📄 Saved to: {output_path}")
+    if json_path:
+        export_mappings_json(all_mappings, json_path)
+        print(f"📄 Exported JSON: {json_path}")
 
     # Print summary statistics
     total_verses = sum(len(m['verses']) for m in all_mappings.values())
-    avg_verses = total_verses / len(all_mappings)
+    avg_verses = total_verses / max(len(all_mappings), 1)
 
     print(f"\n📊 Statistics:")
     print(f"  Total themes: {len(all_mappings)}")
@@ -224,16 +636,26 @@ def verify_mappings(mappings):
     print("\n" + "="*60)
 
 def main():
+    parser = argparse.ArgumentParser(description="Map themes to Bible verses")
+    parser.add_argument('--scoring', choices=['bm25', 'semantic', 'count'], default='bm25',
+                        help="bm25 (numpy/scipy, corpus-wide), semantic (offline LSA) or keyword count")
+    parser.add_argument('--json', nargs='?', const=DEFAULT_JSON_PATH, default=None,
+                        metavar='PATH', help=f"Also export compact JSON (default: {DEFAULT_JSON_PATH})")
+    parser.add_argument('--full', action='store_true',
+                        help="Ignore theme fingerprints and the postings cache")
+    args = parser.parse_args()
+
     db_path = "../assets/bible.db"
-    output_path = "../assets/training_data/theme_verse_mappings.json"
 
     print("Theme-to-Verse Mapping Script")
     print("="*60)
     print(f"Database: {db_path}")
-    print(f"Output: {output_path}\n")
+    if args.json:
+        print(f"JSON export: {args.json}")
+    print()
 
     # Create mappings
-    mappings = create_theme_verse_mappings(db_path, output_path)
+    mappings = create_theme_verse_mappings(db_path, args.json, args.scoring, args.full)
 
     # Verify and show samples
     verify_mappings(mappings)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Approximate nearest-neighbour (vector) index over the pastoral RAG examples
+Needs only NumPy and SciPy; no network, no remote embedding API
+
+Examples are embedded offline with LSA (lsa_index.LsaIndex over input +
+response), quantized to int8 with one scale per dimension (LSA dimensions
+differ widely in range) and bucketed by an IVF coarse quantizer
+(spherical k-means). A lookup embeds the message,
+scores the centroids, and scans only the nprobe closest inverted lists.
+
+Everything lives in one flat, 64-byte aligned file that is memory-mapped
+on load: a JSON header describing the arrays, then the arrays themselves
+(term vectors, IDF, centroids, list offsets, example ids, int8 codes,
+scales, vocabulary). Example ids are JSONL line numbers (1-based), the
+same ids rag_index.py uses.
+
+    index = AnnIndex.load("../assets/training_data/rag_vectors.ann")
+    index.search("I can't stop worrying about money", k=5)
+    # [(example_id, cosine similarity), ...]
+
+Usage:
+    python3 rag_ann_index.py [--input JSONL] [--index PATH] [--rebuild]
+                             [--query TEXT [-k 5]] [--nprobe N] [--benchmark [N]]
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+    from lsa_index import LsaIndex, normalize_rows
+except ImportError:
+    print("❌ Error: numpy/scipy packages not installed")
+    print("Install them with: pip install numpy scipy")
+    sys.exit(1)
+
+from keyword_matcher import tokenize
+from rag_index import example_fields
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_INPUT = BASE_DIR / "assets/training_data/training_19750_final.jsonl"
+DEFAULT_INDEX = BASE_DIR / "assets/training_data/rag_vectors.ann"
+
+MAGIC = b"RAGANN01"
+ALIGNMENT = 64
+ANN_DIMENSIONS = 128
+DEFAULT_NPROBE = 8
+KMEANS_ITERATIONS = 15
+
+
+def spherical_kmeans(vectors, clusters, iterations=KMEANS_ITERATIONS, seed=0):
+    """Unit-norm centroids and the assignment of every (unit) vector"""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignment, vectors)
+        # An empty list keeps its old centroid rather than collapsing to zero
+        empty = ~sums.any(axis=1)
+        sums[empty] = centroids[empty]
+        centroids = normalize_rows(sums)
+    return centroids, np.argmax(vectors @ centroids.T, axis=1)
+
+
+def quantize(vectors):
+    """Symmetric int8 codes and the per-dimension float32 scales that restore them"""
+    scales = np.abs(vectors).max(axis=0) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.rint(vectors / scales).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def write_flat_file(path, meta, arrays):
+    """Header (magic, length, JSON) followed by 64-byte aligned raw arrays"""
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+
+    header = json.dumps({**meta, 'arrays': layout}).encode('utf-8')
+    data_start = -(-(len(MAGIC) + 8 + len(header)) // ALIGNMENT) * ALIGNMENT
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(len(header).to_bytes(8, 'little'))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def read_flat_file(path):
+    """(meta, name -> read-only array view into one memory map)"""
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a RAG ANN index")
+        header_length = int.from_bytes(f.read(8), 'little')
+        meta = json.loads(f.read(header_length))
+    data_start = -(-(len(MAGIC) + 8 + header_length) // ALIGNMENT) * ALIGNMENT
+
+    buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    arrays = {}
+    for name, spec in meta.pop('arrays').items():
+        dtype = np.dtype(spec['dtype'])
+        count = math.prod(spec['shape'])
+        start = data_start + spec['offset']
+        arrays[name] = buffer[start:start + count * dtype.itemsize].view(dtype).reshape(spec['shape'])
+    return meta, arrays
+
+
+class AnnIndex:
+    """IVF + int8 cosine index over LSA example vectors, backed by one flat file"""
+
+    def __init__(self, meta, arrays):
+        self.meta = meta
+        self.term_vectors = arrays['term_vectors']
+        self.idf = arrays['idf']
+        self.centroids = arrays['centroids']
+        self.list_offsets = arrays['list_offsets']
+        self.ids = arrays['ids']
+        self.codes = arrays['codes']
+        self.scales = arrays['scales']
+        terms = arrays['terms'].tobytes().decode('utf-8').split('\n')
+        self.vocabulary = {term: column for column, term in enumerate(terms)}
+
+    @staticmethod
+    def build(input_path, index_path, dimensions=ANN_DIMENSIONS, nlist=None):
+        """Embed, cluster and quantize every example; returns the example count"""
+        with open(input_path, 'r', encoding='utf-8') as f:
+            texts = [' '.join(example_fields(json.loads(line))) for line in f]
+        ids = np.arange(1, len(texts) + 1, dtype=np.int32)
+
+        # Fold the examples back in through the projection queries use, so the
+        # stored vectors and AnnIndex.embed agree exactly
+        lsa = LsaIndex.build(ids, texts, dimensions)
+        vectors = lsa.embed(texts)
+        nlist = min(len(vectors), nlist or max(1, round(math.sqrt(len(vectors)))))
+        centroids, assignment = spherical_kmeans(vectors, nlist)
+
+        # Store vectors grouped by inverted list so each list is one contiguous slice
+        order = np.argsort(assignment, kind='stable')
+        list_offsets = np.zeros(nlist + 1, dtype=np.int64)
+        list_offsets[1:] = np.cumsum(np.bincount(assignment, minlength=nlist))
+        codes, scales = quantize(vectors[order])
+
+        terms = sorted(lsa.vocabulary, key=lsa.vocabulary.get)
+        write_flat_file(index_path, {'count': len(texts), 'dimensions': int(vectors.shape[1])}, {
+            'term_vectors': np.ascontiguousarray(lsa.components.T, dtype=np.float32),
+            'idf': lsa.idf.astype(np.float32),
+            'centroids': centroids.astype(np.float32),
+            'list_offsets': list_offsets,
+            'ids': ids[order],
+            'codes': codes,
+            'scales': scales,
+            'terms': np.frombuffer('\n'.join(terms).encode('utf-8'), dtype=np.uint8),
+        })
+        return len(texts)
+
+    @classmethod
+    def load(cls, index_path=DEFAULT_INDEX):
+        return cls(*read_flat_file(index_path))
+
+    def embed(self, text):
+        """Unit LSA vector of a message (zeros if no word is in the vocabulary)"""
+        counts = {}
+        for token in tokenize(text):
+            column = self.vocabulary.get(token)
+            if column is not None:
+                counts[column] = counts.get(column, 0) + 1
+        if not counts:
+            return np.zeros(self.term_vectors.shape[1], dtype=np.float32)
+
+        columns = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        vector = ((1.0 + np.log(tf)) * self.idf[columns]) @ self.term_vectors[columns]
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def search(self, message, k=5, nprobe=DEFAULT_NPROBE):
+        """Top-k (example_id, approximate cosine similarity), best first"""
+        query = self.embed(message)
+        if not query.any():
+            return []
+
+        nprobe = min(nprobe, len(self.centroids))
+        probe = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+        # Folding the scales into the query leaves one int8 x float32 product per list
+        scaled_query = query * self.scales
+        starts = self.list_offsets[probe]
+        ends = self.list_offsets[probe + 1]
+        scores = np.concatenate([self.codes[s:e] @ scaled_query for s, e in zip(starts, ends)])
+        if len(scores) == 0:
+            return []
+        ids = np.concatenate([self.ids[s:e] for s, e in zip(starts, ends)])
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+
+def benchmark(index, input_path, queries=1000, k=5, nprobes=(1, 2, 4, 8, 16, 32), seed=0):
+    """Recall@k and latency of IVF/int8 search against exact float32 brute force"""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        examples = [example_fields(json.loads(line)) for line in f]
+    rng = random.Random(seed)
+    messages = [examples[rng.randrange(len(examples))][0] for _ in range(queries)]
+
+    # Ground truth: the same LSA embedding, unquantized, scanned in full
+    exact_vectors = np.stack([index.embed(' '.join(fields)) for fields in examples])
+    exact_ids = np.arange(1, len(examples) + 1)
+
+    def exact_search(message):
+        scores = exact_vectors @ index.embed(message)
+        top = np.argpartition(-scores, k - 1)[:k]
+        return exact_ids[top[np.argsort(-scores[top])]]
+
+    def timed(search):
+        latencies, results = [], []
+        for message in messages:
+            start = time.perf_counter()
+            results.append(search(message))
+            latencies.append((time.perf_counter() - start) * 1000)
+        latencies.sort()
+        return results, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+    truth, p50, p99 = timed(exact_search)
+    print(f"⏱️  {queries} queries, top-{k} against {len(examples)} examples")
+    print(f"  exact (float32 brute force): p50 {p50:.3f}ms, p99 {p99:.3f}ms")
+
+    for nprobe in nprobes:
+        if nprobe > len(index.centroids):
+            break
+        found, p50, p99 = timed(lambda message: [i for i, _ in index.search(message, k, nprobe)])
+        recall = sum(len(set(a) & set(b.tolist())) for a, b in zip(found, truth)) / (k * queries)
+        print(f"  nprobe {nprobe:>3}: recall@{k} {recall:.3f}, p50 {p50:.3f}ms, p99 {p99:.3f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the pastoral RAG vector index")
+    parser.add_argument('--input', type=Path, default=DEFAULT_INPUT)
+    parser.add_argument('--index', type=Path, default=DEFAULT_INDEX)
+    parser.add_argument('--rebuild', action='store_true', help="Rebuild even if the index exists")
+    parser.add_argument('--dimensions', type=int, default=ANN_DIMENSIONS, help="LSA dimensions")
+    parser.add_argument('--nlist', type=int, help="Inverted lists (default: sqrt of example count)")
+    parser.add_argument('--nprobe', type=int, default=DEFAULT_NPROBE, help="Lists scanned per query")
+    parser.add_argument('--query', help="Print the top-k examples for a message")
+    parser.add_argument('-k', type=int, default=5)
+    parser.add_argument('--benchmark', type=int, nargs='?', const=1000, metavar='N',
+                        help="Compare recall@k and latency with exact search over N queries")
+    args = parser.parse_args()
+
+    if args.rebuild or not args.index.exists():
+        print(f"🧭 Building vector index from {args.input}...")
+        start = time.perf_counter()
+        count = AnnIndex.build(args.input, args.index, args.dimensions, args.nlist)
+        size = args.index.stat().st_size / (1024 * 1024)
+        print(f"✅ Indexed {count} examples in {time.perf_counter() - start:.2f}s")
+        print(f"💾 Saved to: {args.index} ({size:.1f} MB)\n")
+
+    index = AnnIndex.load(args.index)
+
+    if args.query:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            examples = [example_fields(json.loads(line)) for line in f]
+        for i, (example_id, score) in enumerate(index.search(args.query, args.k, args.nprobe), 1):
+            user_input, response = examples[example_id - 1]
+            print(f"{i}. [{score:.4f}] {user_input}")
+            print(f"   {response[:160]}")
+
+    if args.benchmark:
+        benchmark(index, args.input, args.benchmark, args.k)
+
+
+if __name__ == "__main__":
+    main()
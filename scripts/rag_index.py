@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Offline BM25 retrieval index over the pastoral RAG examples
+
+Builds a prebuilt SQLite file with the examples and an external-content
+FTS5 table over their inputs and responses, and exposes a small query API
+for top-k context retrieval for a chat message:
+
+    index = RagIndex("../assets/training_data/rag_index.db")
+    index.search("I can't stop worrying about money", k=5)
+    # [{'id': ..., 'input': ..., 'response': ..., 'score': ...}, ...]
+
+Ranking is FTS5's built-in bm25() with inputs weighted above responses.
+Query words are OR-ed after dropping stopwords, so a chat message needs no
+special syntax. Words found in more than MAX_DF_FRACTION of the examples
+are dropped too: they add little to BM25 but make FTS5 score most of the
+corpus, and dropping them keeps lookups in the low milliseconds. Document
+frequencies are copied from the FTS5 vocabulary at build time and query
+words are stemmed by the same porter tokenizer, so 'worrying' is looked
+up as the 'worri' that FTS5 indexed.
+
+Usage:
+    python3 rag_index.py [--input JSONL] [--db PATH] [--rebuild]
+                         [--query TEXT [-k 5]] [--benchmark [N]]
+"""
+
+import argparse
+import json
+import random
+import re
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).parent.parent
+DEFAULT_INPUT = BASE_DIR / "assets/training_data/training_19750_final.jsonl"
+DEFAULT_DB = BASE_DIR / "assets/training_data/rag_index.db"
+
+BATCH_SIZE = 5000
+BUILD_PRAGMAS = (
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA cache_size = -65536",  # 64 MB
+    "PRAGMA temp_store = MEMORY",
+)
+
+FTS_TOKENIZER = 'porter unicode61'
+
+# bm25() column weights: (input, response)
+INPUT_WEIGHT = 2.0
+RESPONSE_WEIGHT = 1.0
+
+MAX_DF_FRACTION = 0.05
+MAX_QUERY_TERMS = 8
+
+QUERY_TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset('''
+    a an and are as at be but by can could did do does for from had has have he her him his how
+    i if in into is it its just me my no not of on or our she so than that the their them then
+    there they this to too us was we were what when where which who why will with would you your
+    im dont cant ive am been being all any some very
+'''.split())
+
+
+def example_fields(example):
+    """(input, response) of a chat-format or flat example"""
+    if 'messages' in example:
+        return example['messages'][1]['content'], example['messages'][2]['content']
+    return example['input'], example['response']
+
+
+def build_rag_index(input_path, db_path):
+    """Build the examples table and its FTS5 index; returns the example count"""
+    db_path = Path(db_path)
+    if db_path.exists():
+        db_path.unlink()
+
+    conn = sqlite3.connect(db_path)
+    for pragma in BUILD_PRAGMAS:
+        conn.execute(pragma)
+
+    conn.executescript(f'''
+        CREATE TABLE examples (
+            id INTEGER PRIMARY KEY,
+            input TEXT NOT NULL,
+            response TEXT NOT NULL
+        );
+        CREATE VIRTUAL TABLE examples_fts USING fts5(
+            input, response,
+            content='examples', content_rowid='id',
+            tokenize='{FTS_TOKENIZER}'
+        );
+        CREATE TABLE query_terms (
+            term TEXT PRIMARY KEY,
+            doc_count INTEGER NOT NULL
+        ) WITHOUT ROWID;
+    ''')
+    conn.execute(f"INSERT INTO examples_fts(examples_fts, rank) "
+                 f"VALUES ('rank', 'bm25({INPUT_WEIGHT}, {RESPONSE_WEIGHT})')")
+
+    count = 0
+    with open(input_path, 'r', encoding='utf-8') as f:
+        batch = []
+        for line in f:
+            fields = example_fields(json.loads(line))
+            batch.append(fields)
+            if len(batch) == BATCH_SIZE:
+                conn.executemany('INSERT INTO examples (input, response) VALUES (?, ?)', batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            conn.executemany('INSERT INTO examples (input, response) VALUES (?, ?)', batch)
+            count += len(batch)
+
+    # Index once after the load, then merge the FTS b-trees into one segment
+    conn.execute("INSERT INTO examples_fts(examples_fts) VALUES ('rebuild')")
+    conn.execute("INSERT INTO examples_fts(examples_fts) VALUES ('optimize')")
+
+    # Per-term document counts, over the stemmed terms FTS5 actually indexed
+    conn.execute("CREATE VIRTUAL TABLE temp.examples_vocab USING fts5vocab(main, examples_fts, 'row')")
+    conn.execute('INSERT INTO query_terms (term, doc_count) SELECT term, doc FROM temp.examples_vocab')
+    conn.execute('DROP TABLE temp.examples_vocab')
+    conn.commit()
+    conn.execute("VACUUM")
+    conn.close()
+    return count
+
+
+def query_tokens(text):
+    """Lowercase query words, without stopwords and single letters"""
+    return [t for t in QUERY_TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+
+class RagIndex:
+    """Read-only top-k retrieval over a prebuilt rag_index.db"""
+
+    def __init__(self, db_path=DEFAULT_DB):
+        self.conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, check_same_thread=False)
+        self.conn.execute("PRAGMA cache_size = -16384")  # 16 MB
+        self.doc_counts = dict(self.conn.execute('SELECT term, doc_count FROM query_terms'))
+        total = self.conn.execute('SELECT COUNT(*) FROM examples').fetchone()[0]
+        self.max_doc_count = max(1, int(total * MAX_DF_FRACTION))
+
+        # Scratch FTS5 table (temp schema, so the index stays read-only) whose
+        # vocabulary gives the indexed form of each query word
+        self.conn.execute(f"CREATE VIRTUAL TABLE temp.query_stems USING fts5(words, tokenize='{FTS_TOKENIZER}')")
+        self.conn.execute("CREATE VIRTUAL TABLE temp.query_stems_vocab USING fts5vocab(temp, query_stems, 'instance')")
+        self.stems = {}
+
+    def stem_words(self, words):
+        """word -> term as the FTS5 tokenizer indexes it (memoized)"""
+        new = [word for word in dict.fromkeys(words) if word not in self.stems]
+        if new:
+            # Query words are plain [a-z0-9]+ runs, so token offsets line up with new
+            self.conn.execute('INSERT INTO temp.query_stems (rowid, words) VALUES (1, ?)', (' '.join(new),))
+            for term, offset in self.conn.execute('SELECT term, offset FROM temp.query_stems_vocab'):
+                self.stems[new[offset]] = term
+            self.conn.execute('DELETE FROM temp.query_stems')
+        return {word: self.stems.get(word, word) for word in words}
+
+    def match_expression(self, message):
+        """
+        FTS5 MATCH expression for a free-text chat message, or None
+        Keeps the rarest MAX_QUERY_TERMS words under the document-frequency
+        cutoff, or the single rarest word if every word is common
+        """
+        stems = self.stem_words(query_tokens(message))
+        doc_count = {word: self.doc_counts.get(stem, 0) for word, stem in stems.items()}
+        terms = sorted((word for word in stems if doc_count[word] > 0), key=doc_count.get)
+        if not terms:
+            return None
+        selective = [t for t in terms if doc_count[t] <= self.max_doc_count]
+        return ' OR '.join(f'"{term}"' for term in (selective or terms[:1])[:MAX_QUERY_TERMS])
+
+    def search(self, message, k=5):
+        """Top-k examples for a message, best first"""
+        expression = self.match_expression(message)
+        if expression is None:
+            return []
+
+        # Rank inside FTS5 first, then fetch only the k winning rows
+        rows = self.conn.execute('''
+            SELECT e.id, e.input, e.response, hits.rank
+            FROM (
+                SELECT rowid, rank FROM examples_fts
+                WHERE examples_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            ) hits
+            JOIN examples e ON e.id = hits.rowid
+            ORDER BY hits.rank
+        ''', (expression, k)).fetchall()
+
+        return [
+            {'id': row_id, 'input': user_input, 'response': response, 'score': round(-rank, 4)}
+            for row_id, user_input, response, rank in rows
+        ]
+
+    def close(self):
+        self.conn.close()
+
+
+def benchmark(index, input_path, queries=1000, k=5, seed=0):
+    """Replay example inputs as chat messages and report latency percentiles"""
+    with open(input_path, 'r', encoding='utf-8') as f:
+        messages = [example_fields(json.loads(line))[0] for line in f]
+    rng = random.Random(seed)
+    replay = [rng.choice(messages) for _ in range(queries)]
+
+    # Warm the page cache so the numbers reflect steady-state lookups
+    for message in replay[:50]:
+        index.search(message, k)
+
+    latencies = []
+    for message in replay:
+        start = time.perf_counter()
+        index.search(message, k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2]
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"⏱️  {queries} queries, top-{k}: p50 {p50:.2f}ms, p99 {p99:.2f}ms, "
+          f"mean {statistics.mean(latencies):.2f}ms, max {latencies[-1]:.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query the pastoral RAG BM25 index")
+    parser.add_argument('--input', type=Path, default=DEFAULT_INPUT)
+    parser.add_argument('--db', type=Path, default=DEFAULT_DB)
+    parser.add_argument('--rebuild', action='store_true', help="Rebuild even if the index exists")
+    parser.add_argument('--query', help="Print the top-k examples for a message")
+    parser.add_argument('-k', type=int, default=5)
+    parser.add_argument('--benchmark', type=int, nargs='?', const=1000, metavar='N',
+                        help="Replay N example inputs and report p50/p99 latency")
+    args = parser.parse_args()
+
+    if args.rebuild or not args.db.exists():
+        print(f"📚 Building RAG index from {args.input}...")
+        start = time.perf_counter()
+        count = build_rag_index(args.input, args.db)
+        size = args.db.stat().st_size / (1024 * 1024)
+        print(f"✅ Indexed {count} examples in {time.perf_counter() - start:.2f}s")
+        print(f"💾 Saved to: {args.db} ({size:.1f} MB)\n")
+
+    index = RagIndex(args.db)
+
+    if args.query:
+        for i, hit in enumerate(index.search(args.query, args.k), 1):
+            print(f"{i}. [{hit['score']}] {hit['input']}")
+            print(f"   {hit['response'][:160]}")
+
+    if args.benchmark:
+        benchmark(index, args.input, args.benchmark, args.k)
+
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@ Update sample_verses.json to use WEB translation from bible.db
 
 import sqlite3
 import json
-import re
+
+from verse_cleaner import clean_verse_text
 
 # Sample verses to update
 verses_to_fetch = [
@@ -42,30 +43,9 @@ for book, chapter, verse_num in verses_to_fetch:
     if result:
         book_name, chap, v_num, text = result
 
-        # Clean up text - remove ALL USFM markup
-        cleaned_text = text
-
-        # Step 1: Remove word markers using string replacement (simpler than regex)
-        cleaned_text = cleaned_text.replace(r'\+w ', '')
-        cleaned_text = cleaned_text.replace(r'\+w*', '')
-
-        # Step 2: Remove Strong's numbers: word|strong="H1234" -> word
-        cleaned_text = re.sub(r'\|strong="[^"]+"', '', cleaned_text)
-
-        # Step 3: Remove footnotes: + 1:9 The Hebrew word rendered "God" is "\+wh אֱלֹהִ֑ים\+wh*" (Elohim).
-        cleaned_text = re.sub(r'\s*\+\s+\d+:\d+[^.]*\.', '', cleaned_text)
-
-        # Step 4: Remove Hebrew/Greek text with markers: \+wh אֱלֹהִ֑ים\+wh*
-        cleaned_text = re.sub(r'\\+wh\s+[^\s]+\s*\\+wh\*', '', cleaned_text)
-
-        # Step 5: Remove any remaining USFM backslash markers
-        cleaned_text = re.sub(r'\\+[a-z]+\*?', '', cleaned_text)
-
-        # Step 6: Normalize whitespace
-        cleaned_text = ' '.join(cleaned_text.split())
-
-        # Step 7: Remove extra quotes at start/end
-        cleaned_text = cleaned_text.strip('"')
+        # Clean up text - remove ALL USFM markup (shared cleaner),
+        # then drop extra quotes at start/end
+        cleaned_text = clean_verse_text(text).strip('"')
 
         print(f"✅ {book_name} {chap}:{v_num}")
         web_verses.append({
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Shared verse-markup cleaner for WEB Bible text
+Strips USFM word markers, Strong's numbers, footnotes and Hebrew/Greek
+word markers in a single linear pass over each verse
+
+Used by create_web_bible_db.py, clean_bible_verses.py and
+update_sample_verses_to_web.py so every script produces the same clean_text.
+
+Accepts both raw USFM verse text (footnotes delimited by \\f ... \\f*)
+and the flattened form stored in verses.text, where the footnote
+delimiters are already gone and a footnote is taken to run from
+"+ N:NN" to the end of its first sentence.
+
+Examples:
+Input: '\\+w For|strong="G1063"\\+w* God'
+Output: 'For God'
+"""
+
+import re
+
+# One alternation, scanned once per verse. The lookahead lets the scanner
+# skip plain text without trying every branch; whitespace is collapsed
+# afterwards by str.split(), which is cheaper than a callback per match.
+_MARKUP_RE = re.compile(r'''
+    (?=[\\|+*])(?:
+        \\f\s.*?\\f\*                               # raw footnote: \f + \fr 1:1 \ft ...\f*
+      | \\x\s.*?\\x\*                               # raw cross reference: \x - \xo ...\x*
+      | \\\+?wh\s[^\\]*\\\+?wh\*                    # Hebrew/Greek word: \+wh אֱלֹהִ֑ים\+wh*
+      | \+\s*\d+:\d+\s                              # flattened footnote: + 1:1 text.
+        (?:\\\+?wh\s[^\\]*\\\+?wh\*|[^.+])*\.?
+      | \|(?:\s*[a-z-]+="[^"]*")+                   # attributes: |strong="H1234"
+      | \\\+?[a-z]+\d*\*?                           # any other marker: \w, \+w*, \wj ...
+      | \+w\*?                                      # marker whose backslash was stripped
+      | [*+]                                        # stray asterisks and pluses
+    )
+''', re.VERBOSE)
+
+
+def clean_verse_text(text):
+    """
+    Remove Strong's numbers, footnotes, and markup from verse text
+    """
+    if not text:
+        return ''
+    return ' '.join(_MARKUP_RE.sub('', text).split())
+
+
+def clean_verse_texts(texts):
+    """Batch API: clean a list of verse texts"""
+    sub = _MARKUP_RE.sub
+    return [' '.join(sub('', text).split()) if text else '' for text in texts]